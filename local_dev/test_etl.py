@@ -4,30 +4,52 @@ This script sets up a local environment, generates sample data,
 runs the ETL scripts locally, and validates the results.
 """
 import argparse
-import json
 import os
 import shutil
 import subprocess
 import sys
 import tempfile
-from datetime import datetime
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import boto3
+import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
-from moto import mock_s3
 
-# Add the parent directory to the path to import the utility modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import config  # noqa: E402
-from logging import get_logger  # noqa: E402
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Keep mock S3 objects up to 64 MB in memory; moto's 16 MB default spools larger
+# test payloads to disk. Set the variable beforehand to tune it per machine.
+os.environ.setdefault("MOTO_S3_DEFAULT_KEY_BUFFER_SIZE", str(64 * 1024 * 1024))
+
+from moto import mock_s3  # noqa: E402
+
+from src.config.config import bootstrap, config  # noqa: E402
+from src.logging import get_logger  # noqa: E402
+
+# Load .env before the module-level config lookups below
+bootstrap()
 
 # Create a logger for this script
 logger = get_logger(__name__)
 
+# Local Spark session shared across pipeline runs (see get_spark_session)
+_spark_session = None
+
+# Bucket names are fixed for the run, so look them up once
+_BRONZE_BUCKET = config.get("s3.bronze.bucket")
+_SILVER_BUCKET = config.get("s3.silver.bucket")
+_TEMP_BUCKET = config.get("s3.temp.bucket")
+
+# S3 client shared across validations (see get_s3_client)
+_s3_client = None
+
 
 def parse_args() -> Dict[str, str]:
     """
@@ -54,6 +76,12 @@ def parse_args() -> Dict[str, str]:
         default="local_dev/output",
         help="Directory to store the output data",
     )
+    parser.add_argument(
+        "--file-format",
+        default="parquet",
+        choices=["arrow", "csv", "json", "parquet"],
+        help="Format of the sample data (arrow is only supported by bronze-python)",
+    )
     
     args = parser.parse_args()
     
@@ -61,6 +89,7 @@ def parse_args() -> Dict[str, str]:
         "pipeline": args.pipeline,
         "data_size": args.data_size,
         "output_dir": args.output_dir,
+        "file_format": args.file_format,
     }
 
 
@@ -74,17 +103,20 @@ def generate_sample_data(size: int = 1000) -> pd.DataFrame:
     Returns:
         DataFrame with sample data
     """
-    # Generate sample data
-    data = {
-        "id": range(1, size + 1),
-        "name": [f"Name {i}" for i in range(1, size + 1)],
-        "value": [i * 10 for i in range(1, size + 1)],
-        "date": [datetime.now().date() for _ in range(size)],
-        "timestamp": [datetime.now() for _ in range(size)],
-    }
+    # Generate sample data with vectorized constructors
+    ids = np.arange(1, size + 1, dtype=np.int64)
+    now = pd.Timestamp.now()
     
     # Create a DataFrame
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "name": np.char.add("Name ", ids.astype(str)),
+            "value": ids * 10,
+            "date": np.full(size, now.date(), dtype=object),
+            "timestamp": np.full(size, now.to_datetime64()),
+        }
+    )
     
     return df
 
@@ -109,6 +141,40 @@ def setup_local_environment(output_dir: str) -> None:
     )
 
 
+def get_mock_s3_backend():
+    """
+    Get moto's in-memory S3 backend for the default mock account.
+    
+    Going through the backend directly skips the boto3 request signing and
+    moto's HTTP request/response marshaling.
+    
+    Returns:
+        moto S3 backend
+    """
+    from moto.core import DEFAULT_ACCOUNT_ID
+    from moto.s3.models import s3_backends
+    
+    return s3_backends[DEFAULT_ACCOUNT_ID]["global"]
+
+
+def get_s3_client():
+    """
+    Get the S3 client shared by all validations.
+    
+    The client is created on first use, inside the mock S3 scope, and reused
+    afterwards to avoid reloading the service model on every call.
+    
+    Returns:
+        boto3 S3 client
+    """
+    global _s3_client
+    
+    if _s3_client is None:
+        _s3_client = boto3.client("s3", region_name="us-east-1")
+    
+    return _s3_client
+
+
 def setup_mock_s3() -> None:
     """
     Set up mock S3 for local testing.
@@ -117,32 +183,40 @@ def setup_mock_s3() -> None:
         Mock S3 context
     """
     # Create the mock S3 buckets
-    s3 = boto3.client("s3", region_name="us-east-1")
-    
-    # Create the bronze bucket
-    bronze_bucket = config.get("s3.bronze.bucket")
-    s3.create_bucket(Bucket=bronze_bucket)
+    backend = get_mock_s3_backend()
     
-    # Create the silver bucket
-    silver_bucket = config.get("s3.silver.bucket")
-    s3.create_bucket(Bucket=silver_bucket)
-    
-    # Create the temp bucket
-    temp_bucket = config.get("s3.temp.bucket")
-    s3.create_bucket(Bucket=temp_bucket)
+    # Create the bronze, silver, and temp buckets unless a previous call already did
+    for bucket in (_BRONZE_BUCKET, _SILVER_BUCKET, _TEMP_BUCKET):
+        if bucket not in backend.buckets:
+            backend.create_bucket(bucket, "us-east-1")
     
     logger.info(
         "Mock S3 buckets created",
-        bronze_bucket=bronze_bucket,
-        silver_bucket=silver_bucket,
-        temp_bucket=temp_bucket,
+        bronze_bucket=_BRONZE_BUCKET,
+        silver_bucket=_SILVER_BUCKET,
+        temp_bucket=_TEMP_BUCKET,
     )
 
 
+def _json_default(value):
+    """
+    Serialize values orjson does not handle natively.
+    
+    Args:
+        value: Value to serialize
+        
+    Returns:
+        ISO 8601 string for date-like values
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
 def write_sample_data(
     df: pd.DataFrame,
     output_dir: str,
-    file_format: str = "csv",
+    file_format: str = "parquet",
 ) -> str:
     """
     Write sample data to a file.
@@ -167,9 +241,26 @@ def write_sample_data(
     if file_format == "csv":
         df.to_csv(file_path, index=False)
     elif file_format == "json":
-        df.to_json(file_path, orient="records")
+        if orjson is not None:
+            # orjson encodes the records in C, much faster than pandas' writer
+            with open(file_path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        df.to_dict(orient="records"),
+                        default=_json_default,
+                        option=orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                )
+        else:
+            df.to_json(file_path, orient="records")
     elif file_format == "parquet":
-        df.to_parquet(file_path, index=False)
+        df.to_parquet(file_path, engine="pyarrow", compression="zstd", index=False)
+    elif file_format == "arrow":
+        # Arrow IPC file, which the reader can memory-map without a copy
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(file_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
     else:
         raise ValueError(f"Unsupported file format: {file_format}")
     
@@ -186,7 +277,7 @@ def write_sample_data(
 def run_bronze_python_pipeline(
     sample_data_path: str,
     output_dir: str,
-    file_format: str = "csv",
+    file_format: str = "parquet",
 ) -> None:
     """
     Run the Bronze layer Python pipeline.
@@ -196,21 +287,19 @@ def run_bronze_python_pipeline(
         output_dir: Directory to store the output data
         file_format: Format of the sample data
     """
-    # Set up the command
-    script_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        "src/bronze/python_ingest.py",
-    )
-    
-    target_key = f"bronze/test_data.{file_format}"
+    # Arrow IPC is only an input format; the Bronze output is written as Parquet
+    output_format = "parquet" if file_format == "arrow" else file_format
+    target_key = f"bronze/test_data.{output_format}"
     
+    # Run the ingest as a module of the installed package, so it resolves its
+    # imports without any sys.path changes
     command = [
-        "python",
-        script_path,
+        sys.executable,
+        "-m", "src.bronze.python_ingest",
         "--source-type", file_format,
         "--source-path", sample_data_path,
         "--target-key", target_key,
-        "--file-format", file_format,
+        "--file-format", output_format,
     ]
     
     # Run the command
@@ -219,45 +308,92 @@ def run_bronze_python_pipeline(
         command=" ".join(command),
     )
     
-    result = subprocess.run(command, capture_output=True, text=True)
+    # Stream the pipeline output as it is produced instead of buffering it all,
+    # keeping only the last few lines for the error message
+    output_tail = deque(maxlen=20)
+    
+    with subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        for line in proc.stdout:
+            line = line.rstrip()
+            output_tail.append(line)
+            logger.info("Bronze layer Python pipeline output", line=line)
+        
+        returncode = proc.wait()
     
-    if result.returncode != 0:
+    if returncode != 0:
+        output = "\n".join(output_tail)
         logger.error(
             "Bronze layer Python pipeline failed",
-            returncode=result.returncode,
-            stdout=result.stdout,
-            stderr=result.stderr,
+            returncode=returncode,
+            output=output,
         )
-        raise RuntimeError(f"Bronze layer Python pipeline failed: {result.stderr}")
+        raise RuntimeError(f"Bronze layer Python pipeline failed: {output}")
     
     logger.info(
         "Bronze layer Python pipeline completed successfully",
-        stdout=result.stdout,
     )
 
 
+def get_spark_session():
+    """
+    Get the local Spark session shared by all Spark pipeline runs.
+    
+    The session is created on first use and reused afterwards, so the JVM
+    start-up cost is paid once per test run instead of once per pipeline.
+    
+    Returns:
+        Local SparkSession
+    """
+    global _spark_session
+    
+    if _spark_session is None:
+        from pyspark.sql import SparkSession
+        
+        from src.bronze.spark_ingest import LOCAL_SPARK_CONF
+        
+        builder = SparkSession.builder.master("local[*]").appName("test-etl")
+        for key, value in LOCAL_SPARK_CONF.items():
+            builder = builder.config(key, value)
+        
+        # Use Arrow for pandas <-> Spark conversions instead of row-by-row pickling
+        builder = (
+            builder.config("spark.sql.execution.arrow.pyspark.enabled", "true")
+            .config("spark.sql.execution.arrow.pyspark.fallback.enabled", "true")
+            .config("spark.sql.execution.arrow.maxRecordsPerBatch", "10000")
+        )
+        
+        _spark_session = builder.getOrCreate()
+    
+    return _spark_session
+
+
 def run_bronze_spark_pipeline(
     sample_data_path: str,
     output_dir: str,
-    file_format: str = "csv",
-) -> None:
+    file_format: str = "parquet",
+):
     """
-    Run the Bronze layer Spark pipeline.
+    Run the Bronze layer Spark pipeline in-process.
     
     Args:
         sample_data_path: Path to the sample data file
         output_dir: Directory to store the output data
         file_format: Format of the sample data
+        
+    Returns:
+        The Bronze layer Spark DataFrame that was written
     """
-    # Set up the command
-    script_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        "src/bronze/spark_ingest.py",
-    )
+    from src.bronze import spark_ingest
     
     target_path = os.path.join(output_dir, "bronze")
     
-    # Create a temporary file with job arguments
+    # Job arguments, logged for reference; the pipeline is called directly
     job_args = {
         "JOB_NAME": "test-bronze-spark",
         "source_type": file_format,
@@ -267,74 +403,57 @@ def run_bronze_spark_pipeline(
         "partition_cols": "",
     }
     
-    job_args_path = os.path.join(output_dir, "job_args.json")
-    with open(job_args_path, "w") as f:
-        json.dump(job_args, f)
-    
-    # Set up the Spark submit command
-    command = [
-        "spark-submit",
-        "--master", "local[*]",
-        "--deploy-mode", "client",
-        script_path,
-        "--JOB_NAME", "test-bronze-spark",
-        "--source_type", file_format,
-        "--source_path", sample_data_path,
-        "--target_path", target_path,
-        "--file_format", file_format,
-    ]
-    
-    # Run the command
+    # Run the pipeline
     logger.info(
         "Running Bronze layer Spark pipeline",
-        command=" ".join(command),
+        job_args=job_args,
     )
     
     try:
-        result = subprocess.run(command, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            logger.error(
-                "Bronze layer Spark pipeline failed",
-                returncode=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
-            )
-            raise RuntimeError(f"Bronze layer Spark pipeline failed: {result.stderr}")
-        
-        logger.info(
-            "Bronze layer Spark pipeline completed successfully",
-            stdout=result.stdout,
+        bronze_df = spark_ingest.run(
+            get_spark_session(),
+            source_type=file_format,
+            source_path=sample_data_path,
+            target_path=target_path,
+            file_format=file_format,
         )
-    except FileNotFoundError:
+    except Exception as e:
         logger.error(
-            "Spark submit command not found. Make sure Spark is installed and in your PATH.",
+            "Bronze layer Spark pipeline failed",
+            error=str(e),
+            error_type=type(e).__name__,
         )
         raise
+    
+    logger.info(
+        "Bronze layer Spark pipeline completed successfully",
+    )
+    
+    return bronze_df
 
 
 def run_silver_spark_pipeline(
     bronze_data_path: str,
     output_dir: str,
     file_format: str = "parquet",
+    bronze_df=None,
 ) -> None:
     """
-    Run the Silver layer Spark pipeline.
+    Run the Silver layer Spark pipeline in-process.
     
     Args:
         bronze_data_path: Path to the Bronze layer data
         output_dir: Directory to store the output data
         file_format: Format of the Bronze layer data
+        bronze_df: Bronze layer Spark DataFrame to process instead of reading
+            bronze_data_path
     """
-    # Set up the command
-    script_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        "src/silver/spark_process.py",
-    )
+    from src.silver import spark_process
     
-    target_path = os.path.join(output_dir, "silver")
+    table_path = os.path.join(output_dir, "silver", "test_table")
+    invalid_path = os.path.join(output_dir, "invalid", "test_table")
     
-    # Create a temporary file with job arguments
+    # Job arguments, logged for reference; the pipeline is called directly
     job_args = {
         "JOB_NAME": "test-silver-spark",
         "source_path": bronze_data_path,
@@ -344,50 +463,34 @@ def run_silver_spark_pipeline(
         "apply_quality_checks": "true",
     }
     
-    job_args_path = os.path.join(output_dir, "job_args.json")
-    with open(job_args_path, "w") as f:
-        json.dump(job_args, f)
-    
-    # Set up the Spark submit command
-    command = [
-        "spark-submit",
-        "--master", "local[*]",
-        "--deploy-mode", "client",
-        script_path,
-        "--JOB_NAME", "test-silver-spark",
-        "--source_path", bronze_data_path,
-        "--source_format", file_format,
-        "--table_name", "test_table",
-        "--apply_quality_checks", "true",
-    ]
-    
-    # Run the command
+    # Run the pipeline
     logger.info(
         "Running Silver layer Spark pipeline",
-        command=" ".join(command),
+        job_args=job_args,
     )
     
     try:
-        result = subprocess.run(command, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            logger.error(
-                "Silver layer Spark pipeline failed",
-                returncode=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
-            )
-            raise RuntimeError(f"Silver layer Spark pipeline failed: {result.stderr}")
-        
-        logger.info(
-            "Silver layer Spark pipeline completed successfully",
-            stdout=result.stdout,
+        spark_process.run(
+            get_spark_session(),
+            source_path=bronze_data_path,
+            source_format=file_format,
+            table_name="test_table",
+            apply_quality_checks=True,
+            table_path=table_path,
+            invalid_path=invalid_path,
+            input_df=bronze_df,
         )
-    except FileNotFoundError:
+    except Exception as e:
         logger.error(
-            "Spark submit command not found. Make sure Spark is installed and in your PATH.",
+            "Silver layer Spark pipeline failed",
+            error=str(e),
+            error_type=type(e).__name__,
         )
         raise
+    
+    logger.info(
+        "Silver layer Spark pipeline completed successfully",
+    )
 
 
 def validate_results(output_dir: str, pipeline: str) -> None:
@@ -400,24 +503,25 @@ def validate_results(output_dir: str, pipeline: str) -> None:
     """
     if pipeline == "bronze-python":
         # Check if the output file exists in the mock S3 bucket
-        bronze_bucket = config.get("s3.bronze.bucket")
-        s3 = boto3.client("s3", region_name="us-east-1")
+        s3 = get_s3_client()
         
         try:
+            # Only existence matters, so stop the listing at the first key
             response = s3.list_objects_v2(
-                Bucket=bronze_bucket,
+                Bucket=_BRONZE_BUCKET,
                 Prefix="bronze/",
+                MaxKeys=1,
             )
             
-            if "Contents" in response:
+            if response.get("KeyCount", 0) > 0:
                 logger.info(
                     "Bronze layer Python pipeline results validated",
-                    files=[obj["Key"] for obj in response["Contents"]],
+                    first_file=response["Contents"][0]["Key"],
                 )
             else:
                 logger.warning(
                     "No files found in the Bronze layer bucket",
-                    bucket=bronze_bucket,
+                    bucket=_BRONZE_BUCKET,
                     prefix="bronze/",
                 )
         except Exception as e:
@@ -465,61 +569,68 @@ def main():
     pipeline = args["pipeline"]
     data_size = args["data_size"]
     output_dir = args["output_dir"]
+    file_format = args["file_format"]
     
     logger.info(
         "Starting ETL pipeline test",
         pipeline=pipeline,
         data_size=data_size,
         output_dir=output_dir,
+        file_format=file_format,
     )
     
-    try:
-        # Set up the local environment
-        setup_local_environment(output_dir)
-        
-        # Generate sample data
-        df = generate_sample_data(data_size)
-        
-        # Determine the file format based on the pipeline
-        file_format = "csv" if pipeline.startswith("bronze") else "parquet"
-        
-        # Write sample data to a file
-        sample_data_path = write_sample_data(df, output_dir, file_format)
-        
-        # Run the appropriate pipeline
-        if pipeline == "bronze-python":
-            # Use mock S3 for the Python pipeline
-            with mock_s3():
-                setup_mock_s3()
+    if file_format == "arrow" and pipeline != "bronze-python":
+        raise ValueError(f"Arrow sample data is not supported by the {pipeline} pipeline")
+    
+    # Use one mock S3 session for the whole run so backend state is reused
+    with mock_s3():
+        try:
+            # Set up the local environment
+            setup_local_environment(output_dir)
+            setup_mock_s3()
+            
+            # Generate sample data
+            df = generate_sample_data(data_size)
+            
+            # Write sample data to a file
+            sample_data_path = write_sample_data(df, output_dir, file_format)
+            
+            # Run the appropriate pipeline
+            if pipeline == "bronze-python":
                 run_bronze_python_pipeline(sample_data_path, output_dir, file_format)
                 validate_results(output_dir, pipeline)
-        
-        elif pipeline == "bronze-spark":
-            run_bronze_spark_pipeline(sample_data_path, output_dir, file_format)
-            validate_results(output_dir, pipeline)
-        
-        elif pipeline == "silver-spark":
-            # First run the Bronze layer Spark pipeline to generate input for the Silver layer
-            bronze_output_dir = os.path.join(output_dir, "bronze")
-            run_bronze_spark_pipeline(sample_data_path, output_dir, "csv")
             
-            # Then run the Silver layer Spark pipeline
-            run_silver_spark_pipeline(bronze_output_dir, output_dir, "parquet")
-            validate_results(output_dir, pipeline)
+            elif pipeline == "bronze-spark":
+                run_bronze_spark_pipeline(sample_data_path, output_dir, file_format)
+                validate_results(output_dir, pipeline)
+            
+            elif pipeline == "silver-spark":
+                # First run the Bronze layer Spark pipeline to generate input for the Silver layer
+                bronze_output_dir = os.path.join(output_dir, "bronze")
+                bronze_df = run_bronze_spark_pipeline(sample_data_path, output_dir, file_format)
+                
+                # Then hand the Bronze DataFrame straight to the Silver layer Spark pipeline
+                run_silver_spark_pipeline(
+                    bronze_output_dir,
+                    output_dir,
+                    "parquet",
+                    bronze_df=bronze_df,
+                )
+                validate_results(output_dir, pipeline)
+            
+            logger.info(
+                "ETL pipeline test completed successfully",
+                pipeline=pipeline,
+            )
         
-        logger.info(
-            "ETL pipeline test completed successfully",
-            pipeline=pipeline,
-        )
-    
-    except Exception as e:
-        logger.error(
-            "Error in ETL pipeline test",
-            pipeline=pipeline,
-            error=str(e),
-            error_type=type(e).__name__,
-        )
-        raise
+        except Exception as e:
+            logger.error(
+                "Error in ETL pipeline test",
+                pipeline=pipeline,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            raise
 
 
 if __name__ == "__main__":
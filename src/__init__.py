@@ -0,0 +1,4 @@
+"""
+AWS Data Lake Framework.
+Medallion architecture ETL pipelines for AWS Glue.
+"""
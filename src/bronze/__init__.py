@@ -0,0 +1,4 @@
+"""
+Bronze layer module for the AWS Data Lake Framework.
+Provides the ETL scripts that ingest raw data into the Bronze layer.
+"""
@@ -5,24 +5,24 @@ and writes the data to the Bronze layer in S3.
 """
 import argparse
 import json
-import os
-import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import boto3
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-# Add the parent directory to the path to import the utility modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import config  # noqa: E402
-from logging import get_logger  # noqa: E402
-from utils.s3_utils import (  # noqa: E402
+from src.config.config import bootstrap, config
+from src.logging import get_logger
+from src.utils.s3_utils import (
     get_bronze_bucket,
     get_bronze_prefix,
+    get_s3_filesystem,
     read_csv,
     read_json,
-    read_parquet,
+    read_object,
     write_csv,
     write_json,
     write_parquet,
@@ -31,6 +31,9 @@ from utils.s3_utils import (  # noqa: E402
 # Create a logger for this script
 logger = get_logger(__name__)
 
+# Data handled by the pipeline: Parquet sources stay in Arrow, others use pandas
+Data = Union[pd.DataFrame, pa.Table]
+
 
 def parse_args() -> Dict[str, str]:
     """
@@ -40,11 +43,12 @@ def parse_args() -> Dict[str, str]:
         Dictionary of arguments
     """
     parser = argparse.ArgumentParser(description="Ingest data into the Bronze layer")
-    parser.add_argument("--source-type", required=True, help="Type of source (csv, json, parquet)")
+    parser.add_argument("--source-type", required=True, help="Type of source (arrow, csv, json, parquet)")
     parser.add_argument("--source-path", required=True, help="Path to the source data")
     parser.add_argument("--target-key", required=True, help="Key for the target data in S3")
-    parser.add_argument("--file-format", required=True, help="Format to write the data in")
+    parser.add_argument("--file-format", default="parquet", help="Format to write the data in")
     parser.add_argument("--partition-cols", help="Columns to partition by (comma-separated)")
+    parser.add_argument("--columns", help="Source columns to read (comma-separated, default: all)")
     
     args = parser.parse_args()
     
@@ -54,24 +58,32 @@ def parse_args() -> Dict[str, str]:
         "target_key": args.target_key,
         "file_format": args.file_format,
         "partition_cols": args.partition_cols.split(",") if args.partition_cols else [],
+        "columns": args.columns.split(",") if args.columns else None,
     }
 
 
 def read_data(
     source_type: str,
     source_path: str,
+    columns: Optional[List[str]] = None,
     **kwargs: Dict[str, Any],
-) -> pd.DataFrame:
+) -> Data:
     """
     Read data from the source.
     
+    Parquet and Arrow IPC sources are read into a PyArrow Table so they can be
+    transformed and written back without a pandas round trip. For Parquet the
+    column projection is pushed down to the reader, so unused column chunks
+    are never loaded, locally or from S3.
+    
     Args:
-        source_type: Type of source (csv, json, parquet)
+        source_type: Type of source (arrow, csv, json, parquet)
         source_path: Path to the source data
+        columns: Columns to read (default: all columns)
         **kwargs: Additional options for reading the data
         
     Returns:
-        DataFrame with the source data
+        PyArrow Table (arrow, parquet) or DataFrame (csv, json) with the source data
     """
     if source_path.startswith("s3://"):
         # Extract bucket and key from S3 path
@@ -79,52 +91,137 @@ def read_data(
         bucket, key = s3_path.split("/", 1)
         
         if source_type == "csv":
-            return read_csv(key, bucket, **kwargs)
+            return read_csv(key, bucket, usecols=columns, **kwargs)
         elif source_type == "json":
-            return read_json(key, bucket, **kwargs)
+            return select_columns(read_json(key, bucket, **kwargs), columns)
         elif source_type == "parquet":
-            return read_parquet(key, bucket, **kwargs)
+            # Read through the S3 filesystem, so only the footer and the
+            # requested column chunks are fetched, with ranged GETs
+            return pq.read_table(
+                f"{bucket}/{key}", filesystem=get_s3_filesystem(), columns=columns, **kwargs
+            )
+        elif source_type == "arrow":
+            table = pa.ipc.open_file(pa.BufferReader(read_object(key, bucket))).read_all()
+            return select_columns(table, columns)
         else:
             raise ValueError(f"Unsupported source type for S3: {source_type}")
     else:
         # Local file
         if source_type == "csv":
-            return pd.read_csv(source_path, **kwargs)
+            return pd.read_csv(source_path, usecols=columns, **kwargs)
         elif source_type == "json":
-            return pd.read_json(source_path, **kwargs)
+            return select_columns(pd.read_json(source_path, **kwargs), columns)
         elif source_type == "parquet":
-            return pd.read_parquet(source_path, **kwargs)
+            return pq.read_table(source_path, columns=columns, **kwargs)
+        elif source_type == "arrow":
+            # Memory-map the Arrow IPC file so the Table references it without copying
+            table = pa.ipc.open_file(pa.memory_map(source_path, "r")).read_all()
+            return select_columns(table, columns)
         else:
             raise ValueError(f"Unsupported source type: {source_type}")
 
 
-def transform_data(df: pd.DataFrame) -> pd.DataFrame:
+def select_columns(df: Data, columns: Optional[List[str]] = None) -> Data:
+    """
+    Keep only the requested columns.
+    
+    Args:
+        df: DataFrame or PyArrow Table
+        columns: Columns to keep (default: all columns)
+        
+    Returns:
+        DataFrame or PyArrow Table with the requested columns
+    """
+    if columns is None:
+        return df
+    
+    if isinstance(df, pa.Table):
+        return df.select(columns)
+    
+    return df[columns]
+
+
+def constant_dictionary_array(value: Any, length: int) -> pa.DictionaryArray:
+    """
+    Build a dictionary-encoded array holding the same value in every slot.
+    
+    The value is stored once in the dictionary and every slot points at it,
+    so Parquet writes the column as a single dictionary entry per row group.
+    
+    Args:
+        value: Value to repeat
+        length: Number of slots in the array
+        
+    Returns:
+        Dictionary-encoded PyArrow array
+    """
+    indices = pa.repeat(pa.scalar(0, type=pa.int32()), length)
+    return pa.DictionaryArray.from_arrays(indices, pa.array([value]))
+
+
+def transform_data(df: Data) -> Data:
     """
     Apply transformations to the data.
     
     Args:
-        df: Input DataFrame
+        df: Input DataFrame or PyArrow Table
         
     Returns:
-        Transformed DataFrame
+        Transformed DataFrame or PyArrow Table
     """
-    # Add metadata columns
-    current_date = datetime.now().strftime("%Y-%m-%d")
-    current_time = datetime.now().strftime("%H-%M-%S")
+    # Add metadata columns, all derived from a single clock read so they agree
+    ingest_timestamp = datetime.now()
+    current_date = ingest_timestamp.strftime("%Y-%m-%d")
+    current_time = ingest_timestamp.strftime("%H-%M-%S")
     
-    df["bronze_ingest_timestamp"] = datetime.now()
-    df["bronze_ingest_date"] = current_date
-    df["bronze_ingest_time"] = current_time
+    if isinstance(df, pa.Table):
+        # Broadcast each scalar to the table length without going through pandas
+        num_rows = df.num_rows
+        df = df.append_column(
+            "bronze_ingest_timestamp",
+            pa.repeat(pa.scalar(ingest_timestamp, type=pa.timestamp("us")), num_rows),
+        )
+        df = df.append_column(
+            "bronze_ingest_date", constant_dictionary_array(current_date, num_rows)
+        )
+        df = df.append_column(
+            "bronze_ingest_time", constant_dictionary_array(current_time, num_rows)
+        )
+    else:
+        # Constant columns are stored as single-category categoricals, which
+        # pyarrow writes as dictionary-encoded Parquet columns
+        df["bronze_ingest_timestamp"] = ingest_timestamp
+        df["bronze_ingest_date"] = pd.Categorical.from_codes(
+            np.zeros(len(df), dtype=np.int8), categories=[current_date]
+        )
+        df["bronze_ingest_time"] = pd.Categorical.from_codes(
+            np.zeros(len(df), dtype=np.int8), categories=[current_time]
+        )
     
     # Add additional transformations here
     
     return df
 
 
+def get_column_names(df: Data) -> List[str]:
+    """
+    Get the column names of a DataFrame or PyArrow Table.
+    
+    Args:
+        df: DataFrame or PyArrow Table
+        
+    Returns:
+        List of column names
+    """
+    if isinstance(df, pa.Table):
+        return df.column_names
+    return list(df.columns)
+
+
 def write_data(
-    df: pd.DataFrame,
+    df: Data,
     target_key: str,
-    file_format: str,
+    file_format: str = "parquet",
     partition_cols: Optional[List[str]] = None,
     **kwargs: Dict[str, Any],
 ) -> None:
@@ -132,7 +229,7 @@ def write_data(
     Write data to the target in S3.
     
     Args:
-        df: DataFrame to write
+        df: DataFrame or PyArrow Table to write
         target_key: Key to write the data to in S3
         file_format: Format to write the data in
         partition_cols: Columns to partition by
@@ -140,11 +237,16 @@ def write_data(
     """
     bucket = get_bronze_bucket()
     
+    # Only the text formats need pandas; Parquet is written straight from Arrow
+    if isinstance(df, pa.Table) and file_format != "parquet":
+        df = df.to_pandas()
+    
     if file_format == "csv":
         write_csv(df, target_key, bucket, **kwargs)
     elif file_format == "json":
         write_json(df, target_key, bucket, **kwargs)
     elif file_format == "parquet":
+        kwargs.setdefault("compression", "snappy")
         write_parquet(df, target_key, bucket, **kwargs)
     else:
         raise ValueError(f"Unsupported file format: {file_format}")
@@ -152,6 +254,9 @@ def write_data(
 
 def main():
     """Main ETL function."""
+    # Load .env and the configuration
+    bootstrap()
+    
     # Parse command line arguments
     args = parse_args()
     
@@ -160,6 +265,7 @@ def main():
     target_key = args["target_key"]
     file_format = args["file_format"]
     partition_cols = args["partition_cols"]
+    columns = args["columns"]
     
     # Log job parameters
     logger.info(
@@ -169,17 +275,18 @@ def main():
         target_key=target_key,
         file_format=file_format,
         partition_cols=partition_cols,
+        columns=columns,
     )
     
     try:
         # Read data from source
-        df = read_data(source_type, source_path)
+        df = read_data(source_type, source_path, columns=columns)
         
         # Log data statistics
         logger.info(
             "Read data from source",
             rows=len(df),
-            columns=list(df.columns),
+            columns=get_column_names(df),
         )
         
         # Transform data
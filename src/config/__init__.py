@@ -0,0 +1,4 @@
+"""
+Configuration module for the AWS Data Lake Framework.
+Provides configuration loaded from YAML files and environment variables.
+"""
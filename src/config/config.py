@@ -2,21 +2,80 @@
 Configuration management for the AWS Data Lake Framework.
 Handles loading and validating configuration from YAML files and environment variables.
 """
+import hashlib
+import marshal
 import os
+import struct
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Use the LibYAML C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
 
 # Default paths
 CONFIG_DIR = Path(__file__).parent
 DEFAULT_CONFIG_PATH = CONFIG_DIR / "settings.yaml"
 ENV_CONFIG_PREFIX = "GLUE_ETL_"
 
+# Set to "1" to have every Config load the .env file (see bootstrap)
+DOTENV_FLAG = "GLUE_ETL_LOAD_DOTENV"
+
+# Directory for the parse cache (default: the per-user cache directory)
+CACHE_DIR_ENV = "GLUE_ETL_CONFIG_CACHE"
+
+# Parsed YAML is cached per user, as data-only marshal, behind a header holding
+# the source's mtime (ns) and size so edits invalidate the cache
+CACHE_SUFFIX = ".marshal"
+CACHE_HEADER = struct.Struct("<qq")
+
+# Config key paths of the prefixed environment variables, keyed by variable
+# name. Rebuilt only when the number of environment variables changes.
+_env_key_paths: Dict[str, str] = {}
+_env_size = -1
+
+
+@lru_cache(maxsize=512)
+def _split_key(key_path: str) -> Tuple[str, ...]:
+    """
+    Split a dot-separated key path, memoized for repeated lookups.
+
+    Args:
+        key_path: Dot-separated path (e.g., 'aws.region')
+
+    Returns:
+        Tuple of the path's keys
+    """
+    return tuple(key_path.split("."))
+
+
+def _get_env_key_paths() -> Dict[str, str]:
+    """
+    Get the config key paths for the prefixed environment variables.
+
+    Returns:
+        Mapping of environment variable name to dot-separated config key path
+    """
+    global _env_key_paths, _env_size
+    if len(os.environ) != _env_size:
+        # Convert GLUE_ETL_AWS_REGION to aws.region
+        _env_key_paths = {
+            key: key[len(ENV_CONFIG_PREFIX):].lower().replace("_", ".")
+            for key in os.environ
+            if key.startswith(ENV_CONFIG_PREFIX) and key not in (DOTENV_FLAG, CACHE_DIR_ENV)
+        }
+        _env_size = len(os.environ)
+    return _env_key_paths
+
 
 class Config:
     """Configuration manager for the AWS Data Lake Framework."""
@@ -30,27 +89,129 @@ class Config:
         """
         self.config_path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
         self.config: Dict[str, Any] = {}
+
+        # Entry points load .env through bootstrap(); this keeps the old behaviour on request
+        if os.environ.get(DOTENV_FLAG) == "1":
+            load_dotenv()
+
         self.load_config()
 
     def load_config(self) -> None:
         """Load configuration from the YAML file and override with environment variables."""
-        # Load from YAML file
-        if self.config_path.exists():
-            with open(self.config_path, "r") as f:
-                self.config = yaml.safe_load(f) or {}
-        else:
+        # Load from YAML file, or from its parse cache if the file is unchanged
+        try:
+            f = open(self.config_path, "rb")
+        except FileNotFoundError:
             self.config = {}
+        else:
+            with f:
+                # fstat the open file, so the cache key always matches what is read
+                stat = os.fstat(f.fileno())
+                header = CACHE_HEADER.pack(stat.st_mtime_ns, stat.st_size)
+                cached = self._read_cache(header)
+                if cached is not None:
+                    self.config = cached
+                else:
+                    # Hand LibYAML the raw bytes in one buffer rather than a decoded stream
+                    self.config = yaml.load(f.read(), Loader=_Loader) or {}
+                    self._write_cache(header)
 
         # Override with environment variables
         self._override_from_env()
 
+    @property
+    def cache_path(self) -> Path:
+        """
+        Path of the parse cache for the configuration file.
+
+        The cache lives in GLUE_ETL_CONFIG_CACHE, or in the per-user cache
+        directory, never next to the configuration file inside the package.
+        The file name is derived from the configuration file's full path.
+        """
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+        if not cache_dir:
+            base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            cache_dir = os.path.join(base_dir, "glue-etl")
+        digest = hashlib.sha256(str(self.config_path.resolve()).encode()).hexdigest()[:16]
+        return Path(cache_dir) / f"{self.config_path.name}-{digest}{CACHE_SUFFIX}"
+
+    def _read_cache(self, header: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Read the parsed configuration from the cache if it is still valid.
+
+        Args:
+            header: Expected cache header for the current configuration file
+
+        Returns:
+            The cached configuration, or None if the cache is missing or stale
+        """
+        try:
+            with open(self.cache_path, "rb") as f:
+                if f.read(CACHE_HEADER.size) != header:
+                    return None
+                cached = marshal.load(f)
+        except Exception:
+            # Any unreadable or corrupt cache falls back to parsing the YAML
+            return None
+        return cached if isinstance(cached, dict) else None
+
+    def _write_cache(self, header: bytes) -> None:
+        """
+        Write the freshly parsed configuration to the cache.
+
+        The cache is written to a temporary file and moved into place, so a
+        concurrent reader never sees a partial file. Read-only locations and
+        values marshal cannot hold (such as YAML dates) skip the cache silently.
+
+        Args:
+            header: Cache header for the current configuration file
+        """
+        cache_path = self.cache_path
+        try:
+            data = marshal.dumps(self.config)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".settings-")
+        except (OSError, ValueError):
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
     def _override_from_env(self) -> None:
         """Override configuration values with environment variables."""
-        for key, value in os.environ.items():
-            if key.startswith(ENV_CONFIG_PREFIX):
-                # Convert GLUE_ETL_AWS_REGION to aws.region
-                config_key = key[len(ENV_CONFIG_PREFIX):].lower().replace("_", ".")
-                self._set_nested_dict(self.config, config_key, value)
+        env_key_paths = _get_env_key_paths()
+        if not env_key_paths:
+            return
+
+        # Collect the overrides into a small nested dict, then merge it in one pass
+        delta: Dict[str, Any] = {}
+        for key, config_key in env_key_paths.items():
+            value = os.environ.get(key)
+            if value is not None:
+                self._set_nested_dict(delta, config_key, value)
+        self._deep_merge(self.config, delta)
+
+    def _deep_merge(self, target: Dict[str, Any], delta: Dict[str, Any]) -> None:
+        """
+        Merge a nested dictionary of overrides into the target in place.
+
+        Args:
+            target: The dictionary to modify
+            delta: Nested overrides; non-dict values replace what is in the target
+        """
+        for key, value in delta.items():
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, dict):
+                self._deep_merge(current, value)
+            else:
+                target[key] = value
 
     def _set_nested_dict(self, d: Dict[str, Any], key_path: str, value: Any) -> None:
         """
@@ -61,11 +222,13 @@ class Config:
             key_path: Dot-separated path (e.g., 'aws.region')
             value: Value to set
         """
-        keys = key_path.split(".")
+        keys = _split_key(key_path)
         for key in keys[:-1]:
-            if key not in d or not isinstance(d[key], dict):
-                d[key] = {}
-            d = d[key]
+            # One setdefault per hop; only a non-dict value needs a second store
+            child = d.setdefault(key, {})
+            if not isinstance(child, dict):
+                child = d[key] = {}
+            d = child
         d[keys[-1]] = value
 
     def get(self, key_path: str, default: Any = None) -> Any:
@@ -79,7 +242,7 @@ class Config:
         Returns:
             The configuration value or the default
         """
-        keys = key_path.split(".")
+        keys = _split_key(key_path)
         value = self.config
         for key in keys:
             if not isinstance(value, dict) or key not in value:
@@ -107,8 +270,57 @@ class Config:
         save_path = Path(config_path) if config_path else self.config_path
         save_path.parent.mkdir(parents=True, exist_ok=True)
         with open(save_path, "w") as f:
-            yaml.dump(self.config, f, default_flow_style=False)
+            yaml.dump(self.config, f, Dumper=_Dumper, default_flow_style=False)
+
 
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """
+    Get the global configuration instance, creating it on first use.
 
-# Global configuration instance
-config = Config()
\ No newline at end of file
+    Returns:
+        The global Config instance
+    """
+    return Config()
+
+
+def bootstrap() -> Config:
+    """
+    Load the .env file, (re)load the global configuration and reconfigure logging.
+
+    Call this once from a script's entry point. Library imports never read
+    .env, so Glue workers without one skip the file lookup entirely.
+
+    Returns:
+        The global Config instance
+    """
+    # Load environment variables from .env file if it exists
+    load_dotenv()
+
+    # Reload in place, since modules may already hold a reference to the instance
+    config = get_config()
+    config.load_config()
+
+    # Logging was configured at import, before .env was read; imported here,
+    # since src.logging itself imports this module
+    from src.logging.logger import configure_logging
+
+    configure_logging()
+    return config
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create the global ``config`` instance lazily on first access (PEP 562).
+
+    Args:
+        name: Name of the module attribute being looked up
+
+    Returns:
+        The global Config instance for ``config``
+    """
+    if name == "config":
+        # Cache it in the module namespace so later lookups skip this hook
+        value = globals()["config"] = get_config()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
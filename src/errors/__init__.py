@@ -16,6 +16,7 @@ from .exceptions import (
 )
 from .handlers import (
     alert_on_failure,
+    flush_alerts,
     handle_aws_error,
     log_error,
     retry,
@@ -37,6 +38,7 @@ __all__ = [
     
     # Handlers
     "alert_on_failure",
+    "flush_alerts",
     "handle_aws_error",
     "log_error",
     "retry",
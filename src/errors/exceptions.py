@@ -2,12 +2,56 @@
 Custom exception classes for the AWS Data Lake Framework.
 Provides standardized exceptions for different types of errors.
 """
+import sys
 from typing import Any, Dict, Optional
 
 
+# AWS error codes by service name, built once per service
+_AWS_ERROR_CODES: Dict[Optional[str], str] = {}
+
+
+def _aws_error_code(service: Optional[str]) -> str:
+    """
+    Get the error code for an AWS service, e.g. 'AWS_S3_ERROR' for 's3'.
+    
+    Args:
+        service: The AWS service name
+        
+    Returns:
+        Interned error code for the service
+    """
+    code = _AWS_ERROR_CODES.get(service)
+    if code is None:
+        code = sys.intern(f"AWS_{service.upper()}_ERROR") if service else "AWS_ERROR"
+        _AWS_ERROR_CODES[service] = code
+    return code
+
+
+def _rebuild_error(cls: type, args: tuple, state: Dict[str, Any]) -> "GlueETLError":
+    """
+    Recreate a pickled exception without re-running its __init__.
+    
+    Args:
+        cls: Exception class
+        args: Exception args
+        state: Values of the slot attributes
+        
+    Returns:
+        The restored exception
+    """
+    error = cls.__new__(cls, *args)
+    error.args = args
+    for name, value in state.items():
+        setattr(error, name, value)
+    return error
+
+
 class GlueETLError(Exception):
     """Base exception class for all Glue ETL errors."""
     
+    # Slots keep the per-instance __dict__ from being allocated
+    __slots__ = ("message", "error_code", "details")
+    
     def __init__(
         self,
         message: str,
@@ -31,6 +75,9 @@ class GlueETLError(Exception):
         """
         Convert the exception to a dictionary for logging or serialization.
         
+        A new dictionary is built on every call, so callers may change it and
+        it always reflects the current message and error code.
+        
         Returns:
             Dictionary representation of the exception
         """
@@ -40,12 +87,23 @@ class GlueETLError(Exception):
             "message": self.message,
             "details": self.details,
         }
+    
+    def __reduce__(self):
+        """Pickle the slot attributes, which BaseException's reduce leaves out."""
+        state = {
+            "message": self.message,
+            "error_code": self.error_code,
+            "details": self.details,
+        }
+        return (_rebuild_error, (self.__class__, self.args, state))
 
 
 # Configuration errors
 class ConfigurationError(GlueETLError):
     """Exception raised for errors in the configuration."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -75,6 +133,8 @@ class ConfigurationError(GlueETLError):
 class AWSError(GlueETLError):
     """Exception raised for errors in AWS service interactions."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -103,7 +163,7 @@ class AWSError(GlueETLError):
             
         super().__init__(
             message=message,
-            error_code=f"AWS_{service.upper()}_ERROR" if service else "AWS_ERROR",
+            error_code=_aws_error_code(service),
             details=error_details
         )
 
@@ -112,6 +172,8 @@ class AWSError(GlueETLError):
 class S3Error(AWSError):
     """Exception raised for errors in S3 operations."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -151,6 +213,8 @@ class S3Error(AWSError):
 class GlueError(AWSError):
     """Exception raised for errors in Glue operations."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -190,6 +254,8 @@ class GlueError(AWSError):
 class DataError(GlueETLError):
     """Exception raised for errors in data processing."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -223,6 +289,8 @@ class DataError(GlueETLError):
 class ValidationError(DataError):
     """Exception raised for data validation errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -264,6 +332,8 @@ class ValidationError(DataError):
 class PipelineError(GlueETLError):
     """Exception raised for errors in the ETL pipeline."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -297,6 +367,8 @@ class PipelineError(GlueETLError):
 class DependencyError(GlueETLError):
     """Exception raised for errors in external dependencies."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -326,6 +398,8 @@ class DependencyError(GlueETLError):
 class TimeoutError(GlueETLError):
     """Exception raised for timeout errors."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
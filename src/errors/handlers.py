@@ -2,20 +2,28 @@
 Error handling utilities for the AWS Data Lake Framework.
 Provides retry mechanisms, error logging, and decorators for error handling.
 """
+import atexit
 import functools
+import inspect
+import json
+import logging
+import queue
+import random
+import threading
 import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, cast
 
-import boto3
 from botocore.exceptions import ClientError
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 # Import the configuration and logging modules
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import config  # noqa: E402
-from logging import get_logger  # noqa: E402
+from src.config import config as config_module
+from src.logging import get_logger
 
 # Import custom exceptions
 from .exceptions import (
@@ -38,6 +46,125 @@ T = TypeVar("T")
 # Create a logger for this module
 logger = get_logger(__name__)
 
+# Log methods and standard library levels for log_error, resolved once
+_LOG_METHODS = {
+    "debug": logger.debug,
+    "info": logger.info,
+    "warning": logger.warning,
+    "error": logger.error,
+    "critical": logger.critical,
+}
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+# SNS alerts are published by a background thread so failing calls can re-raise
+# immediately. Each queued item holds the publish arguments and the error type.
+_alert_queue: "queue.Queue[Tuple[Dict[str, Any], str]]" = queue.Queue(maxsize=1024)
+_alert_thread: Optional[threading.Thread] = None
+_alert_thread_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _sns_client(region: Optional[str]):
+    """
+    Get an SNS client for the region, created once and reused.
+    
+    boto3 clients are thread-safe and expensive to build (config parsing,
+    endpoint resolution, a fresh connection pool), so they are cached per
+    region rather than created per call.
+    
+    Args:
+        region: AWS region name
+        
+    Returns:
+        boto3 SNS client
+    """
+    # boto3 is only loaded once an alert is actually sent
+    import boto3
+    
+    return boto3.client("sns", region_name=region)
+
+
+def _drain_alerts() -> None:
+    """Publish queued alerts to SNS."""
+    while True:
+        publish_args, error_type = _alert_queue.get()
+        try:
+            sns = _sns_client(config_module.config.get("aws.region"))
+            sns.publish(**publish_args)
+            
+            logger.info(
+                "Alert sent",
+                topic_arn=publish_args["TopicArn"],
+                error_type=error_type,
+            )
+        except Exception as alert_error:
+            logger.error(
+                "Failed to send alert",
+                error=str(alert_error),
+                topic_arn=publish_args["TopicArn"],
+                error_type=error_type,
+            )
+        finally:
+            _alert_queue.task_done()
+
+
+def _serialize_alert(message: Dict[str, Any]) -> str:
+    """
+    Serialize an alert message as JSON, falling back to str() for unknown types.
+    
+    Args:
+        message: Alert message
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(message, default=str).decode()
+    return json.dumps(message, default=str)
+
+
+def _enqueue_alert(publish_args: Dict[str, Any], error_type: str) -> None:
+    """
+    Queue an alert for the background publisher, starting it on first use.
+    
+    Args:
+        publish_args: Keyword arguments for SNS publish
+        error_type: Name of the exception class that triggered the alert
+    """
+    global _alert_thread
+    
+    with _alert_thread_lock:
+        if _alert_thread is None:
+            _alert_thread = threading.Thread(
+                target=_drain_alerts,
+                name="sns-alert-publisher",
+                daemon=True,
+            )
+            _alert_thread.start()
+    
+    try:
+        _alert_queue.put_nowait((publish_args, error_type))
+    except queue.Full:
+        logger.error(
+            "Alert queue full, dropping alert",
+            topic_arn=publish_args["TopicArn"],
+            error_type=error_type,
+        )
+
+
+@atexit.register
+def flush_alerts() -> None:
+    """Wait for queued alerts to be published, so alerts sent just before exit are not lost."""
+    if _alert_thread is not None:
+        _alert_queue.join()
+
 
 def log_error(
     error: Exception,
@@ -54,6 +181,14 @@ def log_error(
         include_traceback: Whether to include the traceback in the log
         additional_context: Additional context information to include in the log
     """
+    # Unknown levels log at error level instead of failing inside the handler
+    level = level.lower()
+    log_method = _LOG_METHODS.get(level) or getattr(logger, level, logger.error)
+    
+    # Skip everything, including formatting the traceback, if the level is filtered out
+    if not logger.isEnabledFor(_LOG_LEVELS.get(level, logging.ERROR)):
+        return
+    
     context = additional_context or {}
     
     # Add exception details to the context
@@ -68,8 +203,9 @@ def log_error(
     if isinstance(error, GlueETLError):
         context.update(error.to_dict())
     
-    # Log the error with the appropriate level
-    log_method = getattr(logger, level)
+    # Log the error with the appropriate level. structlog takes the event dict
+    # as keyword arguments and copies it into its own context anyway, so the
+    # splat is the cheapest way in; binding first would copy it twice.
     log_method("Error occurred", **context)
 
 
@@ -79,26 +215,34 @@ def retry(
     retry_backoff: float = 2.0,
     retry_exceptions: Optional[List[Type[Exception]]] = None,
     retry_on_result: Optional[Callable[[Any], bool]] = None,
+    max_delay: Optional[float] = None,
 ) -> Callable[[F], F]:
     """
     Decorator for retrying a function on specified exceptions or results.
     
+    Configuration defaults are read once, when the decorator is applied, so
+    changing them afterwards only affects functions decorated later.
+    
     Args:
         max_retries: Maximum number of retries (default from config)
         retry_delay: Initial delay between retries in seconds (default from config)
         retry_backoff: Backoff multiplier for the delay
         retry_exceptions: List of exceptions to retry on
         retry_on_result: Function that takes the result and returns True if retry is needed
+        max_delay: Upper bound for a single delay in seconds (default from config)
         
     Returns:
         Decorated function
     """
     # Get defaults from configuration if not specified
     if max_retries is None:
-        max_retries = config.get("errors.max_retries", 3)
+        max_retries = config_module.config.get("errors.max_retries", 3)
     
     if retry_delay is None:
-        retry_delay = config.get("errors.retry_delay_seconds", 5)
+        retry_delay = config_module.config.get("errors.retry_delay_seconds", 5)
+    
+    if max_delay is None:
+        max_delay = config_module.config.get("errors.retry_max_delay_seconds", 60)
     
     # Default exceptions to retry on
     if retry_exceptions is None:
@@ -108,6 +252,9 @@ def retry(
             ConnectionError,  # Network errors
         ]
     
+    # Build the exception tuple once instead of on every call
+    retry_exceptions_tuple = tuple(retry_exceptions)
+    
     def decorator(func: F) -> F:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -139,7 +286,7 @@ def retry(
                     else:
                         return result
                 
-                except tuple(retry_exceptions) as e:
+                except retry_exceptions_tuple as e:
                     if retries >= max_retries:
                         logger.error(
                             "Max retries reached",
@@ -163,13 +310,75 @@ def retry(
                 # Wait before retrying
                 time.sleep(current_delay)
                 retries += 1
-                current_delay *= retry_backoff
+                
+                # Decorrelated jitter keeps concurrent workers from retrying in lockstep
+                current_delay = min(
+                    max_delay,
+                    random.uniform(retry_delay, current_delay * retry_backoff),
+                )
         
         return cast(F, wrapper)
     
     return decorator
 
 
+def _translate_client_error(
+    e: ClientError,
+    service: Optional[str],
+    operation: Optional[str],
+) -> AWSError:
+    """
+    Convert a boto3 ClientError to the matching custom exception and log it.
+    
+    Args:
+        e: The boto3 client error
+        service: The AWS service name
+        operation: The operation name
+        
+    Returns:
+        The custom exception
+    """
+    # Extract AWS error information
+    error_code = e.response.get("Error", {}).get("Code", "Unknown")
+    error_message = e.response.get("Error", {}).get("Message", str(e))
+    
+    # Determine the service and operation if not provided
+    service_name = service
+    operation_name = operation
+    
+    if not service_name and hasattr(e, "operation_name"):
+        service_name = getattr(e, "service_name", None)
+    
+    if not operation_name and hasattr(e, "operation_name"):
+        operation_name = getattr(e, "operation_name", None)
+    
+    # Create the appropriate custom exception
+    if service_name == "s3":
+        custom_error = S3Error(
+            message=error_message,
+            operation=operation_name,
+            aws_error_code=error_code,
+        )
+    elif service_name == "glue":
+        custom_error = GlueError(
+            message=error_message,
+            operation=operation_name,
+            aws_error_code=error_code,
+        )
+    else:
+        custom_error = AWSError(
+            message=error_message,
+            service=service_name,
+            operation=operation_name,
+            aws_error_code=error_code,
+        )
+    
+    # Log the error
+    log_error(custom_error)
+    
+    return custom_error
+
+
 def handle_aws_error(
     func: Optional[F] = None,
     *,
@@ -180,6 +389,9 @@ def handle_aws_error(
     """
     Decorator for handling AWS errors and converting them to custom exceptions.
     
+    Works for plain functions, coroutine functions, and generator functions;
+    for generators, errors raised while iterating are converted too.
+    
     Args:
         func: The function to decorate
         service: The AWS service name
@@ -190,48 +402,44 @@ def handle_aws_error(
         Decorated function
     """
     def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except ClientError as e:
+                    custom_error = _translate_client_error(e, service, operation)
+                    
+                    # Reraise the custom exception if requested
+                    if reraise:
+                        raise custom_error from e
+                    
+                    return None
+            
+            return cast(F, async_wrapper)
+        
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return (yield from func(*args, **kwargs))
+                except ClientError as e:
+                    custom_error = _translate_client_error(e, service, operation)
+                    
+                    # Reraise the custom exception if requested
+                    if reraise:
+                        raise custom_error from e
+                    
+                    return None
+            
+            return cast(F, generator_wrapper)
+        
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except ClientError as e:
-                # Extract AWS error information
-                error_code = e.response.get("Error", {}).get("Code", "Unknown")
-                error_message = e.response.get("Error", {}).get("Message", str(e))
-                
-                # Determine the service and operation if not provided
-                service_name = service
-                operation_name = operation
-                
-                if not service_name and hasattr(e, "operation_name"):
-                    service_name = getattr(e, "service_name", None)
-                
-                if not operation_name and hasattr(e, "operation_name"):
-                    operation_name = getattr(e, "operation_name", None)
-                
-                # Create the appropriate custom exception
-                if service_name == "s3":
-                    custom_error = S3Error(
-                        message=error_message,
-                        operation=operation_name,
-                        aws_error_code=error_code,
-                    )
-                elif service_name == "glue":
-                    custom_error = GlueError(
-                        message=error_message,
-                        operation=operation_name,
-                        aws_error_code=error_code,
-                    )
-                else:
-                    custom_error = AWSError(
-                        message=error_message,
-                        service=service_name,
-                        operation=operation_name,
-                        aws_error_code=error_code,
-                    )
-                
-                # Log the error
-                log_error(custom_error)
+                custom_error = _translate_client_error(e, service, operation)
                 
                 # Reraise the custom exception if requested
                 if reraise:
@@ -275,8 +483,8 @@ def alert_on_failure(
                 log_error(e, include_traceback=include_traceback)
                 
                 # Send an alert if configured
-                if config.get("errors.alert_on_failure", False):
-                    topic_arn = alert_topic_arn or config.get("errors.sns_topic_arn")
+                if config_module.config.get("errors.alert_on_failure", False):
+                    topic_arn = alert_topic_arn or config_module.config.get("errors.sns_topic_arn")
                     
                     if topic_arn:
                         try:
@@ -295,18 +503,14 @@ def alert_on_failure(
                             if isinstance(e, GlueETLError):
                                 message.update(e.to_dict())
                             
-                            # Send the alert
-                            sns = boto3.client("sns", region_name=config.get("aws.region"))
-                            sns.publish(
-                                TopicArn=topic_arn,
-                                Subject=f"Error in {func.__name__}",
-                                Message=str(message),
-                            )
-                            
-                            logger.info(
-                                "Alert sent",
-                                topic_arn=topic_arn,
-                                error_type=e.__class__.__name__,
+                            # Hand the alert to the background publisher
+                            _enqueue_alert(
+                                {
+                                    "TopicArn": topic_arn,
+                                    "Subject": f"Error in {func.__name__}",
+                                    "Message": _serialize_alert(message),
+                                },
+                                e.__class__.__name__,
                             )
                         except Exception as alert_error:
                             logger.error(
@@ -3,19 +3,27 @@ Logging module for the AWS Data Lake Framework.
 Provides structured logging with context information.
 """
 from .logger import (
+    bind_context,
+    clear_context,
     configure_logging,
     get_logger,
     logger,
+    unbind_context,
     CloudWatchHandler,
+    InfoRateLimiter,
     setup_cloudwatch_logging,
     setup_file_logging,
 )
 
 __all__ = [
+    "bind_context",
+    "clear_context",
     "configure_logging",
     "get_logger",
     "logger",
+    "unbind_context",
     "CloudWatchHandler",
+    "InfoRateLimiter",
     "setup_cloudwatch_logging",
     "setup_file_logging",
 ]
\ No newline at end of file
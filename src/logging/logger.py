@@ -2,33 +2,188 @@
 Structured logging module for the AWS Data Lake Framework.
 Provides consistent logging across all components with context information.
 """
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from typing import Any, Dict, Optional, Union
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
 import structlog
 from structlog.stdlib import BoundLogger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 # Import the configuration
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import config  # noqa: E402
+from src.config.config import config
+
+# Queue sentinel that tells a CloudWatchHandler's sender thread to stop
+_STOP = object()
+
+# Context added to every event; filled in by configure_logging, which
+# config.bootstrap() calls again once .env has been loaded
+_PROCESS_CONTEXT: Dict[str, Any] = {}
+
+# The structlog processor chain. Loggers keep a reference to this list, so
+# configure_logging updates it in place and loggers created at import time,
+# such as module-level ones, follow later configuration
+_PROCESSORS: List[Any] = []
+
+# Root QueueHandler and the listener thread that owns the real handlers
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _orjson_dumps(obj: Any, default: Optional[Any] = None, **kwargs: Any) -> str:
+    """
+    Serialize a log event with orjson, for structlog's JSONRenderer.
+    
+    Args:
+        obj: Event dictionary
+        default: Fallback serializer for unsupported types
+        **kwargs: json.dumps options passed by structlog, ignored by orjson
+        
+    Returns:
+        JSON string
+    """
+    # The stdlib logging handlers take text, so the bytes are decoded once here
+    return orjson.dumps(
+        obj,
+        default=default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+    ).decode()
+
+
+def _add_process_context(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Put the process context in front of an event, for structlog.
+    
+    The context is read per event rather than bound to each logger, so
+    loggers created at import time still pick up a later configure_logging.
+    
+    Args:
+        logger: The wrapped logger
+        method_name: Name of the logging method
+        event_dict: Event dictionary
+        
+    Returns:
+        Event dictionary with the process context
+    """
+    return {**_PROCESS_CONTEXT, **event_dict}
+
+
+def _stop_queue_listener() -> None:
+    """Detach the root QueueHandler and stop its listener, sending queued records."""
+    global _queue_handler, _queue_listener
+    
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+@functools.lru_cache(maxsize=None)
+def _logs_client(region: Optional[str]):
+    """
+    Get a CloudWatch Logs client for the region, shared by all handlers.
+    
+    The client keeps TCP connections alive between batches and has a pool
+    large enough for several handlers, so a PutLogEvents call after an idle
+    period does not pay a new TLS handshake.
+    
+    Args:
+        region: AWS region name
+        
+    Returns:
+        boto3 CloudWatch Logs client
+    """
+    import boto3
+    from botocore.config import Config as BotoConfig
+    
+    client_config = BotoConfig(
+        tcp_keepalive=True,
+        max_pool_connections=50,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        connect_timeout=3,
+        read_timeout=10,
+    )
+    return boto3.client("logs", region_name=region, config=client_config)
 
 
 def configure_logging() -> None:
-    """Configure the logging system based on the current configuration."""
+    """
+    Configure the logging system based on the current configuration.
+    
+    The root logger only gets a QueueHandler, so logging calls never block on
+    I/O. A QueueListener thread passes the records on to the real stdout,
+    CloudWatch, and file handlers.
+    """
+    global _queue_handler, _queue_listener
+    
+    # Update in place, since the processors read this dictionary
+    _PROCESS_CONTEXT.clear()
+    _PROCESS_CONTEXT.update(
+        environment=config.get("environment", "development"),
+        service="glue-etl",
+    )
+    
     log_level_name = config.get("logging.level", "INFO")
     log_level = getattr(logging, log_level_name)
     
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        level=log_level,
-        stream=sys.stdout,
-    )
+    # Replace the queue from any earlier call
+    _stop_queue_listener()
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    
+    handlers: List[logging.Handler] = []
+    
+    # Like logging.basicConfig, only add stdout output if nothing else handles the root logger
+    if not root_logger.handlers:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers.append(stream_handler)
+    
+    # Set up additional handlers based on configuration
+    if not config.get("local_dev.mock_aws", True):
+        cloudwatch_handler = setup_cloudwatch_logging()
+        if cloudwatch_handler is not None:
+            handlers.append(cloudwatch_handler)
+    
+    file_handler = setup_file_logging()
+    if file_handler is not None:
+        handlers.append(file_handler)
+    
+    if handlers:
+        # Unbounded, so a stalled handler never makes logging calls fail
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        root_logger.addHandler(_queue_handler)
     
     # Configure structlog
     processors = [
+        _add_process_context,
+        # Request-scoped context from bind_context(), merged once per event
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -36,15 +191,25 @@ def configure_logging() -> None:
         structlog.processors.format_exc_info,
     ]
     
+    # Cap hot-path info logging before any rendering work is done (0 disables)
+    info_rate_limit = config.get("logging.info_rate_limit_per_second", 1000)
+    if info_rate_limit:
+        processors.insert(0, InfoRateLimiter(info_rate_limit))
+    
     # Add output formatter based on configuration
     log_format = config.get("logging.format", "json")
     if log_format == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer())
     
+    _PROCESSORS[:] = processors
+    
     structlog.configure(
-        processors=processors,
+        processors=_PROCESSORS,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -63,38 +228,174 @@ def get_logger(name: str, **initial_context: Any) -> BoundLogger:
     Returns:
         A structured logger instance
     """
-    # Add environment information to the context
-    context = {
-        "environment": config.get("environment", "development"),
-        "service": "glue-etl",
-    }
-    context.update(initial_context)
+    # Reuse the bound logger for repeated calls with the same name and context
+    try:
+        return _get_logger_cached(name, tuple(sorted(initial_context.items())))
+    except TypeError:
+        # Unhashable context values cannot be cached
+        return _build_logger(name, initial_context)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_logger_cached(name: str, context_items: tuple) -> BoundLogger:
+    """
+    Build a logger for get_logger, memoized on its name and context.
+    
+    Args:
+        name: The name of the logger
+        context_items: Sorted initial context items
+        
+    Returns:
+        A structured logger instance
+    """
+    return _build_logger(name, dict(context_items))
+
+
+def _build_logger(name: str, initial_context: Dict[str, Any]) -> BoundLogger:
+    """
+    Bind a structured logger to its initial context.
+    
+    The process context is added to each event by configure_logging's
+    processors instead of being bound here.
     
-    return structlog.get_logger(name).bind(**context)
+    Args:
+        name: The name of the logger
+        initial_context: Initial context values to bind to the logger
+        
+    Returns:
+        A structured logger instance
+    """
+    return structlog.get_logger(name).bind(**initial_context)
+
+
+def bind_context(**context: Any) -> None:
+    """
+    Bind context values to every log event in the current thread or task.
+    
+    The values are stored in a context variable and merged into each event by
+    the processor chain, so there is no need to rebind loggers per call.
+    
+    Args:
+        **context: Context values to bind
+    """
+    structlog.contextvars.bind_contextvars(**context)
+
+
+def unbind_context(*keys: str) -> None:
+    """
+    Remove context values bound with bind_context.
+    
+    Args:
+        *keys: Names of the context values to remove
+    """
+    structlog.contextvars.unbind_contextvars(*keys)
+
+
+def clear_context() -> None:
+    """Remove all context values bound with bind_context."""
+    structlog.contextvars.clear_contextvars()
+
+
+class InfoRateLimiter:
+    """
+    structlog processor that caps the rate of info events with a token bucket.
+    
+    Info events beyond the rate are dropped and counted in dropped_events;
+    warnings, errors and every other level always pass through.
+    """
+    
+    def __init__(self, per_second: float = 1000.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            per_second: Info events allowed per second, and the burst size
+        """
+        self.per_second = per_second
+        self.dropped_events = 0
+        self._tokens = per_second
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def __call__(self, logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pass the event on, or drop it if the info rate is exceeded.
+        
+        Args:
+            logger: Wrapped logger
+            method_name: Name of the log method called
+            event_dict: Event dictionary
+            
+        Returns:
+            The unchanged event dictionary
+        """
+        if method_name != "info":
+            return event_dict
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.per_second, self._tokens + (now - self._last) * self.per_second)
+            self._last = now
+            
+            if self._tokens < 1:
+                self.dropped_events += 1
+                raise structlog.DropEvent
+            
+            self._tokens -= 1
+        
+        return event_dict
 
 
 class CloudWatchHandler(logging.Handler):
-    """Logging handler that sends logs to AWS CloudWatch."""
+    """
+    Logging handler that sends logs to AWS CloudWatch.
+    
+    Records are queued by emit() and sent by a background thread in batches,
+    so callers never wait on a PutLogEvents round trip. A batch is sent when
+    it reaches the PutLogEvents count or size limit, or FLUSH_INTERVAL
+    seconds after its first record. When the queue is full, records are
+    dropped and counted in dropped_records.
+    """
+    
+    # PutLogEvents accepts at most 10,000 events and 1 MB (counting 26 bytes
+    # of overhead per event) per call; stay a little under the size limit
+    MAX_BATCH_EVENTS = 10_000
+    MAX_BATCH_BYTES = 900_000
+    EVENT_OVERHEAD_BYTES = 26
+    FLUSH_INTERVAL = 1.0
+    
+    # Seconds close() waits for queued records to be sent
+    CLOSE_TIMEOUT = 10.0
     
-    def __init__(self, log_group: str, log_stream: Optional[str] = None):
+    def __init__(
+        self,
+        log_group: str,
+        log_stream: Optional[str] = None,
+        max_queue_size: int = 100_000,
+    ):
         """
         Initialize the CloudWatch logging handler.
         
         Args:
             log_group: CloudWatch log group name
             log_stream: CloudWatch log stream name (defaults to job name or timestamp)
+            max_queue_size: Maximum number of records waiting to be sent
         """
         super().__init__()
         self.log_group = log_group
         self.log_stream = log_stream or f"{config.get('aws.glue.job_name', 'local')}-{structlog.processors.TimeStamper(fmt='%Y-%m-%d-%H-%M-%S')}"
+        self.dropped_records = 0
         self._client = None
+        self._sequence_token: Optional[str] = None
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
     
     @property
     def client(self):
         """Lazy initialization of the CloudWatch Logs client."""
         if self._client is None:
-            import boto3
-            self._client = boto3.client("logs", region_name=config.get("aws.region"))
+            self._client = _logs_client(config.get("aws.region"))
             
             # Create log group and stream if they don't exist
             try:
@@ -114,31 +415,120 @@ class CloudWatchHandler(logging.Handler):
     
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emit a log record to CloudWatch.
+        Queue a log record to be sent to CloudWatch.
         
         Args:
             record: The log record to emit
         """
         try:
-            log_message = self.format(record)
-            timestamp = int(record.created * 1000)
-            
-            self.client.put_log_events(
-                logGroupName=self.log_group,
-                logStreamName=self.log_stream,
-                logEvents=[
-                    {
-                        "timestamp": timestamp,
-                        "message": log_message
-                    }
-                ]
-            )
+            event = {
+                "timestamp": int(record.created * 1000),
+                "message": self.format(record),
+            }
         except Exception:
             self.handleError(record)
+            return
+        
+        self._start_worker()
+        
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped_records += 1
+    
+    def close(self) -> None:
+        """Send the queued records and stop the background thread."""
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=self.CLOSE_TIMEOUT)
+            except queue.Full:
+                pass
+            worker.join(self.CLOSE_TIMEOUT)
+        super().close()
+    
+    def _start_worker(self) -> None:
+        """Start the background sender on first use."""
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    worker = threading.Thread(
+                        target=self._run,
+                        name="cloudwatch-log-sender",
+                        daemon=True,
+                    )
+                    worker.start()
+                    self._worker = worker
+    
+    def _run(self) -> None:
+        """Collect queued records into batches and send them until stopped."""
+        batch: List[Dict[str, Any]] = []
+        batch_bytes = 0
+        deadline = 0.0
+        
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                event = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                # The batch's flush interval elapsed
+                self._send(batch)
+                batch, batch_bytes = [], 0
+                continue
+            
+            if event is _STOP:
+                self._send(batch)
+                return
+            
+            size = len(event["message"].encode("utf-8")) + self.EVENT_OVERHEAD_BYTES
+            if batch and (
+                len(batch) >= self.MAX_BATCH_EVENTS
+                or batch_bytes + size > self.MAX_BATCH_BYTES
+            ):
+                self._send(batch)
+                batch, batch_bytes = [], 0
+            
+            if not batch:
+                deadline = time.monotonic() + self.FLUSH_INTERVAL
+            batch.append(event)
+            batch_bytes += size
+    
+    def _send(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Send one batch of events with a single PutLogEvents call.
+        
+        Args:
+            batch: Events to send
+        """
+        if not batch:
+            return
+        
+        # CloudWatch requires the events of a batch in timestamp order
+        batch.sort(key=lambda event: event["timestamp"])
+        kwargs: Dict[str, Any] = {
+            "logGroupName": self.log_group,
+            "logStreamName": self.log_stream,
+            "logEvents": batch,
+        }
+        if self._sequence_token:
+            kwargs["sequenceToken"] = self._sequence_token
+        
+        try:
+            response = self.client.put_log_events(**kwargs)
+            self._sequence_token = response.get("nextSequenceToken")
+        except Exception as e:
+            # Logging from here would feed back into this handler
+            self.dropped_records += len(batch)
+            sys.stderr.write(f"CloudWatchHandler: failed to send {len(batch)} log events: {e}\n")
 
 
-def setup_cloudwatch_logging() -> None:
-    """Set up CloudWatch logging if configured."""
+def setup_cloudwatch_logging() -> Optional[logging.Handler]:
+    """
+    Set up CloudWatch logging if configured.
+    
+    Returns:
+        The CloudWatch handler, or None if CloudWatch logging is not configured
+    """
     if config.get("logging.destination") == "cloudwatch":
         log_group = config.get("logging.cloudwatch.log_group", "/aws/glue/jobs")
         handler = CloudWatchHandler(log_group=log_group)
@@ -147,13 +537,18 @@ def setup_cloudwatch_logging() -> None:
         formatter = logging.Formatter("%(message)s")
         handler.setFormatter(formatter)
         
-        # Add the handler to the root logger
-        root_logger = logging.getLogger()
-        root_logger.addHandler(handler)
+        return handler
+    
+    return None
 
 
-def setup_file_logging() -> None:
-    """Set up file logging if configured."""
+def setup_file_logging() -> Optional[logging.Handler]:
+    """
+    Set up file logging if configured.
+    
+    Returns:
+        The file handler, or None if file logging is not configured
+    """
     if config.get("logging.destination") == "file":
         from logging.handlers import RotatingFileHandler
         
@@ -174,20 +569,13 @@ def setup_file_logging() -> None:
         formatter = logging.Formatter("%(message)s")
         handler.setFormatter(formatter)
         
-        # Add the handler to the root logger
-        root_logger = logging.getLogger()
-        root_logger.addHandler(handler)
+        return handler
+    
+    return None
 
 
 # Initialize logging
 configure_logging()
 
-# Set up additional handlers based on configuration
-if not config.get("local_dev.mock_aws", True):
-    setup_cloudwatch_logging()
-
-if config.get("logging.destination") == "file":
-    setup_file_logging()
-
 # Create a default logger
 logger = get_logger(__name__)
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""
+Silver layer module for the AWS Data Lake Framework.
+Provides the ETL scripts that refine Bronze data into the Silver layer.
+"""
@@ -3,76 +3,165 @@ Spark ETL script for processing data from the Bronze layer to the Silver layer.
 This script reads data from the Bronze layer, applies transformations and data quality checks,
 and writes the data to the Silver layer using S3Tables.
 """
+import argparse
 import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from awsglue.context import GlueContext
-from awsglue.job import Job
-from awsglue.utils import getResolvedOptions
+from pyspark import SparkConf, StorageLevel
 from pyspark.context import SparkContext
-from pyspark.sql import DataFrame
+from pyspark.sql import DataFrame, SparkSession
 from pyspark.sql.functions import (
     col,
+    concat_ws,
     current_timestamp,
     lit,
-    to_date,
+    sum as spark_sum,
     to_timestamp,
     when,
 )
-from pyspark.sql.types import StructType
-
-# Initialize Spark and Glue contexts
-sc = SparkContext()
-glueContext = GlueContext(sc)
-spark = glueContext.spark_session
-job = Job(glueContext)
-
-# Get job parameters
-args = getResolvedOptions(
-    sys.argv,
-    [
-        "JOB_NAME",
-        "source_path",
-        "source_format",
-        "table_name",
-        "partition_cols",
-        "apply_quality_checks",
-    ],
-)
+from pyspark.sql.utils import AnalysisException
+
+# The Glue libraries are only available on AWS Glue or in the Glue container
+try:
+    from awsglue.context import GlueContext
+    from awsglue.job import Job
+    from awsglue.utils import getResolvedOptions
+except ImportError:
+    GlueContext = None
+    Job = None
+    getResolvedOptions = None
+
+# Job parameters
+JOB_ARGS = [
+    "JOB_NAME",
+    "source_path",
+    "source_format",
+    "table_name",
+    "partition_cols",
+    "apply_quality_checks",
+]
+
+# Spark settings for local mode: dynamic allocation and the external shuffle
+# service only add overhead on a single machine, and the default 200 shuffle
+# partitions produce mostly empty tasks on small local datasets
+LOCAL_SPARK_CONF = {
+    "spark.dynamicAllocation.enabled": "false",
+    "spark.shuffle.service.enabled": "false",
+    "spark.sql.shuffle.partitions": "4",
+    "spark.sql.adaptive.enabled": "true",
+    "spark.sql.adaptive.coalescePartitions.enabled": "true",
+}
+
+# Data Catalog database for the Silver layer tables
+SILVER_DATABASE = "silver"
+
+# Default Silver layer locations
+SILVER_TABLE_PATH = "s3://data-lake-silver/processed/{table_name}/"
+SILVER_INVALID_PATH = "s3://data-lake-silver/invalid/{table_name}/"
+
+# Metadata columns added by the Bronze and Silver layers, excluded from quality checks
+METADATA_COLUMNS = frozenset({
+    "bronze_ingest_timestamp",
+    "bronze_ingest_date",
+    "bronze_ingest_time",
+    "bronze_source_path",
+    "silver_process_timestamp",
+    "silver_process_date",
+    "silver_process_time",
+    "silver_source_path",
+    "data_quality_issues",
+})
+
+# Upper bound on the files written per batch of invalid records, which is usually small
+INVALID_DATA_MAX_PARTITIONS = 8
 
-job.init(args["JOB_NAME"], args)
 
-# Set job parameters
-source_path = args["source_path"]
-source_format = args["source_format"]
-table_name = args["table_name"]
-partition_cols = args.get("partition_cols", "").split(",") if args.get("partition_cols") else []
-apply_quality_checks = args.get("apply_quality_checks", "true").lower() == "true"
+def create_spark_context() -> SparkContext:
+    """
+    Create the Spark context, applying LOCAL_SPARK_CONF when running in local mode.
+    
+    Returns:
+        Spark context
+    """
+    conf = SparkConf()
+    
+    # The master is known before the context starts (e.g. from spark-submit),
+    # which is required because dynamic allocation cannot be changed afterwards
+    if conf.get("spark.master", "local").startswith("local"):
+        conf.setAll(LOCAL_SPARK_CONF.items())
+    
+    return SparkContext.getOrCreate(conf)
 
-# Set current timestamp for metadata
-current_date = datetime.now().strftime("%Y-%m-%d")
-current_time = datetime.now().strftime("%H-%M-%S")
+
+def parse_args(argv: List[str]) -> Dict[str, str]:
+    """
+    Parse the job arguments.
+    
+    Uses Glue's getResolvedOptions when available, otherwise falls back to
+    argparse so the script can also run with plain spark-submit.
+    
+    Args:
+        argv: Command line arguments
+        
+    Returns:
+        Dictionary of job arguments
+    """
+    if getResolvedOptions is not None:
+        return getResolvedOptions(argv, JOB_ARGS)
+    
+    parser = argparse.ArgumentParser(description="Process data into the Silver layer")
+    for name in JOB_ARGS:
+        parser.add_argument(
+            f"--{name}",
+            required=name not in ("partition_cols", "apply_quality_checks"),
+            default="",
+        )
+    
+    args, _ = parser.parse_known_args(argv[1:])
+    return vars(args)
 
 
 def read_from_bronze(
+    spark: SparkSession,
     source_path: str,
     source_format: str,
     options: Optional[Dict[str, str]] = None,
+    glue_context: Optional[Any] = None,
+    transformation_ctx: Optional[str] = None,
 ) -> DataFrame:
     """
     Read data from the Bronze layer.
     
+    With a Glue context, CSV, JSON and Parquet sources are read through a
+    DynamicFrame tagged with transformation_ctx, so job bookmarks skip the
+    objects processed by earlier runs and only new data is read.
+    
     Args:
+        spark: Spark session
         source_path: Path to the source data in the Bronze layer
         source_format: Format of the source data
         options: Additional options for reading the data
+        glue_context: Glue context used for bookmarked reads
+        transformation_ctx: Bookmark key for the read (required for bookmarks)
         
     Returns:
         DataFrame with the source data
     """
     options = options or {}
     
+    # Incremental read through Glue job bookmarks
+    if glue_context is not None and transformation_ctx and source_format in ("csv", "json", "parquet"):
+        format_options = {"withHeader": True} if source_format == "csv" else {}
+        format_options.update(options)
+        return glue_context.create_dynamic_frame.from_options(
+            connection_type="s3",
+            connection_options={"paths": [source_path], "recurse": True},
+            format=source_format,
+            format_options=format_options,
+            transformation_ctx=transformation_ctx,
+        ).toDF()
+    
     if source_format == "csv":
         return spark.read.options(**options).csv(source_path, header=True, inferSchema=True)
     elif source_format == "json":
@@ -85,28 +174,43 @@ def read_from_bronze(
         raise ValueError(f"Unsupported source format: {source_format}")
 
 
-def apply_transformations(df: DataFrame) -> DataFrame:
+def apply_transformations(
+    df: DataFrame,
+    source_path: str,
+    processed_at: Optional[datetime] = None,
+) -> DataFrame:
     """
     Apply transformations to the data.
     
     Args:
         df: Input DataFrame
+        source_path: Path to the source data in the Bronze layer
+        processed_at: Time of the Silver run used for the metadata (default: now)
         
     Returns:
         Transformed DataFrame
     """
-    # Add metadata columns
-    df = df.withColumn("silver_process_timestamp", current_timestamp())
-    df = df.withColumn("silver_process_date", lit(current_date))
-    df = df.withColumn("silver_process_time", lit(current_time))
-    df = df.withColumn("silver_source_path", lit(source_path))
+    # Set current timestamp for metadata, from a single clock read
+    processed_at = processed_at or datetime.now()
+    current_date = processed_at.strftime("%Y-%m-%d")
+    current_time = processed_at.strftime("%H-%M-%S")
+    
+    # Metadata columns
+    metadata_columns = [
+        current_timestamp().alias("silver_process_timestamp"),
+        lit(current_date).alias("silver_process_date"),
+        lit(current_time).alias("silver_process_time"),
+        lit(source_path).alias("silver_source_path"),
+    ]
     
     # Convert string timestamps to proper timestamp type if they exist
-    if "bronze_ingest_timestamp" in df.columns:
-        df = df.withColumn(
-            "bronze_ingest_timestamp",
-            to_timestamp(col("bronze_ingest_timestamp"))
-        )
+    existing_columns = [
+        to_timestamp(col(column)).alias(column) if column == "bronze_ingest_timestamp" else col(column)
+        for column in df.columns
+    ]
+    
+    # Add the metadata and convert the timestamp in a single projection
+    df = df.select(*existing_columns, *metadata_columns)
     
     # Add additional transformations here
     # For example, data type conversions, column renaming, etc.
@@ -114,38 +218,47 @@ def apply_transformations(df: DataFrame) -> DataFrame:
     return df
 
 
-def apply_data_quality_checks(df: DataFrame) -> Tuple[DataFrame, DataFrame]:
+def flag_data_quality_issues(df: DataFrame) -> DataFrame:
     """
-    Apply data quality checks to the data.
+    Add a data_quality_issues column describing the checks each record fails.
     
     Args:
         df: Input DataFrame
         
     Returns:
-        Tuple of (valid_data, invalid_data)
+        DataFrame with data_quality_issues (null for records passing all checks)
     """
-    # Create a column to track data quality issues
-    df = df.withColumn("data_quality_issues", lit(None))
-    
-    # Apply data quality checks
+    # Apply data quality checks to the data columns, skipping metadata columns
     # For example, check for null values in required columns
-    for column in df.columns:
-        # Skip metadata columns
-        if column.startswith("bronze_") or column.startswith("silver_") or column == "data_quality_issues":
-            continue
-        
-        # Check for null values
-        df = df.withColumn(
-            "data_quality_issues",
-            when(
-                col(column).isNull() & col("data_quality_issues").isNull(),
-                lit(f"Null value in {column}")
-            ).when(
-                col(column).isNull() & col("data_quality_issues").isNotNull(),
-                concat(col("data_quality_issues"), lit(f", Null value in {column}"))
-            ).otherwise(col("data_quality_issues"))
-        )
+    # The filter runs once per DataFrame, and the resulting column set is fixed
+    data_columns = tuple(column for column in df.columns if column not in METADATA_COLUMNS)
+    
+    # Build all checks as one expression; concat_ws skips the null (passing) checks
+    null_checks = [
+        when(col(column).isNull(), lit(f"Null value in {column}"))
+        for column in data_columns
+    ]
+    issues = concat_ws(", ", *null_checks)
+    
+    # Track data quality issues in a single column, null when there are none
+    df = df.withColumn(
+        "data_quality_issues",
+        when(issues == "", lit(None).cast("string")).otherwise(issues),
+    )
+    
+    return df
+
+
+def split_by_data_quality(df: DataFrame) -> Tuple[DataFrame, DataFrame]:
+    """
+    Split flagged data into valid and invalid records.
     
+    Args:
+        df: DataFrame from flag_data_quality_issues
+        
+    Returns:
+        Tuple of (valid_data, invalid_data)
+    """
     # Split into valid and invalid data
     valid_data = df.filter(col("data_quality_issues").isNull())
     invalid_data = df.filter(col("data_quality_issues").isNotNull())
@@ -156,31 +269,97 @@ def apply_data_quality_checks(df: DataFrame) -> Tuple[DataFrame, DataFrame]:
     return valid_data, invalid_data
 
 
+def apply_data_quality_checks(df: DataFrame) -> Tuple[DataFrame, DataFrame]:
+    """
+    Apply data quality checks to the data.
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        Tuple of (valid_data, invalid_data)
+    """
+    return split_by_data_quality(flag_data_quality_issues(df))
+
+
+def _catalog_table_columns(spark: SparkSession, table_name: str) -> Optional[List[str]]:
+    """
+    Get the columns of a Silver table that Spark can write to directly.
+    
+    Args:
+        spark: Spark session
+        table_name: Name of the table in the Silver layer
+        
+    Returns:
+        Table columns in catalog order, or None if Spark is not using the Glue
+        Data Catalog or the table does not exist yet
+    """
+    client_factory = spark.sparkContext.getConf().get("spark.hadoop.hive.metastore.client.factory.class", "")
+    if "AWSGlueDataCatalogHiveClientFactory" not in client_factory:
+        return None
+    
+    try:
+        return [column.name for column in spark.catalog.listColumns(table_name, SILVER_DATABASE)]
+    except AnalysisException:
+        return None
+
+
 def write_to_silver(
     df: DataFrame,
     table_name: str,
     partition_cols: Optional[List[str]] = None,
     mode: str = "append",
+    glue_context: Optional[Any] = None,
+    table_path: Optional[str] = None,
 ) -> None:
     """
     Write data to the Silver layer using S3Tables.
     
+    Without a Glue context (e.g. local runs) the data is written as plain
+    Parquet and no catalog table is updated. When the catalog table already
+    exists with the same columns, the data is inserted into it directly;
+    the DynamicFrame sink is only used to create the table or evolve its schema.
+    
     Args:
         df: DataFrame to write
         table_name: Name of the table in the Silver layer
         partition_cols: Columns to partition by
         mode: Write mode (append or overwrite)
+        glue_context: Glue context used to update the Data Catalog
+        table_path: Path for the table (default: Silver layer table path)
     """
     # Get the S3 path for the table
+    table_path = table_path or SILVER_TABLE_PATH.format(table_name=table_name)
+    
+    if glue_context is None:
+        writer = df.write.mode(mode)
+        if partition_cols:
+            writer = writer.partitionBy(*partition_cols)
+        writer.parquet(table_path)
+        return
+    
+    # Insert straight into an existing table, skipping the DynamicFrame conversion
+    table_columns = _catalog_table_columns(df.sparkSession, table_name)
+    if table_columns is not None and set(table_columns) == set(df.columns):
+        if partition_cols:
+            df.sparkSession.conf.set("hive.exec.dynamic.partition.mode", "nonstrict")
+        
+        # insertInto matches columns by position, so use the table's column order
+        df.select(*table_columns).write.insertInto(
+            f"{SILVER_DATABASE}.{table_name}",
+            overwrite=mode == "overwrite",
+        )
+        return
+    
     from awsglue.dynamicframe import DynamicFrame
     
     # Convert to DynamicFrame
-    dynamic_frame = DynamicFrame.fromDF(df, glueContext, table_name)
+    dynamic_frame = DynamicFrame.fromDF(df, glue_context, table_name)
     
     # Write to S3Tables
-    sink = glueContext.getSink(
+    sink = glue_context.getSink(
         connection_type="s3",
-        path=f"s3://data-lake-silver/processed/{table_name}/",
+        path=table_path,
         enableUpdateCatalog=True,
         updateBehavior="UPDATE_IN_DATABASE",
         partitionKeys=partition_cols,
@@ -188,7 +367,7 @@ def write_to_silver(
     
     sink.setFormat("glueparquet")
     sink.setCatalogInfo(
-        catalogDatabase="silver",
+        catalogDatabase=SILVER_DATABASE,
         catalogTableName=table_name,
     )
     
@@ -198,6 +377,7 @@ def write_to_silver(
 def write_invalid_data(
     df: DataFrame,
     table_name: str,
+    invalid_path: Optional[str] = None,
 ) -> None:
     """
     Write invalid data to a separate location for further analysis.
@@ -205,19 +385,47 @@ def write_invalid_data(
     Args:
         df: DataFrame with invalid data
         table_name: Name of the table
+        invalid_path: Path for the invalid data (default: Silver layer invalid path)
     """
-    if df.count() == 0:
-        print("No invalid data to write")
-        return
+    invalid_path = invalid_path or SILVER_INVALID_PATH.format(table_name=table_name)
     
-    # Write to a separate location
-    df.write.mode("append").parquet(f"s3://data-lake-silver/invalid/{table_name}/")
+    # Coalesce so a handful of invalid records does not produce hundreds of tiny files;
+    # counting here would run the whole plan again
+    num_partitions = max(1, min(INVALID_DATA_MAX_PARTITIONS, df.rdd.getNumPartitions()))
+    df.coalesce(num_partitions).write.mode("append").parquet(invalid_path)
     
-    print(f"Wrote {df.count()} invalid records to s3://data-lake-silver/invalid/{table_name}/")
+    print(f"Wrote invalid records to {invalid_path}")
 
 
-def main():
-    """Main ETL function."""
+def run(
+    spark: SparkSession,
+    source_path: str,
+    source_format: str,
+    table_name: str,
+    partition_cols: Optional[List[str]] = None,
+    apply_quality_checks: bool = True,
+    glue_context: Optional[Any] = None,
+    table_path: Optional[str] = None,
+    invalid_path: Optional[str] = None,
+    input_df: Optional[DataFrame] = None,
+) -> None:
+    """
+    Run the Silver processing against an existing Spark session.
+    
+    Args:
+        spark: Spark session
+        source_path: Path to the source data in the Bronze layer
+        source_format: Format of the source data
+        table_name: Name of the table in the Silver layer
+        partition_cols: Columns to partition by
+        apply_quality_checks: Whether to split out records failing quality checks
+        glue_context: Glue context used to update the Data Catalog
+        table_path: Path for the table (default: Silver layer table path)
+        invalid_path: Path for the invalid data (default: Silver layer invalid path)
+        input_df: Bronze DataFrame already in this session; skips reading source_path
+    """
+    partition_cols = partition_cols or []
+    
     # Log job parameters
     print(f"Source path: {source_path}")
     print(f"Source format: {source_format}")
@@ -225,38 +433,107 @@ def main():
     print(f"Partition columns: {partition_cols}")
     print(f"Apply quality checks: {apply_quality_checks}")
     
-    try:
-        # Read data from Bronze layer
-        df = read_from_bronze(source_path, source_format)
+    # Read data from Bronze layer, unless the caller already holds it
+    if input_df is not None:
+        df = input_df
+    else:
+        df = read_from_bronze(
+            spark,
+            source_path,
+            source_format,
+            glue_context=glue_context,
+            transformation_ctx=f"read_{table_name}",
+        )
+    
+    # Log the schema width only; a row count would run a full extra job
+    print(f"Read {len(df.columns)} columns from Bronze layer")
+    
+    # Apply transformations
+    df = apply_transformations(df, source_path)
+    
+    # Apply data quality checks if enabled
+    if apply_quality_checks:
+        df = flag_data_quality_issues(df)
+        
+        # Both splits and the statistics below read the checked data, so compute it once
+        df.persist(StorageLevel.MEMORY_AND_DISK)
         
-        # Log data statistics
-        print(f"Read {df.count()} rows and {len(df.columns)} columns from Bronze layer")
+        # Count valid and invalid records in a single aggregation
+        stats = df.agg(
+            spark_sum(when(col("data_quality_issues").isNull(), 1).otherwise(0)).alias("valid"),
+            spark_sum(when(col("data_quality_issues").isNotNull(), 1).otherwise(0)).alias("invalid"),
+        ).collect()[0]
         
-        # Apply transformations
-        df = apply_transformations(df)
+        # Log data quality statistics
+        print(f"Valid records: {stats['valid'] or 0}")
+        print(f"Invalid records: {stats['invalid'] or 0}")
         
-        # Apply data quality checks if enabled
-        if apply_quality_checks:
-            valid_data, invalid_data = apply_data_quality_checks(df)
-            
-            # Log data quality statistics
-            print(f"Valid records: {valid_data.count()}")
-            print(f"Invalid records: {invalid_data.count()}")
-            
-            # Write valid data to Silver layer
-            write_to_silver(valid_data, table_name, partition_cols)
-            
-            # Write invalid data to a separate location
-            write_invalid_data(invalid_data, table_name)
+        valid_data, invalid_data = split_by_data_quality(df)
+        
+        # Write valid data to Silver layer
+        write_to_silver(
+            valid_data,
+            table_name,
+            partition_cols,
+            glue_context=glue_context,
+            table_path=table_path,
+        )
+        
+        # Write invalid data to a separate location
+        if stats["invalid"]:
+            write_invalid_data(invalid_data, table_name, invalid_path)
         else:
-            # Write all data to Silver layer
-            write_to_silver(df, table_name, partition_cols)
+            print("No invalid data to write")
         
-        # Log success
-        print(f"Successfully processed data to Silver layer table: {table_name}")
+        df.unpersist()
+    else:
+        # Write all data to Silver layer
+        write_to_silver(
+            df,
+            table_name,
+            partition_cols,
+            glue_context=glue_context,
+            table_path=table_path,
+        )
+    
+    # Log success
+    print(f"Successfully processed data to Silver layer table: {table_name}")
+
+
+def main():
+    """Main ETL function."""
+    args = parse_args(sys.argv)
+    
+    # Initialize Spark and Glue contexts
+    sc = create_spark_context()
+    
+    if GlueContext is not None:
+        glueContext = GlueContext(sc)
+        spark = glueContext.spark_session
+        job = Job(glueContext)
+        job.init(args["JOB_NAME"], args)
+    else:
+        spark = SparkSession.builder.appName(args["JOB_NAME"]).getOrCreate()
+        glueContext = None
+        job = None
+    
+    partition_cols = args.get("partition_cols", "").split(",") if args.get("partition_cols") else []
+    apply_quality_checks = (args.get("apply_quality_checks") or "true").lower() == "true"
+    
+    try:
+        run(
+            spark,
+            source_path=args["source_path"],
+            source_format=args["source_format"],
+            table_name=args["table_name"],
+            partition_cols=partition_cols,
+            apply_quality_checks=apply_quality_checks,
+            glue_context=glueContext,
+        )
         
         # Commit the job
-        job.commit()
+        if job is not None:
+            job.commit()
     except Exception as e:
         # Log error
         print(f"Error in ETL job: {str(e)}")
@@ -264,4 +541,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,47 +5,69 @@ Provides utility functions for working with S3, S3Tables, AWS Glue, and other AW
 from .s3_utils import (
     copy_object,
     create_bucket,
+    delete_many,
     delete_object,
+    delete_prefix,
     generate_presigned_url,
     get_bronze_bucket,
     get_bronze_prefix,
     get_bucket_location,
     get_s3_client,
+    get_s3_filesystem,
     get_s3_resource,
+    invalidate_bucket_cache,
+    iter_objects,
+    iter_prefixes,
     list_objects,
+    list_objects_async,
     list_prefixes,
     move_object,
     object_exists,
     read_csv,
     read_json,
+    read_many,
+    read_many_async,
     read_object,
+    read_object_async,
     read_parquet,
+    s3_async_client,
     write_csv,
     write_json,
+    write_many,
     write_object,
+    write_object_async,
     write_parquet,
 )
 from .s3tables_utils import (
+    compact_table,
     copy_table,
     create_table,
     delete_table,
     get_silver_bucket,
     get_silver_prefix,
     get_s3tables_compression,
+    get_s3tables_compression_level,
     get_s3tables_format,
+    get_s3tables_page_size,
     get_s3tables_partition_cols,
+    get_s3tables_row_group_size,
+    get_s3tables_stats_backend,
     get_table_metadata_path,
     get_table_partitions,
     get_table_path,
     get_table_schema,
     get_table_stats,
+    invalidate_table_cache,
     list_tables,
     merge_tables,
     read_from_table,
     table_exists,
+    write_batches,
     write_to_table,
 )
 from .glue_utils import (
+    GlueJobBatchDispatcher,
+    bulk_get_job_runs,
     create_job,
     create_python_shell_job,
     create_spark_job,
@@ -56,62 +78,89 @@ from .glue_utils import (
     get_job_parameter,
     get_job_run,
     get_job_runs,
+    glue_async_client,
+    invalidate_config_cache,
     list_jobs,
     reset_job_bookmark,
     run_job_and_wait,
+    run_job_and_wait_async,
     set_job_parameter,
+    set_job_parameters,
     start_job_run,
     stop_job_run,
     update_job,
     upload_script,
     wait_for_job_run,
+    wait_for_job_run_async,
 )
 
 __all__ = [
     # S3 utilities
     "copy_object",
     "create_bucket",
+    "delete_many",
     "delete_object",
+    "delete_prefix",
     "generate_presigned_url",
     "get_bronze_bucket",
     "get_bronze_prefix",
     "get_bucket_location",
     "get_s3_client",
+    "get_s3_filesystem",
     "get_s3_resource",
+    "invalidate_bucket_cache",
+    "iter_objects",
+    "iter_prefixes",
     "list_objects",
+    "list_objects_async",
     "list_prefixes",
     "move_object",
     "object_exists",
     "read_csv",
     "read_json",
+    "read_many",
+    "read_many_async",
     "read_object",
+    "read_object_async",
     "read_parquet",
+    "s3_async_client",
     "write_csv",
     "write_json",
+    "write_many",
     "write_object",
+    "write_object_async",
     "write_parquet",
     
     # S3Tables utilities
+    "compact_table",
     "copy_table",
     "create_table",
     "delete_table",
     "get_silver_bucket",
     "get_silver_prefix",
     "get_s3tables_compression",
+    "get_s3tables_compression_level",
     "get_s3tables_format",
+    "get_s3tables_page_size",
     "get_s3tables_partition_cols",
+    "get_s3tables_row_group_size",
+    "get_s3tables_stats_backend",
     "get_table_metadata_path",
     "get_table_partitions",
     "get_table_path",
     "get_table_schema",
     "get_table_stats",
+    "invalidate_table_cache",
     "list_tables",
     "merge_tables",
     "read_from_table",
     "table_exists",
+    "write_batches",
     "write_to_table",
     
     # Glue utilities
+    "GlueJobBatchDispatcher",
+    "bulk_get_job_runs",
     "create_job",
     "create_python_shell_job",
     "create_spark_job",
@@ -122,13 +171,18 @@ __all__ = [
     "get_job_parameter",
     "get_job_run",
     "get_job_runs",
+    "glue_async_client",
+    "invalidate_config_cache",
     "list_jobs",
     "reset_job_bookmark",
     "run_job_and_wait",
+    "run_job_and_wait_async",
     "set_job_parameter",
+    "set_job_parameters",
     "start_job_run",
     "stop_job_run",
     "update_job",
     "upload_script",
     "wait_for_job_run",
+    "wait_for_job_run_async",
 ]
\ No newline at end of file
@@ -2,51 +2,329 @@
 AWS Glue utilities for the AWS Data Lake Framework.
 Provides functions for working with AWS Glue ETL jobs.
 """
+import asyncio
+import contextlib
+import functools
 import json
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import boto3
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 # Import the configuration, logging, and error handling modules
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import config  # noqa: E402
-from logging import get_logger  # noqa: E402
-from errors import GlueError, handle_aws_error, retry  # noqa: E402
+from src.config.config import config
+from src.errors import DependencyError, GlueError, handle_aws_error
+from src.logging import get_logger
 
 # Create a logger for this module
 logger = get_logger(__name__)
 
+# Connection pool size of the shared clients, and the cap on concurrent calls
+MAX_POOL_CONNECTIONS = 50
+
+# boto3 sessions are not thread-safe, so clients are only created under this lock
+_client_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _client(service: str, region: Optional[str]):
+    """
+    Get a boto3 client for the service and region, created once and reused.
+    
+    Every helper in this module, including the thread pools in
+    bulk_get_job_runs and GlueJobBatchDispatcher, shares the one client per
+    service; boto3 clients are thread-safe once created. Creation goes through
+    a single session under a lock, so credentials and service models are
+    resolved once even when several threads make their first call together.
+    
+    boto3 is imported here rather than at module level, so code that only
+    imports this module does not pay for loading the SDK.
+    
+    Args:
+        service: AWS service name
+        region: AWS region name
+        
+    Returns:
+        boto3 client
+    """
+    with _client_lock:
+        return _session().client(service, region_name=region, config=_client_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    """
+    Get the boto3 session the shared clients are created from.
+    
+    Returns:
+        boto3 Session
+    """
+    import boto3.session
+    
+    return boto3.session.Session()
+
+
+def _client_config():
+    """
+    Get the botocore settings shared by the sync and async clients.
+    
+    A pool large enough for concurrent calls, TCP keep-alive between polls,
+    and botocore's adaptive retries for throttling and transient errors.
+    
+    Returns:
+        botocore Config
+    """
+    from botocore.config import Config as BotoConfig
+    
+    return BotoConfig(
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": _cfg("aws.glue.max_attempts", 5)},
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _aioboto3_session():
+    """
+    Get the aioboto3 session used for async clients, created once and reused.
+    
+    Returns:
+        aioboto3 Session
+        
+    Raises:
+        DependencyError: If aioboto3 is not installed
+    """
+    try:
+        import aioboto3
+    except ImportError as e:
+        raise DependencyError(
+            message="aioboto3 is required for the async Glue helpers",
+            dependency="aioboto3",
+        ) from e
+    
+    return aioboto3.Session()
+
+
+def glue_async_client():
+    """
+    Open an async Glue client with the configured AWS region.
+    
+    Use it as an async context manager and pass the client to the async
+    helpers, so many concurrent waits share one connection pool:
+    
+        async with glue_async_client() as glue:
+            await asyncio.gather(*(run_job_and_wait_async(name, glue=glue) for name in jobs))
+    
+    Returns:
+        aioboto3 client context manager
+    """
+    return _aioboto3_session().client("glue", region_name=_cfg("aws.region"), config=_client_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _script_transfer_config():
+    """
+    Get the multipart settings for script uploads; small scripts go up in a single PUT.
+    
+    Returns:
+        boto3 TransferConfig
+    """
+    from boto3.s3.transfer import TransferConfig
+    
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=8 * 1024 * 1024,
+        max_concurrency=8,
+        use_threads=True,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _cfg(key: str, default: Optional[Any] = None) -> Any:
+    """
+    Get a configuration value, memoized for the static settings used here.
+    
+    Args:
+        key: Configuration key in dot notation
+        default: Default value if the key is not found
+        
+    Returns:
+        Configuration value
+    """
+    return config.get(key, default)
+
+
+def invalidate_config_cache() -> None:
+    """Forget the memoized configuration values, e.g. after the config is reloaded."""
+    _cfg.cache_clear()
+    _default_job_args.cache_clear()
+    _job_param_template.cache_clear()
+    _default_script_prefix.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_script_prefix() -> str:
+    """
+    Build the default S3 prefix for uploaded scripts once.
+    
+    Returns:
+        S3 prefix under the temp prefix
+    """
+    return f"{_cfg('s3.temp.prefix')}scripts/"
+
 
 def get_glue_client():
     """
     Get a Glue client with the configured AWS region.
     
+    The client is shared by all callers, so its connection pool is reused.
+    
     Returns:
         boto3 Glue client
     """
-    return boto3.client("glue", region_name=config.get("aws.region"))
+    return _client("glue", _cfg("aws.region"))
+
+
+# Job run states after which a run will not change again
+TERMINAL_JOB_RUN_STATES = frozenset({"SUCCEEDED", "FAILED", "TIMEOUT", "STOPPED", "ERROR", "EXPIRED"})
+
+# Seconds a job definition read by _get_job_def is reused
+JOB_DEF_TTL_SECONDS = 5.0
+
+# Recently read job definitions: job name -> (expiry time, job definition)
+_job_defs: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_job_defs_lock = threading.Lock()
+
+
+def _get_job_def(job_name: str) -> Dict[str, Any]:
+    """
+    Get a job definition, reusing one read within the last JOB_DEF_TTL_SECONDS.
+    
+    A read-modify-write sequence (get a parameter, set it, update the job)
+    then costs a single GetJob call. Callers must not modify the result.
+    
+    Args:
+        job_name: Name of the job
+        
+    Returns:
+        Job definition
+    """
+    now = time.monotonic()
+    
+    with _job_defs_lock:
+        cached = _job_defs.get(job_name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+    
+    job_def = get_glue_client().get_job(JobName=job_name)["Job"]
+    
+    with _job_defs_lock:
+        _job_defs[job_name] = (now + JOB_DEF_TTL_SECONDS, job_def)
+    
+    return job_def
+
+
+def _forget_job_def(job_name: Optional[str] = None) -> None:
+    """
+    Drop cached job definitions after a job is changed.
+    
+    Args:
+        job_name: Name of the job (default: all jobs)
+    """
+    with _job_defs_lock:
+        if job_name is None:
+            _job_defs.clear()
+        else:
+            _job_defs.pop(job_name, None)
 
 
 def get_default_job_args() -> Dict[str, str]:
     """
     Get the default job arguments for Glue jobs.
     
+    Returns:
+        Dictionary of default job arguments (a new copy the caller may modify)
+    """
+    return dict(_default_job_args())
+
+
+@functools.lru_cache(maxsize=1)
+def _default_job_args() -> Dict[str, str]:
+    """
+    Build the default job arguments once; callers get copies via get_default_job_args.
+    
     Returns:
         Dictionary of default job arguments
     """
     return {
         "--job-language": "python",
-        "--job-bookmark-option": config.get("aws.glue.job_bookmark", "job-bookmark-enable"),
+        "--job-bookmark-option": _cfg("aws.glue.job_bookmark", "job-bookmark-enable"),
         "--enable-metrics": "true",
         "--enable-continuous-cloudwatch-log": "true",
         "--enable-spark-ui": "true",
-        "--spark-event-logs-path": f"s3://{config.get('s3.temp.bucket')}/{config.get('s3.temp.prefix')}spark-logs/",
+        "--enable-glue-datacatalog": "true",
+        "--spark-event-logs-path": f"s3://{_cfg('s3.temp.bucket')}/{_cfg('s3.temp.prefix')}spark-logs/",
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _job_param_template(job_type: str) -> Dict[str, Any]:
+    """
+    Build the create_job parameters taken from configuration, once per job type.
+    
+    Args:
+        job_type: Type of job (glueetl or pythonshell)
+        
+    Returns:
+        Job parameters without the job name and script location
+    """
+    template = {
+        "Role": _cfg("aws.glue.role"),
+        "Command": {
+            "Name": job_type,
+            "PythonVersion": _cfg("aws.glue.python_version", "3.9"),
+        },
+        "DefaultArguments": _default_job_args(),
+        "GlueVersion": _cfg("aws.glue.version", "5.0"),
+        "MaxRetries": _cfg("errors.max_retries", 3),
+        "Timeout": _cfg("aws.glue.timeout_minutes", 60),
+    }
+    
+    if job_type == "glueetl":
+        template["WorkerType"] = _cfg("aws.glue.worker_type", "G.1X")
+        template["NumberOfWorkers"] = _cfg("aws.glue.number_of_workers", 5)
+    else:  # pythonshell
+        template["MaxCapacity"] = 0.0625  # Default for Python shell
+    
+    return template
+
+
+def _job_params_from_template(job_type: str) -> Dict[str, Any]:
+    """
+    Copy the job parameter template, including the nested dicts create_job fills in.
+    
+    Args:
+        job_type: Type of job (glueetl or pythonshell)
+        
+    Returns:
+        Job parameters the caller may modify
+    """
+    template = _job_param_template(job_type)
+    
+    job_params = dict(template)
+    job_params["Command"] = dict(template["Command"])
+    job_params["DefaultArguments"] = dict(template["DefaultArguments"])
+    
+    return job_params
+
+
 @handle_aws_error(service="glue")
 def create_job(
     job_name: str,
@@ -90,64 +368,40 @@ def create_job(
     """
     glue = get_glue_client()
     
-    # Set default values from configuration if not provided
-    if role is None:
-        role = config.get("aws.glue.role")
-    
-    if glue_version is None:
-        glue_version = config.get("aws.glue.version", "5.0")
-    
-    if python_version is None:
-        python_version = config.get("aws.glue.python_version", "3.9")
-    
-    if max_retries is None:
-        max_retries = config.get("errors.max_retries", 3)
-    
-    if timeout is None:
-        timeout = config.get("aws.glue.timeout_minutes", 60)
-    
-    # Prepare job arguments
-    job_args = get_default_job_args()
-    if default_arguments:
-        job_args.update(default_arguments)
+    # Start from the configured defaults for the job type
+    job_params = _job_params_from_template(job_type)
+    job_params["Name"] = job_name
+    job_params["Command"]["ScriptLocation"] = script_location
     
-    # Prepare job parameters
-    job_params = {
-        "Name": job_name,
+    # Override the defaults with the values that were provided
+    overrides = {
         "Role": role,
-        "Command": {
-            "Name": job_type,
-            "ScriptLocation": script_location,
-            "PythonVersion": python_version,
-        },
-        "DefaultArguments": job_args,
         "GlueVersion": glue_version,
         "MaxRetries": max_retries,
         "Timeout": timeout,
     }
     
+    # Set worker configuration based on job type
+    if job_type == "glueetl":
+        overrides["WorkerType"] = worker_type
+        overrides["NumberOfWorkers"] = number_of_workers
+    else:  # pythonshell
+        overrides["MaxCapacity"] = max_capacity
+    
+    job_params.update({name: value for name, value in overrides.items() if value is not None})
+    
+    if python_version is not None:
+        job_params["Command"]["PythonVersion"] = python_version
+    
+    if default_arguments:
+        job_params["DefaultArguments"].update(default_arguments)
+    
     if description:
         job_params["Description"] = description
     
     if connections:
         job_params["Connections"] = {"Connections": connections}
     
-    # Set worker configuration based on job type
-    if job_type == "glueetl":
-        if worker_type is None:
-            worker_type = config.get("aws.glue.worker_type", "G.1X")
-        
-        if number_of_workers is None:
-            number_of_workers = config.get("aws.glue.number_of_workers", 5)
-        
-        job_params["WorkerType"] = worker_type
-        job_params["NumberOfWorkers"] = number_of_workers
-    else:  # pythonshell
-        if max_capacity is None:
-            max_capacity = 0.0625  # Default for Python shell
-        
-        job_params["MaxCapacity"] = max_capacity
-    
     # Add tags if provided
     if tags:
         job_params["Tags"] = tags
@@ -180,6 +434,8 @@ def update_job(
     timeout: Optional[int] = None,
     default_arguments: Optional[Dict[str, str]] = None,
     connections: Optional[List[str]] = None,
+    job_def: Optional[Dict[str, Any]] = None,
+    default_arguments_delta: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
     Update an existing Glue job.
@@ -198,6 +454,8 @@ def update_job(
         timeout: Timeout in minutes
         default_arguments: Default job arguments
         connections: List of connection names
+        job_def: Current job definition, if the caller already fetched it
+        default_arguments_delta: Arguments to add or replace on top of the existing ones
         
     Returns:
         Glue update_job response
@@ -205,7 +463,13 @@ def update_job(
     glue = get_glue_client()
     
     # Get the current job definition
-    job_def = glue.get_job(JobName=job_name)["Job"]
+    if job_def is None:
+        job_def = _get_job_def(job_name)
+    
+    # Merge any argument changes into the existing arguments in one step
+    job_args = default_arguments or job_def.get("DefaultArguments", {})
+    if default_arguments_delta:
+        job_args = {**job_args, **default_arguments_delta}
     
     # Prepare job parameters
     job_params = {
@@ -216,7 +480,7 @@ def update_job(
                 "Name": job_def["Command"]["Name"],
                 "ScriptLocation": script_location or job_def["Command"]["ScriptLocation"],
             },
-            "DefaultArguments": default_arguments or job_def.get("DefaultArguments", {}),
+            "DefaultArguments": job_args,
             "MaxRetries": max_retries if max_retries is not None else job_def.get("MaxRetries", 3),
             "Timeout": timeout if timeout is not None else job_def.get("Timeout", 60),
         }
@@ -246,8 +510,9 @@ def update_job(
         if max_capacity:
             job_params["JobUpdate"]["MaxCapacity"] = max_capacity
     
-    # Update the job
+    # Update the job; the cached definition is now stale
     response = glue.update_job(**job_params)
+    _forget_job_def(job_name)
     
     logger.info(
         "Glue job updated",
@@ -271,6 +536,7 @@ def delete_job(job_name: str) -> Dict[str, Any]:
     glue = get_glue_client()
     
     response = glue.delete_job(JobName=job_name)
+    _forget_job_def(job_name)
     
     logger.info(
         "Glue job deleted",
@@ -323,6 +589,91 @@ def start_job_run(
     return job_run_id
 
 
+class GlueJobBatchDispatcher(contextlib.AbstractContextManager):
+    """
+    Collect Glue job runs to start and start them concurrently.
+    
+    Used as a context manager, the submitted runs are flushed when the
+    block exits without an error:
+    
+        with GlueJobBatchDispatcher() as dispatcher:
+            for table in tables:
+                dispatcher.submit_payload("silver-spark-process", {"--table_name": table})
+        
+        for job_name, result in dispatcher.results:
+            ...
+    """
+    
+    def __init__(self, max_workers: int = 16):
+        """
+        Initialize the dispatcher.
+        
+        Args:
+            max_workers: Maximum number of concurrent start_job_run requests
+        """
+        self.max_workers = max_workers
+        self.results: List[Tuple[str, Union[str, Exception]]] = []
+        self._payloads: List[Tuple[str, Optional[Dict[str, str]], Optional[int]]] = []
+    
+    def submit_payload(
+        self,
+        job_name: str,
+        arguments: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        Queue a job run to be started by the next flush.
+        
+        Args:
+            job_name: Name of the job
+            arguments: Job arguments
+            timeout: Timeout in minutes
+        """
+        self._payloads.append((job_name, arguments, timeout))
+    
+    def flush_payloads(self, max_workers: Optional[int] = None) -> List[Tuple[str, Union[str, Exception]]]:
+        """
+        Start all queued job runs concurrently.
+        
+        A failed start does not stop the others; its exception is returned in
+        place of the job run ID.
+        
+        Args:
+            max_workers: Maximum number of concurrent requests (default: the dispatcher's)
+            
+        Returns:
+            (job name, job run ID or exception) pairs, in submission order
+        """
+        payloads, self._payloads = self._payloads, []
+        if not payloads:
+            return []
+        
+        def start(payload: Tuple[str, Optional[Dict[str, str]], Optional[int]]) -> Tuple[str, Union[str, Exception]]:
+            job_name, arguments, timeout = payload
+            try:
+                return job_name, start_job_run(job_name, arguments, timeout)
+            except Exception as e:
+                return job_name, e
+        
+        # Never use more threads than the client has pooled connections
+        max_workers = max(1, min(
+            max_workers or self.max_workers,
+            len(payloads),
+            MAX_POOL_CONNECTIONS,
+        ))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(start, payloads))
+        
+        self.results.extend(results)
+        return results
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Flush the queued job runs unless the block raised."""
+        if exc_type is None:
+            self.flush_payloads()
+
+
 @handle_aws_error(service="glue")
 def get_job_run(job_name: str, job_run_id: str) -> Dict[str, Any]:
     """
@@ -342,6 +693,33 @@ def get_job_run(job_name: str, job_run_id: str) -> Dict[str, Any]:
     return response["JobRun"]
 
 
+def bulk_get_job_runs(
+    job_runs: List[Tuple[str, str]],
+    max_workers: int = 10,
+) -> List[Dict[str, Any]]:
+    """
+    Get information about many Glue job runs concurrently.
+    
+    The calls share the pooled Glue client, so up to max_workers requests
+    are in flight at once instead of waiting on each round trip in turn.
+    
+    Args:
+        job_runs: (job name, job run ID) pairs
+        max_workers: Maximum number of concurrent requests
+        
+    Returns:
+        Job run information, in the same order as job_runs
+    """
+    if not job_runs:
+        return []
+    
+    # Never use more threads than the client has pooled connections
+    max_workers = max(1, min(max_workers, len(job_runs), MAX_POOL_CONNECTIONS))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda pair: get_job_run(*pair), job_runs))
+
+
 @handle_aws_error(service="glue")
 def get_job_runs(job_name: str, max_results: int = 100) -> List[Dict[str, Any]]:
     """
@@ -371,24 +749,32 @@ def wait_for_job_run(
     job_run_id: str,
     poll_interval: int = 30,
     timeout: Optional[int] = None,
+    initial_poll_interval: float = 1.0,
 ) -> Dict[str, Any]:
     """
     Wait for a Glue job run to complete.
     
+    The delay between polls starts at initial_poll_interval and grows by half
+    each poll, with jitter, up to poll_interval; it starts over whenever the
+    status changes. Short runs are detected quickly, long runs are polled rarely.
+    
     Args:
         job_name: Name of the job
         job_run_id: Job run ID
-        poll_interval: Polling interval in seconds
+        poll_interval: Maximum polling interval in seconds
         timeout: Timeout in seconds
+        initial_poll_interval: First polling interval in seconds
         
     Returns:
         Final job run information
     """
-    start_time = time.time()
+    start_time = time.monotonic()
+    last_status = None
+    attempt = 0
     
     while True:
         # Check if timeout has been reached
-        if timeout and time.time() - start_time > timeout:
+        if timeout and time.monotonic() - start_time > timeout:
             raise GlueError(
                 message=f"Timeout waiting for job run {job_run_id} to complete",
                 job_name=job_name,
@@ -399,20 +785,146 @@ def wait_for_job_run(
         job_run = get_job_run(job_name, job_run_id)
         status = job_run["JobRunState"]
         
-        # Log the status
-        logger.info(
-            "Glue job run status",
-            job_name=job_name,
-            job_run_id=job_run_id,
-            status=status,
-        )
+        # Log status changes and restart the backoff
+        if status != last_status:
+            logger.info(
+                "Glue job run status",
+                job_name=job_name,
+                job_run_id=job_run_id,
+                status=status,
+            )
+            last_status = status
+            attempt = 0
+        
+        # Check if the job run has completed
+        if status in TERMINAL_JOB_RUN_STATES:
+            return job_run
+        
+        # Wait before polling again, backing off with jitter
+        time.sleep(_poll_delay(attempt, initial_poll_interval, poll_interval, start_time, timeout))
+        attempt += 1
+
+
+def _poll_delay(
+    attempt: int,
+    initial_poll_interval: float,
+    poll_interval: float,
+    start_time: float,
+    timeout: Optional[float],
+) -> float:
+    """
+    Get the delay before the next job run poll.
+    
+    Args:
+        attempt: Number of polls since the status last changed
+        initial_poll_interval: First polling interval in seconds
+        poll_interval: Maximum polling interval in seconds
+        start_time: time.monotonic() when waiting started
+        timeout: Timeout in seconds
+        
+    Returns:
+        Delay in seconds
+    """
+    delay = min(poll_interval, initial_poll_interval * (1.5 ** attempt))
+    delay += random.uniform(0, delay * 0.1)
+    
+    # Do not sleep past the timeout
+    if timeout:
+        delay = min(delay, max(0.0, start_time + timeout - time.monotonic()) + 0.1)
+    
+    return delay
+
+
+def _job_run_failure(job_name: str, job_run_id: str, job_run: Dict[str, Any]) -> GlueError:
+    """
+    Build the error for a job run that finished without succeeding.
+    
+    Args:
+        job_name: Name of the job
+        job_run_id: Job run ID
+        job_run: Final job run information
+        
+    Returns:
+        GlueError describing the failure
+    """
+    error_message = f"Job run {job_run_id} failed with status {job_run['JobRunState']}"
+    if "ErrorMessage" in job_run:
+        error_message += f": {job_run['ErrorMessage']}"
+    
+    return GlueError(
+        message=error_message,
+        job_name=job_name,
+        job_run_id=job_run_id,
+    )
+
+
+@handle_aws_error(service="glue")
+async def wait_for_job_run_async(
+    job_name: str,
+    job_run_id: str,
+    poll_interval: int = 30,
+    timeout: Optional[int] = None,
+    initial_poll_interval: float = 1.0,
+    glue: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Wait for a Glue job run to complete without blocking the event loop.
+    
+    Polls with the same backoff as wait_for_job_run, so one event loop can
+    wait on many runs at once instead of one thread per run.
+    
+    Args:
+        job_name: Name of the job
+        job_run_id: Job run ID
+        poll_interval: Maximum polling interval in seconds
+        timeout: Timeout in seconds
+        initial_poll_interval: First polling interval in seconds
+        glue: Client from glue_async_client() (default: open one for this call)
+        
+    Returns:
+        Final job run information
+    """
+    if glue is None:
+        async with glue_async_client() as glue:
+            return await wait_for_job_run_async(
+                job_name, job_run_id, poll_interval, timeout, initial_poll_interval, glue
+            )
+    
+    start_time = time.monotonic()
+    last_status = None
+    attempt = 0
+    
+    while True:
+        # Check if timeout has been reached
+        if timeout and time.monotonic() - start_time > timeout:
+            raise GlueError(
+                message=f"Timeout waiting for job run {job_run_id} to complete",
+                job_name=job_name,
+                job_run_id=job_run_id,
+            )
+        
+        # Get the job run status
+        job_run = (await glue.get_job_run(JobName=job_name, RunId=job_run_id))["JobRun"]
+        status = job_run["JobRunState"]
+        
+        # Log status changes and restart the backoff
+        if status != last_status:
+            logger.info(
+                "Glue job run status",
+                job_name=job_name,
+                job_run_id=job_run_id,
+                status=status,
+            )
+            last_status = status
+            attempt = 0
         
         # Check if the job run has completed
-        if status in ["SUCCEEDED", "FAILED", "TIMEOUT", "STOPPED"]:
+        if status in TERMINAL_JOB_RUN_STATES:
             return job_run
         
-        # Wait before polling again
-        time.sleep(poll_interval)
+        # Wait before polling again, backing off with jitter
+        await asyncio.sleep(_poll_delay(attempt, initial_poll_interval, poll_interval, start_time, timeout))
+        attempt += 1
 
 
 @handle_aws_error(service="glue")
@@ -512,15 +1024,55 @@ def run_job_and_wait(
     
     # Check if the job run succeeded
     if job_run["JobRunState"] != "SUCCEEDED":
-        error_message = f"Job run {job_run_id} failed with status {job_run['JobRunState']}"
-        if "ErrorMessage" in job_run:
-            error_message += f": {job_run['ErrorMessage']}"
+        raise _job_run_failure(job_name, job_run_id, job_run)
+    
+    return job_run
+
+
+@handle_aws_error(service="glue")
+async def run_job_and_wait_async(
+    job_name: str,
+    arguments: Optional[Dict[str, str]] = None,
+    timeout: Optional[int] = None,
+    poll_interval: int = 30,
+    glue: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Run a Glue job and wait for it to complete without blocking the event loop.
+    
+    Args:
+        job_name: Name of the job
+        arguments: Job arguments
+        timeout: Timeout in seconds
+        poll_interval: Maximum polling interval in seconds
+        glue: Client from glue_async_client() (default: open one for this call)
         
-        raise GlueError(
-            message=error_message,
-            job_name=job_name,
-            job_run_id=job_run_id,
-        )
+    Returns:
+        Final job run information
+    """
+    if glue is None:
+        async with glue_async_client() as glue:
+            return await run_job_and_wait_async(job_name, arguments, timeout, poll_interval, glue)
+    
+    # Start the job run
+    job_run_params: Dict[str, Any] = {"JobName": job_name}
+    if arguments:
+        job_run_params["Arguments"] = arguments
+    
+    job_run_id = (await glue.start_job_run(**job_run_params))["JobRunId"]
+    
+    logger.info(
+        "Glue job run started",
+        job_name=job_name,
+        job_run_id=job_run_id,
+    )
+    
+    # Wait for the job run to complete
+    job_run = await wait_for_job_run_async(job_name, job_run_id, poll_interval, timeout, glue=glue)
+    
+    # Check if the job run succeeded
+    if job_run["JobRunState"] != "SUCCEEDED":
+        raise _job_run_failure(job_name, job_run_id, job_run)
     
     return job_run
 
@@ -599,20 +1151,20 @@ def upload_script(
         S3 location of the uploaded script
     """
     # Get the bucket and prefix
-    bucket = bucket or config.get("s3.temp.bucket")
-    prefix = prefix or f"{config.get('s3.temp.prefix')}scripts/"
+    bucket = bucket or _cfg("s3.temp.bucket")
+    prefix = prefix or _default_script_prefix()
     
     # Get the script name
     script_name = os.path.basename(script_path)
     
-    # Upload the script to S3
-    s3 = boto3.client("s3", region_name=config.get("aws.region"))
+    key = f"{prefix}{script_name}"
     
-    with open(script_path, "rb") as f:
-        s3.upload_fileobj(f, bucket, f"{prefix}{script_name}")
+    # Upload the script to S3, in concurrent parts for large bundles
+    s3 = _client("s3", _cfg("aws.region"))
+    s3.upload_file(script_path, bucket, key, Config=_script_transfer_config())
     
     # Return the S3 location
-    s3_location = f"s3://{bucket}/{prefix}{script_name}"
+    s3_location = f"s3://{bucket}/{key}"
     
     logger.info(
         "Glue script uploaded",
@@ -671,6 +1223,28 @@ def create_python_shell_job(
     )
 
 
+def _maybe_parse_json(value: str) -> Any:
+    """
+    Parse a job argument as JSON if it looks like a JSON object or array.
+    
+    Args:
+        value: Job argument value
+        
+    Returns:
+        Parsed JSON value, or the value unchanged
+    """
+    if value[:1] not in ("{", "["):
+        return value
+    
+    try:
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(value)
+    except ValueError:
+        # Both libraries raise ValueError subclasses for invalid JSON
+        return value
+
+
 def get_job_parameter(
     job_name: str,
     parameter_name: str,
@@ -687,11 +1261,9 @@ def get_job_parameter(
     Returns:
         Parameter value
     """
-    glue = get_glue_client()
-    
     try:
         # Get the job definition
-        job_def = glue.get_job(JobName=job_name)["Job"]
+        job_def = _get_job_def(job_name)
         
         # Get the parameter value from the job arguments
         if "DefaultArguments" in job_def:
@@ -699,16 +1271,8 @@ def get_job_parameter(
             
             # Check if the parameter exists
             if f"--{parameter_name}" in args:
-                value = args[f"--{parameter_name}"]
-                
                 # Try to parse as JSON if it looks like a JSON string
-                if value.startswith("{") or value.startswith("["):
-                    try:
-                        return json.loads(value)
-                    except json.JSONDecodeError:
-                        return value
-                
-                return value
+                return _maybe_parse_json(args[f"--{parameter_name}"])
     except Exception as e:
         logger.warning(
             "Error getting job parameter",
@@ -736,26 +1300,43 @@ def set_job_parameter(
     Returns:
         Glue update_job response
     """
-    glue = get_glue_client()
+    return set_job_parameters(job_name, {parameter_name: parameter_value})
+
+
+def set_job_parameters(
+    job_name: str,
+    parameters: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Set several parameter values for a Glue job with one read and one update.
     
+    Args:
+        job_name: Name of the job
+        parameters: Parameter values by parameter name
+        
+    Returns:
+        Glue update_job response
+    """
     # Get the current job definition
-    job_def = glue.get_job(JobName=job_name)["Job"]
-    
-    # Get the current arguments
-    args = job_def.get("DefaultArguments", {}).copy()
-    
-    # Convert the parameter value to a string if it's not already
-    if not isinstance(parameter_value, str):
-        if isinstance(parameter_value, (dict, list)):
-            parameter_value = json.dumps(parameter_value)
-        else:
-            parameter_value = str(parameter_value)
-    
-    # Set the parameter value
-    args[f"--{parameter_name}"] = parameter_value
+    job_def = _get_job_def(job_name)
+    
+    # Collect only the changed arguments; update_job merges them into the rest
+    args = {}
+    
+    for parameter_name, parameter_value in parameters.items():
+        # Convert the parameter value to a string if it's not already
+        if not isinstance(parameter_value, str):
+            if isinstance(parameter_value, (dict, list)):
+                parameter_value = json.dumps(parameter_value)
+            else:
+                parameter_value = str(parameter_value)
+        
+        # Set the parameter value
+        args[f"--{parameter_name}"] = parameter_value
     
-    # Update the job
+    # Update the job, reusing the definition read above
     return update_job(
         job_name=job_name,
-        default_arguments=args,
-    )
\ No newline at end of file
+        job_def=job_def,
+        default_arguments_delta=args,
+    )
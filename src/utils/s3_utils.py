@@ -2,99 +2,346 @@
 S3 utilities for the AWS Data Lake Framework.
 Provides functions for working with S3 buckets and objects in the Bronze layer.
 """
+import asyncio
+import functools
 import io
+import itertools
 import json
-import os
-from typing import Any, Dict, Iterator, List, Optional, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import boto3
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs as pafs
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 # Import the configuration, logging, and error handling modules
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import config  # noqa: E402
-from logging import get_logger  # noqa: E402
-from errors import S3Error, handle_aws_error, retry  # noqa: E402
+from src.config.config import config
+from src.errors import DependencyError, S3Error, handle_aws_error
+from src.logging import get_logger
 
 # Create a logger for this module
 logger = get_logger(__name__)
 
+# Connection pool size of the shared S3 client, enough for concurrent transfers
+MAX_POOL_CONNECTIONS = 64
+
+# Objects larger than this are uploaded in parts of this size, pushed concurrently
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# Objects larger than this are read in parts of this size, fetched concurrently
+READ_PART_SIZE = 8 * 1024 * 1024
+
+# CopyObject only handles objects up to 5 GiB; larger ones are copied in parts of COPY_PART_SIZE
+MAX_COPY_OBJECT_SIZE = 5 * 1024 * 1024 * 1024
+COPY_PART_SIZE = 100 * 1024 * 1024
+
+# S3 DeleteObjects accepts at most this many keys per request
+DELETE_BATCH_SIZE = 1000
+
+# Block size of the multithreaded PyArrow CSV reader; each block is parsed on its own core
+CSV_BLOCK_SIZE = 8 * 1024 * 1024
+
+# read_csv options that map onto the PyArrow CSV reader; any other option goes through pandas
+ARROW_CSV_OPTIONS = frozenset({"usecols", "sep", "delimiter"})
+
+# Values pandas.read_csv reads as missing by default, so the PyArrow reader agrees on them
+CSV_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# zstd level for compressed text uploads; level 3 is fast with a good ratio for CSV and JSON
+ZSTD_LEVEL = 3
+
+# S3 resources are not thread-safe, so each thread keeps its own
+_local = threading.local()
+
+
+def _client_config() -> BotoConfig:
+    """
+    Get the botocore settings for S3 clients and resources.
+    
+    Throttling and transient errors are retried inside botocore with adaptive
+    retries, on the same connection pool, rather than by Python decorators.
+    
+    Returns:
+        botocore Config
+    """
+    return BotoConfig(
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=config.get("s3.connect_timeout_seconds", 5),
+        read_timeout=config.get("s3.read_timeout_seconds", 60),
+        retries={"mode": "adaptive", "max_attempts": config.get("s3.max_attempts", 10)},
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _transfer_config() -> TransferConfig:
+    """
+    Get the transfer settings for uploads, created once and shared.
+    
+    Returns:
+        boto3 TransferConfig
+    """
+    return TransferConfig(
+        multipart_threshold=UPLOAD_PART_SIZE,
+        multipart_chunksize=UPLOAD_PART_SIZE,
+        max_concurrency=16,
+        use_threads=True,
+    )
+
+
+def _upload(
+    fileobj: io.IOBase,
+    bucket: str,
+    key: str,
+    extra_args: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Upload a file-like object to S3, as a multipart upload when it is large.
+    
+    Objects smaller than one part are sent with a single put_object. After a
+    multipart upload, the object is read back with head_object, so callers
+    get its ETag and VersionId either way.
+    
+    Args:
+        fileobj: Binary file-like object positioned at the start of the data
+        bucket: S3 bucket name
+        key: S3 object key
+        extra_args: Extra arguments for the upload, e.g. ContentType
+        
+    Returns:
+        S3 put_object response, or head_object response after a multipart upload
+    """
+    s3 = get_s3_client()
+    extra_args = extra_args or {}
+    
+    if fileobj.seekable():
+        start = fileobj.tell()
+        size = fileobj.seek(0, io.SEEK_END) - start
+        fileobj.seek(start)
+        if size < UPLOAD_PART_SIZE:
+            return s3.put_object(Bucket=bucket, Key=key, Body=fileobj, **extra_args)
+    
+    s3.upload_fileobj(fileobj, bucket, key, ExtraArgs=extra_args or None, Config=_transfer_config())
+    return s3.head_object(Bucket=bucket, Key=key)
+
+
+def _zstd():
+    """
+    Import the zstandard module used for compressed text objects.
+    
+    Returns:
+        zstandard module
+        
+    Raises:
+        DependencyError: If zstandard is not installed
+    """
+    try:
+        import zstandard
+    except ImportError as e:
+        raise DependencyError(
+            message="zstandard is required for zstd-compressed S3 objects",
+            dependency="zstandard",
+        ) from e
+    
+    return zstandard
+
+
+def _zstd_compressor():
+    """
+    Create a zstd compressor; compressors are not thread-safe, so each write gets its own.
+    
+    Returns:
+        zstandard ZstdCompressor using all cores
+    """
+    return _zstd().ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+
+
+@functools.lru_cache(maxsize=8)
+def _client(region: Optional[str]):
+    """
+    Get an S3 client for the region, created once and shared by all threads.
+    
+    Args:
+        region: AWS region name
+        
+    Returns:
+        boto3 S3 client
+    """
+    return boto3.client("s3", region_name=region, config=_client_config())
+
+
+@functools.lru_cache(maxsize=8)
+def _arrow_filesystem(region: Optional[str]) -> pafs.S3FileSystem:
+    """
+    Get a PyArrow S3 filesystem for the region, created once and shared.
+    
+    Background writes upload the parts of large files concurrently while
+    the writer carries on producing data.
+    
+    Args:
+        region: AWS region name
+        
+    Returns:
+        PyArrow S3FileSystem
+    """
+    return pafs.S3FileSystem(region=region, background_writes=True)
+
+
+def get_s3_filesystem() -> pafs.S3FileSystem:
+    """
+    Get the shared PyArrow S3 filesystem for the configured AWS region.
+    
+    Pass it to PyArrow readers and writers with bucket/key paths, rather
+    than s3:// URIs, so they reuse its connections instead of building a
+    filesystem per call.
+    
+    Returns:
+        PyArrow S3FileSystem
+    """
+    return _arrow_filesystem(config.get("aws.region"))
+
 
 def get_s3_client():
     """
     Get an S3 client with the configured AWS region.
     
+    The client is cached and reused, so its connection pool is shared by all
+    calls; boto3 clients are thread-safe.
+    
     Returns:
         boto3 S3 client
     """
-    return boto3.client("s3", region_name=config.get("aws.region"))
+    return _client(config.get("aws.region"))
 
 
 def get_s3_resource():
     """
     Get an S3 resource with the configured AWS region.
     
+    The resource is cached per thread, since boto3 resources are not thread-safe.
+    
     Returns:
         boto3 S3 resource
     """
-    return boto3.resource("s3", region_name=config.get("aws.region"))
+    region = config.get("aws.region")
+    resources = getattr(_local, "resources", None)
+    if resources is None:
+        resources = _local.resources = {}
+    
+    if region not in resources:
+        resources[region] = boto3.resource("s3", region_name=region, config=_client_config())
+    
+    return resources[region]
 
 
+@functools.lru_cache(maxsize=1)
 def get_bronze_bucket() -> str:
     """
     Get the configured Bronze layer S3 bucket name.
     
+    The value is memoized; call invalidate_bucket_cache after the config changes.
+    
     Returns:
         S3 bucket name for the Bronze layer
     """
     return config.get("s3.bronze.bucket")
 
 
+@functools.lru_cache(maxsize=1)
 def get_bronze_prefix() -> str:
     """
     Get the configured Bronze layer S3 prefix.
     
+    The value is memoized; call invalidate_bucket_cache after the config changes.
+    
     Returns:
         S3 prefix for the Bronze layer
     """
     return config.get("s3.bronze.prefix", "raw/")
 
 
+def invalidate_bucket_cache() -> None:
+    """Forget the memoized bucket names, prefix and locations, e.g. after the config is reloaded."""
+    get_bronze_bucket.cache_clear()
+    get_bronze_prefix.cache_clear()
+    get_bucket_location.__wrapped__.cache_clear()
+
+
 @handle_aws_error(service="s3")
-def list_objects(
+def iter_objects(
     bucket: Optional[str] = None,
     prefix: Optional[str] = None,
     suffix: Optional[str] = None,
     max_keys: int = 1000,
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
-    List objects in an S3 bucket with the given prefix and suffix.
+    Iterate over objects in an S3 bucket with the given prefix and suffix.
+    
+    Objects are yielded page by page as the listing proceeds, so memory use
+    stays constant and callers can start on the first page straight away.
     
     Args:
         bucket: S3 bucket name (default: Bronze layer bucket)
         prefix: S3 prefix (default: Bronze layer prefix)
         suffix: Filter objects by suffix (e.g., '.csv')
-        max_keys: Maximum number of keys to return
+        max_keys: Number of keys requested per page
         
-    Returns:
-        List of object metadata dictionaries
+    Yields:
+        Object metadata dictionaries
     """
     bucket = bucket or get_bronze_bucket()
     prefix = prefix or get_bronze_prefix()
     
     s3 = get_s3_client()
     paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": max_keys},
+    )
     
-    objects = []
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, MaxKeys=max_keys):
-        if "Contents" in page:
-            for obj in page["Contents"]:
-                if suffix is None or obj["Key"].endswith(suffix):
-                    objects.append(obj)
+    objects = itertools.chain.from_iterable(page.get("Contents", ()) for page in pages)
+    if suffix is None:
+        yield from objects
+    else:
+        yield from (obj for obj in objects if obj["Key"].endswith(suffix))
+
+
+def list_objects(
+    bucket: Optional[str] = None,
+    prefix: Optional[str] = None,
+    suffix: Optional[str] = None,
+    max_keys: int = 1000,
+) -> List[Dict[str, Any]]:
+    """
+    List objects in an S3 bucket with the given prefix and suffix.
     
-    return objects
+    Args:
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        prefix: S3 prefix (default: Bronze layer prefix)
+        suffix: Filter objects by suffix (e.g., '.csv')
+        max_keys: Number of keys requested per page
+        
+    Returns:
+        List of object metadata dictionaries
+    """
+    return list(iter_objects(bucket, prefix, suffix, max_keys))
 
 
 @handle_aws_error(service="s3")
@@ -105,6 +352,10 @@ def object_exists(
     """
     Check if an object exists in S3.
     
+    HeadObject needs s3:GetObject; without it S3 answers 403 even for
+    existing keys, so a 403 falls back to a one-key ListObjectsV2, which
+    only needs s3:ListBucket.
+    
     Args:
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
@@ -119,22 +370,38 @@ def object_exists(
         s3.head_object(Bucket=bucket, Key=key)
         return True
     except ClientError as e:
-        if e.response["Error"]["Code"] == "404":
+        code = e.response["Error"]["Code"]
+        if code in ("404", "NoSuchKey"):
             return False
-        raise
+        if code not in ("403", "AccessDenied"):
+            raise
+    
+    response = s3.list_objects_v2(Bucket=bucket, Prefix=key, MaxKeys=1)
+    return any(obj["Key"] == key for obj in response.get("Contents", ()))
 
 
 @handle_aws_error(service="s3")
 def read_object(
     key: str,
     bucket: Optional[str] = None,
+    part_size: int = READ_PART_SIZE,
+    max_concurrency: int = 16,
 ) -> bytes:
     """
     Read an object from S3.
     
+    The first part_size bytes are read with a ranged GET, which also returns
+    the object size, so small objects still take a single request. The rest
+    of a larger object is read in parts over concurrent ranged GETs, since a
+    single stream cannot use the available S3 bandwidth.
+    
+    Objects written with ContentEncoding zstd are decompressed.
+    
     Args:
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
+        part_size: Size of each ranged GET in bytes
+        max_concurrency: Maximum number of parts read at once
         
     Returns:
         Object content as bytes
@@ -142,8 +409,45 @@ def read_object(
     bucket = bucket or get_bronze_bucket()
     s3 = get_s3_client()
     
-    response = s3.get_object(Bucket=bucket, Key=key)
-    return response["Body"].read()
+    try:
+        response = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes=0-{part_size - 1}")
+    except ClientError as e:
+        # Empty objects have no satisfiable range
+        if e.response.get("Error", {}).get("Code") != "InvalidRange":
+            raise
+        response = s3.get_object(Bucket=bucket, Key=key)
+    
+    first_part = response["Body"].read()
+    content_range = response.get("ContentRange")
+    size = int(content_range.rsplit("/", 1)[1]) if content_range else len(first_part)
+    
+    zstd_encoded = response.get("ContentEncoding") == "zstd"
+    
+    if size <= len(first_part):
+        if zstd_encoded:
+            return _zstd().ZstdDecompressor().decompressobj().decompress(first_part)
+        return first_part
+    
+    # Fill the remaining parts in place; IfMatch fails the read if the object changes meanwhile
+    buffer = bytearray(size)
+    buffer[:len(first_part)] = first_part
+    view = memoryview(buffer)
+    etag = response["ETag"]
+    
+    def read_part(start: int) -> None:
+        end = min(start + part_size, size) - 1
+        part = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag)
+        view[start:end + 1] = part["Body"].read()
+    
+    starts = range(len(first_part), size, part_size)
+    max_workers = max(1, min(max_concurrency, len(starts), MAX_POOL_CONNECTIONS))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so errors from the parts are raised here
+        list(executor.map(read_part, starts))
+    
+    if zstd_encoded:
+        return _zstd().ZstdDecompressor().decompressobj().decompress(view)
+    return bytes(buffer)
 
 
 @handle_aws_error(service="s3")
@@ -157,37 +461,36 @@ def write_object(
     """
     Write an object to S3.
     
+    Large objects are uploaded as multipart uploads with the parts sent
+    concurrently.
+    
     Args:
         key: S3 object key
-        data: Object content (bytes, string, or file-like object)
+        data: Object content (bytes, string, or binary file-like object)
         bucket: S3 bucket name (default: Bronze layer bucket)
         content_type: Content type of the object
         metadata: Object metadata
         
     Returns:
-        S3 put_object response
+        S3 response with the object's ETag and VersionId
     """
     bucket = bucket or get_bronze_bucket()
-    s3 = get_s3_client()
     
     # Convert string to bytes if necessary
     if isinstance(data, str):
         data = data.encode("utf-8")
     
-    # Prepare arguments for put_object
-    args = {
-        "Bucket": bucket,
-        "Key": key,
-        "Body": data,
-    }
+    fileobj = io.BytesIO(data) if isinstance(data, bytes) else data
+    
+    extra_args = {}
     
     if content_type:
-        args["ContentType"] = content_type
+        extra_args["ContentType"] = content_type
     
     if metadata:
-        args["Metadata"] = metadata
+        extra_args["Metadata"] = metadata
     
-    response = s3.put_object(**args)
+    response = _upload(fileobj, bucket, key, extra_args)
     
     logger.info(
         "Object written to S3",
@@ -228,6 +531,74 @@ def delete_object(
     return response
 
 
+def _multipart_copy(
+    s3,
+    copy_source: Dict[str, str],
+    head: Dict[str, Any],
+    dest_bucket: str,
+    dest_key: str,
+    max_concurrency: int = 16,
+) -> Dict[str, Any]:
+    """
+    Copy a large object with UploadPartCopy, copying the parts concurrently.
+    
+    The upload is aborted if any part fails, so no orphaned parts are left
+    behind to be billed.
+    
+    Args:
+        s3: boto3 S3 client
+        copy_source: Source bucket and key
+        head: head_object response of the source
+        dest_bucket: Destination S3 bucket name
+        dest_key: Destination S3 object key
+        max_concurrency: Maximum number of parts copied at once
+        
+    Returns:
+        S3 complete_multipart_upload response
+    """
+    size = head["ContentLength"]
+    
+    # A multipart upload does not inherit the source's content type or metadata
+    upload_args = {"Metadata": head.get("Metadata", {})}
+    if head.get("ContentType"):
+        upload_args["ContentType"] = head["ContentType"]
+    
+    upload_id = s3.create_multipart_upload(
+        Bucket=dest_bucket, Key=dest_key, **upload_args
+    )["UploadId"]
+    
+    def copy_part(part: Tuple[int, int]) -> Dict[str, Any]:
+        part_number, start = part
+        end = min(start + COPY_PART_SIZE, size) - 1
+        response = s3.upload_part_copy(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            PartNumber=part_number,
+            UploadId=upload_id,
+            CopySource=copy_source,
+            CopySourceRange=f"bytes={start}-{end}",
+            CopySourceIfMatch=head["ETag"],
+        )
+        return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+    
+    parts = list(enumerate(range(0, size, COPY_PART_SIZE), start=1))
+    max_workers = max(1, min(max_concurrency, len(parts), MAX_POOL_CONNECTIONS))
+    
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            completed = list(executor.map(copy_part, parts))
+        
+        return s3.complete_multipart_upload(
+            Bucket=dest_bucket,
+            Key=dest_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed},
+        )
+    except Exception:
+        s3.abort_multipart_upload(Bucket=dest_bucket, Key=dest_key, UploadId=upload_id)
+        raise
+
+
 @handle_aws_error(service="s3")
 def copy_object(
     source_key: str,
@@ -238,6 +609,10 @@ def copy_object(
     """
     Copy an object within S3.
     
+    The copy happens inside S3, so no data passes through the client.
+    Objects over 5 GiB, which CopyObject rejects, are copied as a multipart
+    upload whose parts are copied concurrently.
+    
     Args:
         source_key: Source S3 object key
         dest_key: Destination S3 object key
@@ -245,17 +620,24 @@ def copy_object(
         dest_bucket: Destination S3 bucket name (default: source_bucket)
         
     Returns:
-        S3 copy_object response
+        S3 copy_object response, or complete_multipart_upload response
+        for a multipart copy
     """
     source_bucket = source_bucket or get_bronze_bucket()
     dest_bucket = dest_bucket or source_bucket
     s3 = get_s3_client()
+    copy_source = {"Bucket": source_bucket, "Key": source_key}
     
-    response = s3.copy_object(
-        CopySource={"Bucket": source_bucket, "Key": source_key},
-        Bucket=dest_bucket,
-        Key=dest_key,
-    )
+    head = s3.head_object(Bucket=source_bucket, Key=source_key)
+    
+    if head["ContentLength"] > MAX_COPY_OBJECT_SIZE:
+        response = _multipart_copy(s3, copy_source, head, dest_bucket, dest_key)
+    else:
+        response = s3.copy_object(
+            CopySource=copy_source,
+            Bucket=dest_bucket,
+            Key=dest_key,
+        )
     
     logger.info(
         "Object copied in S3",
@@ -302,50 +684,444 @@ def move_object(
     return copy_response
 
 
+def read_many(
+    keys: List[str],
+    bucket: Optional[str] = None,
+    max_concurrency: int = 32,
+) -> Dict[str, bytes]:
+    """
+    Read many objects from S3 concurrently.
+    
+    The reads share the pooled S3 client, so up to max_concurrency requests
+    are in flight at once instead of waiting on each round trip in turn.
+    
+    Args:
+        keys: S3 object keys
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        max_concurrency: Maximum number of concurrent reads
+        
+    Returns:
+        Dictionary mapping each key to its content
+    """
+    if not keys:
+        return {}
+    
+    bucket = bucket or get_bronze_bucket()
+    
+    # Never use more threads than the client has pooled connections
+    max_workers = max(1, min(max_concurrency, len(keys), MAX_POOL_CONNECTIONS))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(keys, executor.map(lambda key: read_object(key, bucket), keys)))
+
+
+def write_many(
+    objects: Dict[str, Union[bytes, str]],
+    bucket: Optional[str] = None,
+    content_type: Optional[str] = None,
+    max_concurrency: int = 32,
+) -> None:
+    """
+    Write many objects to S3 concurrently.
+    
+    Args:
+        objects: Dictionary mapping S3 object keys to their content
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        content_type: Content type of the objects
+        max_concurrency: Maximum number of concurrent writes
+    """
+    if not objects:
+        return
+    
+    bucket = bucket or get_bronze_bucket()
+    
+    # Never use more threads than the client has pooled connections
+    max_workers = max(1, min(max_concurrency, len(objects), MAX_POOL_CONNECTIONS))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so a failed write is raised here
+        list(executor.map(
+            lambda item: write_object(item[0], item[1], bucket, content_type),
+            objects.items(),
+        ))
+
+
 @handle_aws_error(service="s3")
-def list_prefixes(
+def delete_many(
+    keys: List[str],
+    bucket: Optional[str] = None,
+    max_concurrency: int = 16,
+) -> int:
+    """
+    Delete many objects from S3.
+    
+    Keys are deleted with DeleteObjects in batches of up to 1000, so one
+    request replaces up to 1000 delete_object calls, and the batches are
+    sent concurrently.
+    
+    Args:
+        keys: S3 object keys
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        max_concurrency: Maximum number of batches deleted at once
+        
+    Returns:
+        Number of keys deleted
+        
+    Raises:
+        S3Error: If any key could not be deleted
+    """
+    if not keys:
+        return 0
+    
+    bucket = bucket or get_bronze_bucket()
+    s3 = get_s3_client()
+    
+    def delete_batch(start: int) -> List[Dict[str, Any]]:
+        batch = keys[start:start + DELETE_BATCH_SIZE]
+        response = s3.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+        )
+        # Quiet mode only reports the keys that failed
+        return response.get("Errors", [])
+    
+    starts = range(0, len(keys), DELETE_BATCH_SIZE)
+    max_workers = max(1, min(max_concurrency, len(starts), MAX_POOL_CONNECTIONS))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        errors = list(itertools.chain.from_iterable(executor.map(delete_batch, starts)))
+    
+    if errors:
+        logger.error(
+            "Failed to delete objects from S3",
+            bucket=bucket,
+            failed=len(errors),
+        )
+        raise S3Error(
+            message=f"Failed to delete {len(errors)} of {len(keys)} objects from S3",
+            operation="delete_objects",
+            bucket=bucket,
+            details={"errors": errors},
+        )
+    
+    logger.info(
+        "Objects deleted from S3",
+        bucket=bucket,
+        count=len(keys),
+    )
+    
+    return len(keys)
+
+
+def delete_prefix(
+    prefix: str,
+    bucket: Optional[str] = None,
+    max_concurrency: int = 16,
+) -> int:
+    """
+    Delete every object under a prefix.
+    
+    Args:
+        prefix: S3 prefix; must not be empty
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        max_concurrency: Maximum number of DeleteObjects batches sent at once
+        
+    Returns:
+        Number of keys deleted
+    """
+    if not prefix:
+        raise S3Error(
+            message="Refusing to delete an empty prefix, which would empty the bucket",
+            operation="delete_objects",
+            bucket=bucket,
+        )
+    
+    bucket = bucket or get_bronze_bucket()
+    keys = [obj["Key"] for obj in iter_objects(bucket, prefix)]
+    
+    return delete_many(keys, bucket, max_concurrency)
+
+
+@functools.lru_cache(maxsize=1)
+def _aioboto3_session():
+    """
+    Get the aioboto3 session used for async clients, created once and reused.
+    
+    Returns:
+        aioboto3 Session
+        
+    Raises:
+        DependencyError: If aioboto3 is not installed
+    """
+    try:
+        import aioboto3
+    except ImportError as e:
+        raise DependencyError(
+            message="aioboto3 is required for the async S3 helpers",
+            dependency="aioboto3",
+        ) from e
+    
+    return aioboto3.Session()
+
+
+def s3_async_client():
+    """
+    Open an async S3 client with the configured AWS region.
+    
+    Use it as an async context manager and pass the client to the async
+    helpers, so concurrent calls share one connection pool:
+    
+        async with s3_async_client() as s3:
+            data = await read_object_async(key, s3=s3)
+    
+    Returns:
+        aioboto3 client context manager
+    """
+    return _aioboto3_session().client("s3", region_name=config.get("aws.region"), config=_client_config())
+
+
+@handle_aws_error(service="s3")
+async def read_object_async(
+    key: str,
+    bucket: Optional[str] = None,
+    s3: Optional[Any] = None,
+) -> bytes:
+    """
+    Read an object from S3 without blocking the event loop.
+    
+    Objects written with ContentEncoding zstd are decompressed, as in read_object.
+    
+    Args:
+        key: S3 object key
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        s3: Client from s3_async_client() (default: open one for this call)
+        
+    Returns:
+        Object content as bytes
+    """
+    if s3 is None:
+        async with s3_async_client() as s3:
+            return await read_object_async(key, bucket, s3)
+    
+    bucket = bucket or get_bronze_bucket()
+    
+    response = await s3.get_object(Bucket=bucket, Key=key)
+    async with response["Body"] as body:
+        data = await body.read()
+    
+    if response.get("ContentEncoding") == "zstd":
+        return _zstd().ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
+
+@handle_aws_error(service="s3")
+async def write_object_async(
+    key: str,
+    data: Union[bytes, str],
+    bucket: Optional[str] = None,
+    content_type: Optional[str] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    s3: Optional[Any] = None,
+) -> Dict[str, Any]:
+    """
+    Write an object to S3 without blocking the event loop.
+    
+    Args:
+        key: S3 object key
+        data: Object content (bytes or string)
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        content_type: Content type of the object
+        metadata: Object metadata
+        s3: Client from s3_async_client() (default: open one for this call)
+        
+    Returns:
+        S3 put_object response
+    """
+    if s3 is None:
+        async with s3_async_client() as s3:
+            return await write_object_async(key, data, bucket, content_type, metadata, s3)
+    
+    bucket = bucket or get_bronze_bucket()
+    
+    # Convert string to bytes if necessary
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    
+    args = {"Bucket": bucket, "Key": key, "Body": data}
+    
+    if content_type:
+        args["ContentType"] = content_type
+    
+    if metadata:
+        args["Metadata"] = metadata
+    
+    response = await s3.put_object(**args)
+    
+    logger.info(
+        "Object written to S3",
+        bucket=bucket,
+        key=key,
+        size=len(data),
+    )
+    
+    return response
+
+
+@handle_aws_error(service="s3")
+async def list_objects_async(
+    bucket: Optional[str] = None,
+    prefix: Optional[str] = None,
+    suffix: Optional[str] = None,
+    max_keys: int = 1000,
+    s3: Optional[Any] = None,
+) -> List[Dict[str, Any]]:
+    """
+    List objects in an S3 bucket without blocking the event loop.
+    
+    Args:
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        prefix: S3 prefix (default: Bronze layer prefix)
+        suffix: Filter objects by suffix (e.g., '.csv')
+        max_keys: Number of keys requested per page
+        s3: Client from s3_async_client() (default: open one for this call)
+        
+    Returns:
+        List of object metadata dictionaries
+    """
+    if s3 is None:
+        async with s3_async_client() as s3:
+            return await list_objects_async(bucket, prefix, suffix, max_keys, s3)
+    
+    bucket = bucket or get_bronze_bucket()
+    prefix = prefix or get_bronze_prefix()
+    
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": max_keys},
+    )
+    
+    objects = []
+    async for page in pages:
+        objects.extend(
+            obj for obj in page.get("Contents", ())
+            if suffix is None or obj["Key"].endswith(suffix)
+        )
+    
+    return objects
+
+
+async def read_many_async(
+    keys: List[str],
+    bucket: Optional[str] = None,
+    max_concurrency: int = 32,
+    s3: Optional[Any] = None,
+) -> Dict[str, bytes]:
+    """
+    Read many objects from S3 concurrently on the event loop.
+    
+    Args:
+        keys: S3 object keys
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        max_concurrency: Maximum number of concurrent reads
+        s3: Client from s3_async_client() (default: open one for this call)
+        
+    Returns:
+        Dictionary mapping each key to its content
+    """
+    if not keys:
+        return {}
+    
+    if s3 is None:
+        async with s3_async_client() as s3:
+            return await read_many_async(keys, bucket, max_concurrency, s3)
+    
+    # Never have more reads in flight than the client has pooled connections
+    semaphore = asyncio.Semaphore(max(1, min(max_concurrency, MAX_POOL_CONNECTIONS)))
+    
+    async def read(key: str) -> bytes:
+        async with semaphore:
+            return await read_object_async(key, bucket, s3)
+    
+    contents = await asyncio.gather(*(read(key) for key in keys))
+    return dict(zip(keys, contents))
+
+
+@handle_aws_error(service="s3")
+def iter_prefixes(
     prefix: Optional[str] = None,
     delimiter: str = "/",
     bucket: Optional[str] = None,
-) -> List[str]:
+) -> Iterator[str]:
     """
-    List prefixes (directories) in an S3 bucket.
+    Iterate over prefixes (directories) in an S3 bucket, page by page.
     
     Args:
         prefix: S3 prefix (default: Bronze layer prefix)
         delimiter: Delimiter for prefixes
         bucket: S3 bucket name (default: Bronze layer bucket)
         
-    Returns:
-        List of prefixes
+    Yields:
+        Prefixes
     """
     bucket = bucket or get_bronze_bucket()
     prefix = prefix or get_bronze_prefix()
     s3 = get_s3_client()
     
     paginator = s3.get_paginator("list_objects_v2")
-    prefixes = []
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        Delimiter=delimiter,
+        PaginationConfig={"PageSize": 1000},
+    )
     
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter):
-        if "CommonPrefixes" in page:
-            for common_prefix in page["CommonPrefixes"]:
-                prefixes.append(common_prefix["Prefix"])
+    for page in pages:
+        for common_prefix in page.get("CommonPrefixes", ()):
+            yield common_prefix["Prefix"]
+
+
+def list_prefixes(
+    prefix: Optional[str] = None,
+    delimiter: str = "/",
+    bucket: Optional[str] = None,
+) -> List[str]:
+    """
+    List prefixes (directories) in an S3 bucket.
     
-    return prefixes
+    Args:
+        prefix: S3 prefix (default: Bronze layer prefix)
+        delimiter: Delimiter for prefixes
+        bucket: S3 bucket name (default: Bronze layer bucket)
+        
+    Returns:
+        List of prefixes
+    """
+    return list(iter_prefixes(prefix, delimiter, bucket))
 
 
 @handle_aws_error(service="s3")
 def read_csv(
     key: str,
     bucket: Optional[str] = None,
+    use_arrow: bool = False,
     **pandas_kwargs: Any,
 ) -> pd.DataFrame:
     """
     Read a CSV file from S3 into a pandas DataFrame.
     
+    Objects written with ContentEncoding zstd are decompressed as they stream.
+    The body is parsed with pandas.read_csv. With use_arrow, it is parsed with
+    the multithreaded PyArrow CSV reader instead when the options allow it
+    (usecols as column names, a one-character sep or delimiter). That reader
+    agrees with pandas on missing values, but infers ISO dates and timestamps
+    as date and datetime columns where pandas keeps strings.
+    
     Args:
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
+        use_arrow: Parse with the PyArrow CSV reader when the options allow it
         **pandas_kwargs: Additional arguments for pandas.read_csv
         
     Returns:
@@ -355,7 +1131,33 @@ def read_csv(
     s3 = get_s3_client()
     
     obj = s3.get_object(Bucket=bucket, Key=key)
-    return pd.read_csv(obj["Body"], **pandas_kwargs)
+    body = obj["Body"]
+    if obj.get("ContentEncoding") == "zstd":
+        body = _zstd().ZstdDecompressor().stream_reader(body)
+    
+    usecols = pandas_kwargs.get("usecols")
+    delimiter = pandas_kwargs.get("sep", pandas_kwargs.get("delimiter", ","))
+    if (
+        use_arrow
+        and pandas_kwargs.keys() <= ARROW_CSV_OPTIONS
+        and not callable(usecols)
+        and all(isinstance(column, str) for column in usecols or ())
+        and isinstance(delimiter, str)
+        and len(delimiter) == 1
+    ):
+        table = pacsv.read_csv(
+            body,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=list(usecols or ()),
+                null_values=CSV_NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas()
+    
+    return pd.read_csv(body, **pandas_kwargs)
 
 
 @handle_aws_error(service="s3")
@@ -363,6 +1165,7 @@ def write_csv(
     df: pd.DataFrame,
     key: str,
     bucket: Optional[str] = None,
+    compress: bool = False,
     **pandas_kwargs: Any,
 ) -> Dict[str, Any]:
     """
@@ -372,25 +1175,35 @@ def write_csv(
         df: pandas DataFrame
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
+        compress: Compress the object with zstd and set ContentEncoding zstd;
+            read_csv decompresses it, other readers need to support zstd
         **pandas_kwargs: Additional arguments for DataFrame.to_csv
         
     Returns:
-        S3 put_object response
+        S3 response with the object's ETag and VersionId
     """
     bucket = bucket or get_bronze_bucket()
-    s3 = get_s3_client()
-    
-    # Write DataFrame to CSV in memory
-    csv_buffer = io.StringIO()
-    df.to_csv(csv_buffer, **pandas_kwargs)
+    extra_args = {"ContentType": "text/csv"}
+    
+    # Encode the CSV straight into a byte buffer, so no intermediate str is built
+    csv_buffer = io.BytesIO()
+    sink = csv_buffer
+    if compress:
+        sink = _zstd_compressor().stream_writer(csv_buffer, closefd=False)
+        extra_args["ContentEncoding"] = "zstd"
+    
+    text_buffer = io.TextIOWrapper(sink, encoding="utf-8", newline="")
+    df.to_csv(text_buffer, **pandas_kwargs)
+    text_buffer.flush()
+    # Detach so the byte buffer stays open when the wrapper is collected
+    text_buffer.detach()
+    if compress:
+        # Closing the writer ends the zstd frame
+        sink.close()
+    csv_buffer.seek(0)
     
     # Upload to S3
-    response = s3.put_object(
-        Bucket=bucket,
-        Key=key,
-        Body=csv_buffer.getvalue(),
-        ContentType="text/csv",
-    )
+    response = _upload(csv_buffer, bucket, key, extra_args)
     
     logger.info(
         "CSV written to S3",
@@ -412,6 +1225,8 @@ def read_json(
     """
     Read a JSON file from S3.
     
+    Objects written with ContentEncoding zstd are decompressed.
+    
     Args:
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
@@ -420,17 +1235,15 @@ def read_json(
     Returns:
         pandas DataFrame or dictionary
     """
-    bucket = bucket or get_bronze_bucket()
-    s3 = get_s3_client()
-    
-    obj = s3.get_object(Bucket=bucket, Key=key)
-    content = obj["Body"].read().decode("utf-8")
+    content = read_object(key, bucket)
     
     # If pandas_kwargs are provided, use pandas.read_json
     if pandas_kwargs:
-        return pd.read_json(content, **pandas_kwargs)
+        return pd.read_json(io.BytesIO(content), **pandas_kwargs)
     
-    # Otherwise, return a dictionary
+    # Otherwise, return a dictionary, parsed from the bytes without decoding them to a str first
+    if orjson is not None:
+        return orjson.loads(content)
     return json.loads(content)
 
 
@@ -439,6 +1252,7 @@ def write_json(
     data: Union[pd.DataFrame, Dict[str, Any], List[Any]],
     key: str,
     bucket: Optional[str] = None,
+    compress: bool = False,
     **pandas_kwargs: Any,
 ) -> Dict[str, Any]:
     """
@@ -448,6 +1262,8 @@ def write_json(
         data: Data to write (DataFrame, dictionary, or list)
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
+        compress: Compress the object with zstd and set ContentEncoding zstd;
+            read_json decompresses it, other readers need to support zstd
         **pandas_kwargs: Additional arguments for DataFrame.to_json
         
     Returns:
@@ -459,15 +1275,26 @@ def write_json(
     # Convert data to JSON
     if isinstance(data, pd.DataFrame):
         json_data = data.to_json(**pandas_kwargs)
+    elif orjson is not None:
+        # orjson emits UTF-8 bytes directly
+        json_data = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
     else:
         json_data = json.dumps(data)
     
+    extra_args = {}
+    if compress:
+        if isinstance(json_data, str):
+            json_data = json_data.encode("utf-8")
+        json_data = _zstd_compressor().compress(json_data)
+        extra_args["ContentEncoding"] = "zstd"
+    
     # Upload to S3
     response = s3.put_object(
         Bucket=bucket,
         Key=key,
         Body=json_data,
         ContentType="application/json",
+        **extra_args,
     )
     
     logger.info(
@@ -483,73 +1310,92 @@ def write_json(
 def read_parquet(
     key: str,
     bucket: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    filter: Optional[ds.Expression] = None,
     **pandas_kwargs: Any,
 ) -> pd.DataFrame:
     """
     Read a Parquet file from S3 into a pandas DataFrame.
     
+    The file is read in place with ranged GETs, so only the footer and the
+    column chunks of the requested columns, in row groups the filter
+    cannot rule out, are fetched.
+    
     Args:
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
-        **pandas_kwargs: Additional arguments for pandas.read_parquet
+        columns: Columns to read (default: all columns)
+        filter: Row filter, e.g. pyarrow.dataset.field("year") == 2024
+        **pandas_kwargs: Additional arguments for pyarrow.Table.to_pandas
         
     Returns:
         pandas DataFrame
     """
     bucket = bucket or get_bronze_bucket()
-    s3 = get_s3_client()
+    filesystem = get_s3_filesystem()
     
-    obj = s3.get_object(Bucket=bucket, Key=key)
-    return pd.read_parquet(io.BytesIO(obj["Body"].read()), **pandas_kwargs)
+    try:
+        dataset = ds.dataset(f"{bucket}/{key}", filesystem=filesystem, format="parquet")
+        table = dataset.to_table(columns=columns, filter=filter)
+    except OSError as e:
+        # PyArrow reports S3 failures as OSError rather than ClientError
+        logger.error("Failed to read Parquet from S3", bucket=bucket, key=key, error=str(e))
+        raise S3Error(
+            message=f"Failed to read Parquet from S3: {e}",
+            operation="read_parquet",
+            bucket=bucket,
+            key=key,
+        ) from e
+    
+    return table.to_pandas(**pandas_kwargs)
 
 
 @handle_aws_error(service="s3")
 def write_parquet(
-    df: pd.DataFrame,
+    df: Union[pd.DataFrame, pa.Table],
     key: str,
     bucket: Optional[str] = None,
     **pandas_kwargs: Any,
 ) -> Dict[str, Any]:
     """
-    Write a pandas DataFrame to a Parquet file in S3.
+    Write a pandas DataFrame or PyArrow Table to a Parquet file in S3.
     
     Args:
-        df: pandas DataFrame
+        df: pandas DataFrame or PyArrow Table
         key: S3 object key
         bucket: S3 bucket name (default: Bronze layer bucket)
         **pandas_kwargs: Additional arguments for DataFrame.to_parquet
+            (or pyarrow.parquet.write_table for a PyArrow Table)
         
     Returns:
-        S3 put_object response
+        S3 response with the object's ETag and VersionId
     """
     bucket = bucket or get_bronze_bucket()
-    s3 = get_s3_client()
     
-    # Write DataFrame to Parquet in memory
+    # Write data to Parquet in memory
     parquet_buffer = io.BytesIO()
-    df.to_parquet(parquet_buffer, **pandas_kwargs)
+    if isinstance(df, pa.Table):
+        pq.write_table(df, parquet_buffer, **pandas_kwargs)
+        columns = df.column_names
+    else:
+        df.to_parquet(parquet_buffer, **pandas_kwargs)
+        columns = list(df.columns)
     parquet_buffer.seek(0)
     
-    # Upload to S3
-    response = s3.put_object(
-        Bucket=bucket,
-        Key=key,
-        Body=parquet_buffer.getvalue(),
-        ContentType="application/octet-stream",
-    )
+    # Upload the buffer itself rather than a copy of its contents
+    response = _upload(parquet_buffer, bucket, key, {"ContentType": "application/octet-stream"})
     
     logger.info(
         "Parquet written to S3",
         bucket=bucket,
         key=key,
         rows=len(df),
-        columns=list(df.columns),
+        columns=columns,
     )
     
     return response
 
 
-@retry(max_retries=3)
 @handle_aws_error(service="s3")
 def create_bucket(
     bucket: str,
@@ -587,12 +1433,15 @@ def create_bucket(
 
 
 @handle_aws_error(service="s3")
+@functools.lru_cache(maxsize=32)
 def get_bucket_location(
     bucket: Optional[str] = None,
 ) -> str:
     """
     Get the location (region) of an S3 bucket.
     
+    A bucket's region never changes, so each lookup is made only once.
+    
     Args:
         bucket: S3 bucket name (default: Bronze layer bucket)
         
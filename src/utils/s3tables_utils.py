@@ -2,45 +2,122 @@
 S3Tables utilities for the AWS Data Lake Framework.
 Provides functions for working with S3Tables in the Silver layer.
 """
+import functools
+import itertools
+import json
 import os
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import unquote
 
-import boto3
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.dataset as ds
 import pyarrow.parquet as pq
+from pyarrow import fs as pafs
+from botocore.exceptions import ClientError
 from pyarrow.dataset import Expression, Scanner
 
 # Import the configuration, logging, and error handling modules
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.config import config  # noqa: E402
-from logging import get_logger  # noqa: E402
-from errors import AWSError, DataError, handle_aws_error, retry  # noqa: E402
+from src.config.config import config
+from src.errors import AWSError, ConfigurationError, DataError, ValidationError, handle_aws_error
+from src.logging import get_logger
+from src.utils.s3_utils import (
+    MAX_POOL_CONNECTIONS,
+    delete_prefix,
+    get_s3_client,
+    get_s3_filesystem,
+    iter_objects,
+)
 
 # Create a logger for this module
 logger = get_logger(__name__)
 
+# Directory under a table path holding merge deltas; the leading underscore keeps
+# them out of the base dataset, which ignores files and directories starting with "_"
+DELTA_DIR = "_deltas"
 
+# Scan read-ahead: rows per record batch, and how many files and batches are fetched ahead of the consumer
+SCAN_BATCH_SIZE = 128 * 1024
+SCAN_FRAGMENT_READAHEAD = 8
+SCAN_BATCH_READAHEAD = 16
+
+# Row-count backends for get_table_stats: Parquet footers, or S3 Select COUNT(*) per file
+STATS_BACKENDS = ("footer", "s3select")
+
+# Seconds a table's existence, schema or partition list is reused
+TABLE_INFO_TTL_SECONDS = 60.0
+
+# Recently read table information: (kind, table name) -> (expiry time, value)
+_table_info: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_table_info_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def get_silver_bucket() -> str:
     """
     Get the configured Silver layer S3 bucket name.
     
+    The value is memoized; call invalidate_table_cache after the config changes.
+    
     Returns:
         S3 bucket name for the Silver layer
     """
     return config.get("s3.silver.bucket")
 
 
+@functools.lru_cache(maxsize=1)
 def get_silver_prefix() -> str:
     """
-    Get the configured Silver layer S3 prefix.
+    Get the configured Silver layer S3 prefix, always ending in '/'.
+    
+    The value is memoized; call invalidate_table_cache after the config changes.
     
     Returns:
         S3 prefix for the Silver layer
     """
-    return config.get("s3.silver.prefix", "processed/")
+    return _normalize_prefix(config.get("s3.silver.prefix", "processed/"))
+
+
+def _normalize_prefix(prefix: str) -> str:
+    """
+    Terminate a non-empty S3 prefix with '/'.
+    
+    Listing "processed/orders/" only walks that directory's keys, while
+    "processed/orders" also matches every key starting with it, such as
+    "processed/orders_archive/", so LISTs can take orders of magnitude longer.
+    Keep every table prefix slash-terminated.
+    
+    Args:
+        prefix: S3 prefix
+        
+    Returns:
+        Prefix ending in '/' (or the empty prefix)
+    """
+    if prefix and not prefix.endswith("/"):
+        return f"{prefix}/"
+    return prefix
+
+
+@functools.lru_cache(maxsize=None)
+def _table_prefix(table_name: str) -> str:
+    """
+    Get the S3 key prefix for a table in the Silver layer.
+    
+    The value is memoized; call invalidate_table_cache after the config changes.
+    
+    Args:
+        table_name: Name of the table
+        
+    Returns:
+        Slash-terminated S3 key prefix for the table
+    """
+    return f"{get_silver_prefix()}{table_name}/"
 
 
 def get_s3tables_format() -> str:
@@ -53,30 +130,118 @@ def get_s3tables_format() -> str:
     return config.get("s3tables.format", "parquet")
 
 
+@functools.lru_cache(maxsize=1)
 def get_s3tables_compression() -> str:
     """
     Get the configured S3Tables compression.
     
+    The value is memoized; call invalidate_table_cache after the config changes.
+    
+    Returns:
+        S3Tables compression (e.g., 'zstd')
+    """
+    return config.get("s3tables.compression", "zstd")
+
+
+def get_s3tables_compression_level() -> int:
+    """
+    Get the configured S3Tables compression level.
+    
+    Returns:
+        Compression level, used by codecs that support levels (zstd, gzip, brotli)
+    """
+    return config.get("s3tables.compression_level", 3)
+
+
+def get_s3tables_row_group_size() -> int:
+    """
+    Get the configured number of rows per Parquet row group.
+    
+    Returns:
+        Rows per row group
+    """
+    return config.get("s3tables.row_group_size", 1_000_000)
+
+
+def get_s3tables_page_size() -> int:
+    """
+    Get the configured Parquet data page size.
+    
+    Returns:
+        Data page size in bytes
+    """
+    return config.get("s3tables.page_size", 1 << 20)
+
+
+def get_s3tables_stats_backend() -> str:
+    """
+    Get the configured row-count backend for table statistics.
+    
+    Returns:
+        Stats backend ('footer' or 's3select')
+    """
+    return config.get("s3tables.stats.backend", "footer")
+
+
+def _parquet_write_options() -> Dict[str, Any]:
+    """
+    Get the Parquet writer settings for Silver table files.
+    
+    Dictionary encoding and per-page statistics keep files small and let
+    filtered reads skip pages and row groups by their min/max values.
+    Timestamps are stored in microseconds, the precision Spark and Athena read.
+    
     Returns:
-        S3Tables compression (e.g., 'snappy')
+        Keyword arguments for pyarrow.parquet.write_table and
+        ParquetFileFormat.make_write_options
     """
-    return config.get("s3tables.compression", "snappy")
+    compression = get_s3tables_compression()
+    options = {
+        "compression": compression,
+        "use_dictionary": True,
+        "data_page_size": get_s3tables_page_size(),
+        "write_statistics": True,
+        "coerce_timestamps": "us",
+        "allow_truncated_timestamps": True,
+    }
+    
+    # Snappy and uncompressed files take no level
+    if (
+        compression
+        and compression.lower() not in ("none", "uncompressed")
+        and pa.Codec.supports_compression_level(compression)
+    ):
+        options["compression_level"] = get_s3tables_compression_level()
+    
+    return options
 
 
 def get_s3tables_partition_cols() -> List[str]:
     """
     Get the configured S3Tables partition columns.
     
+    The value is memoized; call invalidate_table_cache after the config changes.
+    
     Returns:
         List of partition column names
     """
-    return config.get("s3tables.partition_cols", [])
+    # Return a copy so callers can't change the memoized value
+    return list(_configured_partition_cols())
 
 
+@functools.lru_cache(maxsize=1)
+def _configured_partition_cols() -> Tuple[str, ...]:
+    """Read the configured partition columns once."""
+    return tuple(config.get("s3tables.partition_cols", None) or ())
+
+
+@functools.lru_cache(maxsize=None)
 def get_table_path(table_name: str) -> str:
     """
     Get the S3 path for a table in the Silver layer.
     
+    The value is memoized; call invalidate_table_cache after the config changes.
+    
     Args:
         table_name: Name of the table
         
@@ -88,10 +253,13 @@ def get_table_path(table_name: str) -> str:
     return f"s3://{bucket}/{prefix}{table_name}"
 
 
+@functools.lru_cache(maxsize=None)
 def get_table_metadata_path(table_name: str) -> str:
     """
     Get the S3 path for a table's metadata in the Silver layer.
     
+    The value is memoized; call invalidate_table_cache after the config changes.
+    
     Args:
         table_name: Name of the table
         
@@ -102,30 +270,259 @@ def get_table_metadata_path(table_name: str) -> str:
     return f"{table_path}/_metadata"
 
 
+def invalidate_table_cache() -> None:
+    """Forget the memoized Silver settings, table paths and table information, e.g. after the config is reloaded."""
+    for getter in (
+        get_silver_bucket,
+        get_silver_prefix,
+        get_s3tables_compression,
+        _configured_partition_cols,
+        _table_prefix,
+        get_table_path,
+        get_table_metadata_path,
+    ):
+        getter.cache_clear()
+    _forget_table()
+
+
+def _get_table_info(kind: str, table_name: str) -> Optional[Any]:
+    """
+    Get table information read within the last TABLE_INFO_TTL_SECONDS.
+    
+    Args:
+        kind: Kind of information (exists, schema or partitions)
+        table_name: Name of the table
+        
+    Returns:
+        Cached value, or None if there is none
+    """
+    with _table_info_lock:
+        cached = _table_info.get((kind, table_name))
+    
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def _set_table_info(kind: str, table_name: str, value: Any) -> None:
+    """
+    Cache table information for TABLE_INFO_TTL_SECONDS.
+    
+    Args:
+        kind: Kind of information (exists, schema or partitions)
+        table_name: Name of the table
+        value: Value to cache
+    """
+    with _table_info_lock:
+        _table_info[(kind, table_name)] = (time.monotonic() + TABLE_INFO_TTL_SECONDS, value)
+
+
+def _forget_table(table_name: Optional[str] = None) -> None:
+    """
+    Drop cached table information after a table is changed.
+    
+    Args:
+        table_name: Name of the table (default: all tables)
+    """
+    with _table_info_lock:
+        if table_name is None:
+            _table_info.clear()
+        else:
+            for key in [key for key in _table_info if key[1] == table_name]:
+                del _table_info[key]
+
+
+def _resolve_path(table_path: str) -> Tuple[pafs.FileSystem, str]:
+    """
+    Get the filesystem and filesystem path for a table path.
+    
+    s3:// paths use the shared S3 filesystem, built once, instead of one
+    resolved from the URI on every call.
+    
+    Args:
+        table_path: Table path or URI
+        
+    Returns:
+        Tuple of (PyArrow filesystem, path on that filesystem)
+    """
+    if table_path.startswith("s3://"):
+        return get_s3_filesystem(), table_path[len("s3://"):]
+    return pafs.FileSystem.from_uri(table_path)
+
+
+def _open_dataset(table_path: str) -> ds.Dataset:
+    """
+    Open a table as a Parquet dataset with Hive-style partitioning.
+    
+    The partition directories written by write_to_table become columns, so
+    filters on them prune whole partitions before any file is read.
+    
+    Args:
+        table_path: S3 path for the table
+        
+    Returns:
+        PyArrow Dataset
+    """
+    filesystem, path = _resolve_path(table_path)
+    return ds.dataset(path, filesystem=filesystem, format="parquet", partitioning="hive")
+
+
+def _to_arrow(
+    data: Union[pd.DataFrame, pa.Table],
+    schema: Optional[pa.Schema] = None,
+) -> pa.Table:
+    """
+    Convert a pandas DataFrame to a PyArrow Table once, on all cores.
+    
+    Args:
+        data: pandas DataFrame or PyArrow Table (returned as is)
+        schema: PyArrow schema to convert to (default: inferred)
+        
+    Returns:
+        PyArrow Table
+    """
+    if isinstance(data, pa.Table):
+        return data
+    
+    return pa.Table.from_pandas(data, schema=schema, preserve_index=False, nthreads=os.cpu_count())
+
+
+def _write_dataset(
+    table: Union[pa.Table, Iterable[pa.RecordBatch]],
+    table_path: str,
+    partition_cols: List[str],
+    row_group_size: Optional[int] = None,
+    schema: Optional[pa.Schema] = None,
+) -> None:
+    """
+    Write a table's rows as Parquet files, one or more per Hive partition.
+    
+    The dataset writer splits the rows by partition and writes the partition
+    files concurrently on the Arrow thread pool, so no Python thread pool is
+    needed. File names are unique per call, so appends never overwrite
+    earlier files. Rows are buffered into full row groups, so each group is
+    a large contiguous range that one ranged GET can fetch.
+    
+    Args:
+        table: Data to write, as a table or a stream of record batches
+        table_path: S3 path for the table
+        partition_cols: List of partition column names
+        row_group_size: Rows per row group (default: s3tables.row_group_size)
+        schema: Schema of the record batches (required for a stream)
+    """
+    row_group_size = row_group_size or get_s3tables_row_group_size()
+    filesystem, path = _resolve_path(table_path)
+    ds.write_dataset(
+        table,
+        path,
+        schema=schema,
+        filesystem=filesystem,
+        format="parquet",
+        partitioning=partition_cols or None,
+        partitioning_flavor="hive" if partition_cols else None,
+        file_options=ds.ParquetFileFormat().make_write_options(**_parquet_write_options()),
+        basename_template=f"{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        min_rows_per_group=row_group_size,
+        max_rows_per_group=row_group_size,
+        use_threads=True,
+    )
+
+
+def _scan_table(
+    table_name: str,
+    columns: Optional[List[str]] = None,
+    filter_expr: Optional[Expression] = None,
+    limit: Optional[int] = None,
+) -> pa.Table:
+    """
+    Read a table into a PyArrow Table, pushing the projection and filter into the scan.
+    
+    Only the requested columns are read, and partitions and row groups that
+    the filter rules out (by partition value or Parquet statistics) are skipped.
+    Tables with merge deltas are resolved first, since a delta can change
+    which rows match the filter.
+    
+    Args:
+        table_name: Name of the table
+        columns: List of columns to read
+        filter_expr: PyArrow filter expression
+        limit: Maximum number of rows to read
+        
+    Returns:
+        PyArrow Table with the table data
+    """
+    table_path = get_table_path(table_name)
+    
+    try:
+        # Open the dataset
+        dataset = _open_dataset(table_path)
+        
+        delta_files = _delta_files(table_path)
+        if delta_files:
+            dataset = ds.dataset(_apply_deltas(dataset.to_table(), table_path, delta_files))
+        
+        # Create a scanner with the specified options; pre-buffering coalesces
+        # each file's column-chunk reads into a few concurrent ranged GETs
+        scanner = Scanner.from_dataset(
+            dataset,
+            columns=columns,
+            filter=filter_expr,
+            batch_size=SCAN_BATCH_SIZE,
+            batch_readahead=SCAN_BATCH_READAHEAD,
+            fragment_readahead=SCAN_FRAGMENT_READAHEAD,
+            fragment_scan_options=ds.ParquetFragmentScanOptions(pre_buffer=True),
+            use_threads=True,
+        )
+        
+        # Read the data
+        if limit:
+            return scanner.head(limit)
+        return scanner.to_table()
+    except Exception as e:
+        raise DataError(
+            message=f"Failed to read from table {table_name}: {str(e)}",
+            source="s3tables",
+            table=table_name,
+        ) from e
+
+
 @handle_aws_error(service="s3")
 def table_exists(table_name: str) -> bool:
     """
     Check if a table exists in the Silver layer.
     
+    A single one-key listing of the table prefix answers this, and the
+    result is reused for TABLE_INFO_TTL_SECONDS.
+    
     Args:
         table_name: Name of the table
         
     Returns:
         True if the table exists, False otherwise
     """
+    exists = _get_table_info("exists", table_name)
+    if exists is not None:
+        return exists
+    
     try:
-        # Try to open the dataset
-        ds.dataset(get_table_path(table_name))
-        return True
-    except (FileNotFoundError, pa.ArrowInvalid):
-        return False
-    except Exception as e:
+        response = get_s3_client().list_objects_v2(
+            Bucket=get_silver_bucket(),
+            Prefix=_table_prefix(table_name),
+            MaxKeys=1,
+        )
+    except ClientError as e:
         logger.warning(
             "Error checking if table exists",
             table_name=table_name,
             error=str(e),
         )
         return False
+    
+    exists = response.get("KeyCount", 0) > 0
+    _set_table_info("exists", table_name, exists)
+    
+    return exists
 
 
 @handle_aws_error(service="s3")
@@ -153,28 +550,20 @@ def create_table(
     
     # Create an empty dataset with the specified schema
     if schema:
-        # Create an empty DataFrame with the schema
-        empty_df = pd.DataFrame()
-        for field in schema:
-            empty_df[field.name] = pd.Series(dtype=field.type.to_pandas_dtype())
-        
-        # Convert to PyArrow Table
-        table = pa.Table.from_pandas(empty_df, schema=schema)
+        # Create an empty table directly in Arrow, keeping the exact column types
+        table = schema.empty_table()
         
         # Write to S3
-        pq.write_to_dataset(
-            table,
-            table_path,
-            partition_cols=partition_cols,
-            compression=get_s3tables_compression(),
-        )
+        _write_dataset(table, table_path, partition_cols)
     else:
         # Create an empty directory structure
-        s3 = boto3.client("s3", region_name=config.get("aws.region"))
+        s3 = get_s3_client()
         bucket = get_silver_bucket()
-        prefix = f"{get_silver_prefix()}{table_name}/"
+        prefix = _table_prefix(table_name)
         s3.put_object(Bucket=bucket, Key=prefix)
     
+    _forget_table(table_name)
+    
     logger.info(
         "Table created",
         table_name=table_name,
@@ -190,18 +579,25 @@ def get_table_schema(table_name: str) -> pa.Schema:
     """
     Get the schema of a table in the Silver layer.
     
+    The schema is reused for TABLE_INFO_TTL_SECONDS.
+    
     Args:
         table_name: Name of the table
         
     Returns:
         PyArrow schema for the table
     """
+    schema = _get_table_info("schema", table_name)
+    if schema is not None:
+        return schema
+    
     table_path = get_table_path(table_name)
     
     try:
         # Open the dataset and get the schema
-        dataset = ds.dataset(table_path)
-        return dataset.schema
+        schema = _open_dataset(table_path).schema
+        _set_table_info("schema", table_name, schema)
+        return schema
     except Exception as e:
         raise DataError(
             message=f"Failed to get schema for table {table_name}: {str(e)}",
@@ -217,16 +613,21 @@ def write_to_table(
     partition_cols: Optional[List[str]] = None,
     mode: str = "append",
     schema: Optional[pa.Schema] = None,
+    row_group_size: Optional[int] = None,
 ) -> str:
     """
     Write data to a table in the Silver layer.
     
+    Appending to a table with pending merge deltas compacts it first, so
+    the deltas are never resolved against rows written after them.
+    
     Args:
         table_name: Name of the table
         data: Data to write (pandas DataFrame or PyArrow Table)
         partition_cols: List of partition column names
         mode: Write mode ('append' or 'overwrite')
         schema: PyArrow schema for the table (used if table doesn't exist)
+        row_group_size: Rows per Parquet row group (default: s3tables.row_group_size)
         
     Returns:
         S3 path for the table
@@ -238,40 +639,26 @@ def write_to_table(
         partition_cols = get_s3tables_partition_cols()
     
     # Convert pandas DataFrame to PyArrow Table if necessary
-    if isinstance(data, pd.DataFrame):
-        if schema:
-            table = pa.Table.from_pandas(data, schema=schema)
-        else:
-            table = pa.Table.from_pandas(data)
-    else:
-        table = data
+    table = _to_arrow(data, schema)
     
     # Check if the table exists
     exists = table_exists(table_name)
     
     if not exists:
-        # Create the table if it doesn't exist
-        if schema:
-            create_table(table_name, schema, partition_cols)
-        else:
-            create_table(table_name, table.schema, partition_cols)
+        # Create the table if it doesn't exist, reusing the converted schema
+        create_table(table_name, schema or table.schema, partition_cols)
     
     # Write to the table
     if mode == "overwrite":
         # Delete existing data
-        s3 = boto3.resource("s3", region_name=config.get("aws.region"))
-        bucket = get_silver_bucket()
-        prefix = f"{get_silver_prefix()}{table_name}/"
-        
-        s3.Bucket(bucket).objects.filter(Prefix=prefix).delete()
+        delete_prefix(_table_prefix(table_name), get_silver_bucket())
+    else:
+        # Pending merge deltas must not apply to rows appended after them
+        compact_table(table_name)
     
     # Write the data
-    pq.write_to_dataset(
-        table,
-        table_path,
-        partition_cols=partition_cols,
-        compression=get_s3tables_compression(),
-    )
+    _write_dataset(table, table_path, partition_cols, row_group_size)
+    _forget_table(table_name)
     
     logger.info(
         "Data written to table",
@@ -285,62 +672,126 @@ def write_to_table(
     return table_path
 
 
+@handle_aws_error(service="s3")
+def write_batches(
+    table_name: str,
+    batches: Iterable[Union[pd.DataFrame, pa.Table, pa.RecordBatch]],
+    partition_cols: Optional[List[str]] = None,
+    schema: Optional[pa.Schema] = None,
+    row_group_size: Optional[int] = None,
+) -> Tuple[str, int]:
+    """
+    Append a stream of batches to a table in the Silver layer in one write.
+    
+    The table is checked and created once, and all batches go through a
+    single dataset write, instead of paying those costs per batch with
+    write_to_table. Batches are consumed as they arrive, so a generator
+    never has to be held in memory as a whole. As with write_to_table,
+    pending merge deltas are compacted before the append.
+    
+    Args:
+        table_name: Name of the table
+        batches: pandas DataFrames, PyArrow Tables or RecordBatches
+        partition_cols: List of partition column names
+        schema: PyArrow schema of the batches (default: the first batch's)
+        row_group_size: Rows per Parquet row group (default: s3tables.row_group_size)
+        
+    Returns:
+        Tuple of (table path, number of rows written)
+    """
+    table_path = get_table_path(table_name)
+    
+    # Use default partition columns if not specified
+    if partition_cols is None:
+        partition_cols = get_s3tables_partition_cols()
+    
+    def to_record_batches(batch: Union[pd.DataFrame, pa.Table, pa.RecordBatch]) -> List[pa.RecordBatch]:
+        if isinstance(batch, pa.RecordBatch):
+            return [batch]
+        return _to_arrow(batch, schema).to_batches()
+    
+    record_batches = itertools.chain.from_iterable(map(to_record_batches, batches))
+    
+    # Take the schema from the first batch if none is given
+    first = next(record_batches, None)
+    if first is None:
+        return table_path, 0
+    schema = schema or first.schema
+    
+    if not table_exists(table_name):
+        create_table(table_name, schema, partition_cols)
+    else:
+        # Pending merge deltas must not apply to rows appended after them
+        compact_table(table_name)
+    
+    rows_written = 0
+    
+    def counted(stream: Iterator[pa.RecordBatch]) -> Iterator[pa.RecordBatch]:
+        nonlocal rows_written
+        for batch in stream:
+            rows_written += batch.num_rows
+            yield batch
+    
+    _write_dataset(
+        counted(itertools.chain([first], record_batches)),
+        table_path,
+        partition_cols,
+        row_group_size,
+        schema=schema,
+    )
+    _forget_table(table_name)
+    
+    logger.info(
+        "Batches written to table",
+        table_name=table_name,
+        table_path=table_path,
+        rows=rows_written,
+        columns=schema.names,
+    )
+    
+    return table_path, rows_written
+
+
 @handle_aws_error(service="s3")
 def read_from_table(
     table_name: str,
     columns: Optional[List[str]] = None,
     filter_expr: Optional[Expression] = None,
     limit: Optional[int] = None,
-) -> pd.DataFrame:
+    as_arrow: bool = False,
+) -> Union[pd.DataFrame, pa.Table]:
     """
     Read data from a table in the Silver layer.
     
+    Pass columns and filter_expr to read only what is needed; both are pushed
+    down into the Parquet scan.
+    
     Args:
         table_name: Name of the table
         columns: List of columns to read
         filter_expr: PyArrow filter expression
         limit: Maximum number of rows to read
+        as_arrow: Return the PyArrow Table as scanned, skipping the pandas
+            conversion, e.g. when the data is written straight back out
         
     Returns:
-        pandas DataFrame with the table data
+        pandas DataFrame (or PyArrow Table if as_arrow) with the table data
     """
-    table_path = get_table_path(table_name)
+    table = _scan_table(table_name, columns, filter_expr, limit)
     
-    try:
-        # Open the dataset
-        dataset = ds.dataset(table_path)
-        
-        # Create a scanner with the specified options
-        scanner = Scanner.from_dataset(
-            dataset,
-            columns=columns,
-            filter=filter_expr,
-        )
-        
-        # Read the data
-        if limit:
-            table = scanner.head(limit)
-        else:
-            table = scanner.to_table()
-        
-        # Convert to pandas DataFrame
-        df = table.to_pandas()
-        
-        logger.info(
-            "Data read from table",
-            table_name=table_name,
-            table_path=table_path,
-            rows=len(df),
-            columns=list(df.columns),
-        )
-        
-        return df
-    except Exception as e:
-        raise DataError(
-            message=f"Failed to read from table {table_name}: {str(e)}",
-            source="s3tables",
-            table=table_name,
-        ) from e
+    logger.info(
+        "Data read from table",
+        table_name=table_name,
+        table_path=get_table_path(table_name),
+        rows=len(table),
+        columns=table.column_names,
+    )
+    
+    if as_arrow:
+        return table
+    
+    # Convert to pandas DataFrame, releasing the Arrow buffers as columns are converted
+    return table.to_pandas(self_destruct=True, split_blocks=True)
 
 
 @handle_aws_error(service="s3")
@@ -348,32 +799,43 @@ def get_table_partitions(table_name: str) -> List[Dict[str, str]]:
     """
     Get the partitions of a table in the Silver layer.
     
+    Partitions are parsed from the key=value directories of the file paths
+    found by the dataset listing, so no file is opened. The partition list
+    is reused for TABLE_INFO_TTL_SECONDS.
+    
     Args:
         table_name: Name of the table
         
     Returns:
         List of partition dictionaries
     """
+    cached = _get_table_info("partitions", table_name)
+    if cached is not None:
+        return [dict(partition) for partition in cached]
+    
     table_path = get_table_path(table_name)
     
     try:
         # Open the dataset
-        dataset = ds.dataset(table_path)
+        dataset = _open_dataset(table_path)
+        _, root = _resolve_path(table_path)
         
-        # Get the partition expressions
+        # Collect each distinct partition once, in listing order
+        seen = set()
         partitions = []
-        for fragment in dataset.get_fragments():
-            partition_dict = {}
-            for expr in fragment.partition_expression:
-                # Extract the partition key and value
-                if isinstance(expr, ds.FieldExpression):
-                    key = expr.field_name
-                    value = str(expr.value)
-                    partition_dict[key] = value
+        for file_path in dataset.files:
+            directories = file_path[len(root):].strip("/").split("/")[:-1]
+            partition = tuple(
+                tuple(unquote(part) for part in directory.split("=", 1))
+                for directory in directories
+                if "=" in directory
+            )
             
-            if partition_dict:
-                partitions.append(partition_dict)
+            if partition and partition not in seen:
+                seen.add(partition)
+                partitions.append(dict(partition))
         
+        _set_table_info("partitions", table_name, [dict(partition) for partition in partitions])
         return partitions
     except Exception as e:
         raise DataError(
@@ -391,12 +853,12 @@ def delete_table(table_name: str) -> None:
     Args:
         table_name: Name of the table
     """
-    s3 = boto3.resource("s3", region_name=config.get("aws.region"))
     bucket = get_silver_bucket()
-    prefix = f"{get_silver_prefix()}{table_name}/"
+    prefix = _table_prefix(table_name)
     
     # Delete all objects with the table prefix
-    s3.Bucket(bucket).objects.filter(Prefix=prefix).delete()
+    delete_prefix(prefix, bucket)
+    _forget_table(table_name)
     
     logger.info(
         "Table deleted",
@@ -406,47 +868,221 @@ def delete_table(table_name: str) -> None:
     )
 
 
+def _list_usage(s3, bucket: str, prefix: str) -> Tuple[int, int]:
+    """
+    Total the objects under a prefix with one paginated listing.
+    
+    Args:
+        s3: boto3 S3 client
+        bucket: S3 bucket name
+        prefix: S3 prefix
+        
+    Returns:
+        Tuple of (total size in bytes, number of objects)
+    """
+    size_bytes = 0
+    file_count = 0
+    
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": 1000}):
+        for obj in page.get("Contents", ()):
+            size_bytes += obj["Size"]
+            file_count += 1
+    
+    return size_bytes, file_count
+
+
+def _prefix_usage(bucket: str, prefix: str, max_workers: int = 32) -> Tuple[int, int]:
+    """
+    Total the objects under a prefix, listing its sub-prefixes concurrently.
+    
+    A delimited listing splits a partitioned table into its top-level
+    partitions, which are then listed in parallel instead of as one long
+    chain of 1000-key pages.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: Slash-terminated S3 prefix
+        max_workers: Maximum number of concurrent listings
+        
+    Returns:
+        Tuple of (total size in bytes, number of objects)
+    """
+    s3 = get_s3_client()
+    size_bytes = 0
+    file_count = 0
+    sub_prefixes = []
+    
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        Delimiter="/",
+        PaginationConfig={"PageSize": 1000},
+    )
+    for page in pages:
+        # Objects directly under the prefix
+        for obj in page.get("Contents", ()):
+            size_bytes += obj["Size"]
+            file_count += 1
+        sub_prefixes.extend(common_prefix["Prefix"] for common_prefix in page.get("CommonPrefixes", ()))
+    
+    if not sub_prefixes:
+        return size_bytes, file_count
+    
+    # Never use more threads than the client has pooled connections
+    max_workers = max(1, min(max_workers, len(sub_prefixes), MAX_POOL_CONNECTIONS))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for sub_size, sub_count in executor.map(lambda sub: _list_usage(s3, bucket, sub), sub_prefixes):
+            size_bytes += sub_size
+            file_count += sub_count
+    
+    return size_bytes, file_count
+
+
+def _count_rows(dataset: ds.Dataset, max_workers: int = 32) -> int:
+    """
+    Count a dataset's rows from its Parquet footers, without reading any data.
+    
+    Each file's row count is stored in its footer, so one small ranged GET
+    per file is enough. The footers are fetched concurrently.
+    
+    Args:
+        dataset: PyArrow Dataset
+        max_workers: Maximum number of concurrent footer reads
+        
+    Returns:
+        Number of rows
+    """
+    if not isinstance(dataset, ds.FileSystemDataset) or not isinstance(dataset.format, ds.ParquetFileFormat):
+        return dataset.count_rows()
+    
+    fragments = list(dataset.get_fragments())
+    if not fragments:
+        return 0
+    
+    # Never use more threads than the client has pooled connections
+    max_workers = max(1, min(max_workers, len(fragments), MAX_POOL_CONNECTIONS))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(lambda fragment: fragment.metadata.num_rows, fragments))
+
+
+def _select_count(s3, bucket: str, key: str) -> int:
+    """
+    Count the rows of one Parquet object with S3 Select.
+    
+    Args:
+        s3: boto3 S3 client
+        bucket: S3 bucket name
+        key: S3 object key
+        
+    Returns:
+        Number of rows
+    """
+    response = s3.select_object_content(
+        Bucket=bucket,
+        Key=key,
+        ExpressionType="SQL",
+        Expression="SELECT COUNT(*) FROM S3Object",
+        InputSerialization={"Parquet": {}},
+        OutputSerialization={"JSON": {}},
+    )
+    
+    # The result is streamed as events; the records may arrive in several chunks,
+    # and the unnamed aggregate comes back as {"_1": <count>}
+    payload = b"".join(event["Records"]["Payload"] for event in response["Payload"] if "Records" in event)
+    return sum(json.loads(line)["_1"] for line in payload.splitlines() if line.strip())
+
+
+def _select_count_rows(bucket: str, prefix: str, max_workers: int = 32) -> int:
+    """
+    Count the rows of a table's data files with concurrent S3 Select queries.
+    
+    Files under directories starting with "_" (such as merge deltas) are not
+    part of the base dataset and are skipped, as the dataset reader does.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: Slash-terminated table prefix
+        max_workers: Maximum number of concurrent queries
+        
+    Returns:
+        Number of rows
+    """
+    keys = [
+        obj["Key"] for obj in iter_objects(bucket, prefix, suffix=".parquet")
+        if not any(part.startswith(("_", ".")) for part in obj["Key"][len(prefix):].split("/"))
+    ]
+    if not keys:
+        return 0
+    
+    s3 = get_s3_client()
+    
+    # Never use more threads than the client has pooled connections
+    max_workers = max(1, min(max_workers, len(keys), MAX_POOL_CONNECTIONS))
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return sum(executor.map(lambda key: _select_count(s3, bucket, key), keys))
+
+
 @handle_aws_error(service="s3")
-def get_table_stats(table_name: str) -> Dict[str, Any]:
+def get_table_stats(table_name: str, stats_backend: Optional[str] = None) -> Dict[str, Any]:
     """
     Get statistics for a table in the Silver layer.
     
+    The row count comes from the Parquet footers, or with
+    stats_backend='s3select' from an S3 Select COUNT(*) per file, which
+    moves no file data to the client. If S3 Select is not available to the
+    account, the footer count is used instead.
+    
     Args:
         table_name: Name of the table
+        stats_backend: Row-count backend (default: s3tables.stats.backend)
         
     Returns:
         Dictionary with table statistics
+        
+    Raises:
+        ConfigurationError: If the stats backend is unknown
     """
     table_path = get_table_path(table_name)
+    stats_backend = stats_backend or get_s3tables_stats_backend()
+    if stats_backend not in STATS_BACKENDS:
+        raise ConfigurationError(
+            message=f"Unknown stats backend {stats_backend!r}, expected one of {', '.join(STATS_BACKENDS)}",
+            config_key="s3tables.stats.backend",
+        )
     
     try:
         # Open the dataset
-        dataset = ds.dataset(table_path)
+        dataset = _open_dataset(table_path)
         
         # Get the schema
         schema = dataset.schema
         
-        # Count the rows
-        scanner = Scanner.from_dataset(dataset)
-        row_count = scanner.count_rows()
+        # Count the rows; merge deltas can add rows, so resolve them first
+        row_count = None
+        if _delta_files(table_path):
+            row_count = _scan_table(table_name).num_rows
+        elif stats_backend == "s3select":
+            try:
+                row_count = _select_count_rows(get_silver_bucket(), _table_prefix(table_name))
+            except ClientError as e:
+                logger.warning(
+                    "S3 Select unavailable, counting rows from Parquet footers",
+                    table=table_name,
+                    error=str(e),
+                )
+        if row_count is None:
+            row_count = _count_rows(dataset)
         
         # Get the partitions
         partitions = get_table_partitions(table_name)
         
         # Get the size
-        s3 = boto3.client("s3", region_name=config.get("aws.region"))
-        bucket = get_silver_bucket()
-        prefix = f"{get_silver_prefix()}{table_name}/"
-        
-        size_bytes = 0
-        file_count = 0
-        
-        paginator = s3.get_paginator("list_objects_v2")
-        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-            if "Contents" in page:
-                for obj in page["Contents"]:
-                    size_bytes += obj["Size"]
-                    file_count += 1
+        size_bytes, file_count = _prefix_usage(get_silver_bucket(), _table_prefix(table_name))
         
         # Return the statistics
         return {
@@ -477,7 +1113,7 @@ def list_tables() -> List[str]:
     Returns:
         List of table names
     """
-    s3 = boto3.client("s3", region_name=config.get("aws.region"))
+    s3 = get_s3_client()
     bucket = get_silver_bucket()
     prefix = get_silver_prefix()
     
@@ -485,7 +1121,14 @@ def list_tables() -> List[str]:
     paginator = s3.get_paginator("list_objects_v2")
     tables = set()
     
-    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter="/"):
+    pages = paginator.paginate(
+        Bucket=bucket,
+        Prefix=prefix,
+        Delimiter="/",
+        PaginationConfig={"PageSize": 1000},
+    )
+    
+    for page in pages:
         if "CommonPrefixes" in page:
             for common_prefix in page["CommonPrefixes"]:
                 # Extract the table name from the prefix
@@ -535,13 +1178,13 @@ def copy_table(
             table=dest_table,
         )
     
-    # Read from the source table
-    df = read_from_table(source_table)
+    # Read from the source table, staying in Arrow since no pandas work is needed
+    table = read_from_table(source_table, as_arrow=True)
     
     # Write to the destination table
     table_path = write_to_table(
         dest_table,
-        df,
+        table,
         mode="overwrite" if overwrite else "append",
     )
     
@@ -550,12 +1193,222 @@ def copy_table(
         source_table=source_table,
         dest_table=dest_table,
         table_path=table_path,
-        rows=len(df),
+        rows=len(table),
     )
     
     return table_path
 
 
+def _merge_arrow(
+    dest: pa.Table,
+    source: pa.Table,
+    join_columns: List[str],
+    update_columns: List[str],
+) -> pa.Table:
+    """
+    Upsert source rows into a destination table on the join columns.
+    
+    Matched rows get the update columns from the source, with the last source
+    row winning when a key repeats; unmatched source rows are appended. The
+    hash joins only carry the key columns and row numbers, so any column type
+    can be merged, and the rows are then gathered with take.
+    
+    Args:
+        dest: Destination table
+        source: Source table
+        join_columns: List of columns to join on
+        update_columns: List of columns to update
+        
+    Returns:
+        Merged PyArrow Table
+    """
+    # Join on the keys only, with the source keys in the destination's types
+    dest_keys = dest.select(join_columns).append_column("__dest_idx", pa.array(range(len(dest)), pa.int64()))
+    source_keys = pa.table(
+        [source[col].cast(dest.schema.field(col).type) for col in join_columns]
+        + [pa.array(range(len(source)), pa.int64())],
+        names=join_columns + ["__src_idx"],
+    )
+    
+    # The last row of each key, on both sides
+    # (group_by names the aggregate "<column>_max")
+    dest_last = dest_keys.group_by(join_columns).aggregate([("__dest_idx", "max")])
+    src_last = source_keys.group_by(join_columns).aggregate([("__src_idx", "max")])
+    
+    # Pair each matched key's last source row with its last destination row
+    pairs = src_last.join(dest_last, keys=join_columns, join_type="inner").select(["__dest_idx_max", "__src_idx_max"])
+    
+    # For every destination row, the position to gather its values from: itself,
+    # or its paired source row placed after the destination rows
+    positions = dest_keys.select(["__dest_idx"]).join(
+        pairs,
+        keys="__dest_idx",
+        right_keys="__dest_idx_max",
+        join_type="left outer",
+    ).sort_by("__dest_idx")
+    gather = pc.if_else(
+        pc.is_valid(positions["__src_idx_max"]),
+        pc.add(positions["__src_idx_max"], len(dest)),
+        positions["__dest_idx"],
+    )
+    
+    # Update existing rows in place, keeping the destination row order
+    merged = dest
+    for col in update_columns:
+        if col not in dest.column_names or col not in source.column_names:
+            continue
+        field = dest.schema.field(col)
+        values = pa.chunked_array(dest[col].chunks + source[col].cast(field.type).chunks, field.type)
+        merged = merged.set_column(merged.schema.get_field_index(col), field, values.take(gather))
+    
+    # Append the unmatched source rows, in source order
+    new_positions = source_keys.join(dest_last.select(join_columns), keys=join_columns, join_type="left anti")
+    if not len(new_positions):
+        return merged
+    new_rows = source.take(new_positions.sort_by("__src_idx")["__src_idx"])
+    
+    # Columns missing on either side are filled with nulls
+    fields = list(merged.schema) + [field for field in new_rows.schema if field.name not in merged.column_names]
+    schema = pa.schema(fields, metadata=dest.schema.metadata)
+    
+    def conform(table: pa.Table) -> pa.Table:
+        return pa.table(
+            [
+                table[field.name].cast(field.type) if field.name in table.column_names
+                else pa.nulls(len(table), field.type)
+                for field in schema
+            ],
+            schema=schema,
+        )
+    
+    return pa.concat_tables([conform(merged), conform(new_rows)])
+
+
+def _delta_files(table_path: str) -> List[str]:
+    """
+    List a table's merge delta files, oldest first.
+    
+    Args:
+        table_path: S3 path for the table
+        
+    Returns:
+        Delta file paths on the table's filesystem
+    """
+    filesystem, path = _resolve_path(f"{table_path}/{DELTA_DIR}")
+    infos = filesystem.get_file_info(pafs.FileSelector(path, recursive=True, allow_not_found=True))
+    
+    # Delta directories are named by UTC timestamp, so path order is write order
+    return sorted(
+        info.path for info in infos
+        if info.type == pafs.FileType.File and info.path.endswith(".parquet")
+    )
+
+
+def _apply_deltas(
+    table: pa.Table,
+    table_path: str,
+    delta_files: List[str],
+) -> pa.Table:
+    """
+    Resolve a table's merge deltas on top of its base data, oldest first.
+    
+    Args:
+        table: Base table data
+        table_path: S3 path for the table
+        delta_files: Delta file paths from _delta_files
+        
+    Returns:
+        PyArrow Table with the deltas applied
+    """
+    filesystem, _ = _resolve_path(table_path)
+    
+    for path in delta_files:
+        delta = pq.read_table(path, filesystem=filesystem)
+        metadata = delta.schema.metadata
+        table = _merge_arrow(
+            table,
+            delta.replace_schema_metadata(None),
+            json.loads(metadata[b"join_columns"]),
+            json.loads(metadata[b"update_columns"]),
+        )
+    
+    return table
+
+
+def _check_merge(
+    source: pa.Table,
+    dest_schema: pa.Schema,
+    dest_table: str,
+    join_columns: List[str],
+    update_columns: List[str],
+) -> pa.Table:
+    """
+    Check that source rows can be merged into a destination table.
+    
+    Args:
+        source: Source rows
+        dest_schema: Schema of the destination table
+        dest_table: Name of the destination table
+        join_columns: List of columns to join on
+        update_columns: List of columns to update
+        
+    Returns:
+        Source rows with the join columns cast to the destination key types
+        
+    Raises:
+        ValidationError: If a column is missing or a key type does not match
+    """
+    if not join_columns:
+        raise ValidationError(
+            message="At least one join column is required",
+            source="s3tables",
+            table=dest_table,
+            validation_rule="join_columns",
+        )
+    
+    for col in join_columns:
+        if col not in source.column_names or col not in dest_schema.names:
+            raise ValidationError(
+                message=f"Join column {col} must exist in both the source and table {dest_table}",
+                source="s3tables",
+                table=dest_table,
+                column=col,
+                validation_rule="join_columns",
+            )
+    
+    for col in update_columns:
+        if col not in source.column_names:
+            raise ValidationError(
+                message=f"Update column {col} does not exist in the source",
+                source="s3tables",
+                table=dest_table,
+                column=col,
+                validation_rule="update_columns",
+            )
+    
+    # Store the keys with the destination's types, so resolving the delta joins like with like
+    for col in join_columns:
+        dest_type = dest_schema.field(col).type
+        if source.schema.field(col).type == dest_type:
+            continue
+        try:
+            key = source[col].cast(dest_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValidationError(
+                message=(
+                    f"Join column {col} has type {source.schema.field(col).type} in the source "
+                    f"but {dest_type} in table {dest_table}"
+                ),
+                source="s3tables",
+                table=dest_table,
+                column=col,
+                validation_rule="key_type",
+            ) from e
+        source = source.set_column(source.schema.get_field_index(col), pa.field(col, dest_type), key)
+    
+    return source
+
+
 @handle_aws_error(service="s3")
 def merge_tables(
     source_table: str,
@@ -566,6 +1419,11 @@ def merge_tables(
     """
     Merge data from a source table into a destination table.
     
+    The source rows are appended to the destination as a delta file under
+    _deltas/ instead of rewriting the destination, so a merge writes only the
+    merged rows. Reads resolve the deltas; compact_table folds them back
+    into the base data.
+    
     Args:
         source_table: Name of the source table
         dest_table: Name of the destination table
@@ -574,6 +1432,9 @@ def merge_tables(
         
     Returns:
         Tuple of (table path, number of rows updated)
+        
+    Raises:
+        ValidationError: If the join or update columns don't fit the tables
     """
     # Check if the source table exists
     if not table_exists(source_table):
@@ -591,53 +1452,85 @@ def merge_tables(
             table=dest_table,
         )
     
-    # Read from the source and destination tables
-    source_df = read_from_table(source_table)
-    dest_df = read_from_table(dest_table)
+    # Read from the source table
+    source = _scan_table(source_table)
     
     # Determine the columns to update
     if update_columns is None:
-        update_columns = [col for col in source_df.columns if col not in join_columns]
-    
-    # Perform the merge
-    merged_df = dest_df.copy()
-    rows_updated = 0
-    
-    # Create a dictionary to map join column values to row indices
-    join_dict = {}
-    for i, row in dest_df.iterrows():
-        key = tuple(row[col] for col in join_columns)
-        join_dict[key] = i
-    
-    # Update the destination DataFrame with values from the source DataFrame
-    for _, row in source_df.iterrows():
-        key = tuple(row[col] for col in join_columns)
-        
-        if key in join_dict:
-            # Update existing row
-            idx = join_dict[key]
-            for col in update_columns:
-                if col in row and col in merged_df:
-                    merged_df.at[idx, col] = row[col]
-            rows_updated += 1
-        else:
-            # Insert new row
-            merged_df = pd.concat([merged_df, pd.DataFrame([row])], ignore_index=True)
-            rows_updated += 1
+        update_columns = [col for col in source.column_names if col not in join_columns]
     
-    # Write the merged DataFrame back to the destination table
-    table_path = write_to_table(
-        dest_table,
-        merged_df,
-        mode="overwrite",
+    # Reject a merge that could not be resolved before it is written, since a
+    # bad delta would otherwise fail every later read of the destination
+    source = _check_merge(source, get_table_schema(dest_table), dest_table, join_columns, update_columns)
+    
+    # Record how to resolve the delta in its own schema metadata
+    metadata = dict(source.schema.metadata or {})
+    metadata[b"join_columns"] = json.dumps(join_columns).encode()
+    metadata[b"update_columns"] = json.dumps(update_columns).encode()
+    source = source.replace_schema_metadata(metadata)
+    
+    # Write the source rows as a new delta file
+    table_path = get_table_path(dest_table)
+    written_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    delta_path = f"{table_path}/{DELTA_DIR}/ts={written_at}/{uuid.uuid4().hex}.parquet"
+    filesystem, path = _resolve_path(delta_path)
+    if isinstance(filesystem, pafs.LocalFileSystem):
+        # S3 has no directories, but a local table needs the delta directory created
+        filesystem.create_dir(path.rsplit("/", 1)[0], recursive=True)
+    pq.write_table(
+        source,
+        path,
+        filesystem=filesystem,
+        row_group_size=get_s3tables_row_group_size(),
+        **_parquet_write_options(),
     )
+    _forget_table(dest_table)
+    rows_updated = len(source)
     
     logger.info(
         "Tables merged",
         source_table=source_table,
         dest_table=dest_table,
         table_path=table_path,
+        delta_path=delta_path,
         rows_updated=rows_updated,
     )
     
-    return table_path, rows_updated
\ No newline at end of file
+    return table_path, rows_updated
+
+
+@handle_aws_error(service="s3")
+def compact_table(table_name: str) -> str:
+    """
+    Fold a table's merge deltas into its base data.
+    
+    The resolved table is rewritten once and the delta files are removed,
+    so reads no longer pay for resolving them.
+    
+    Args:
+        table_name: Name of the table
+        
+    Returns:
+        S3 path for the table
+    """
+    table_path = get_table_path(table_name)
+    
+    if not _delta_files(table_path):
+        return table_path
+    
+    # Keep the table's own partitioning, which may differ from the configured default
+    partitions = get_table_partitions(table_name)
+    partition_cols = list(partitions[0]) if partitions else []
+    
+    # Overwriting clears everything under the table prefix, deltas included
+    table = _scan_table(table_name)
+    write_to_table(table_name, table, partition_cols=partition_cols, mode="overwrite")
+    
+    logger.info(
+        "Table compacted",
+        table_name=table_name,
+        table_path=table_path,
+        rows=len(table),
+    )
+    
+    return table_path
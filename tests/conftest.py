@@ -0,0 +1,36 @@
+"""
+Shared fixtures for the unit tests.
+"""
+import shutil
+
+import pytest
+
+from src.utils import s3tables_utils
+
+
+@pytest.fixture
+def local_silver(tmp_path, monkeypatch):
+    """
+    Point the Silver layer at a local directory instead of S3.
+    
+    Table paths resolve under tmp_path, and the S3 listing and delete calls
+    are replaced with their local equivalents.
+    
+    Returns:
+        Root directory of the local Silver layer
+    """
+    def table_dir(table_name):
+        return tmp_path / s3tables_utils._table_prefix(table_name)
+    
+    monkeypatch.setattr(s3tables_utils, "get_table_path", lambda table_name: str(table_dir(table_name)).rstrip("/"))
+    monkeypatch.setattr(s3tables_utils, "table_exists", lambda table_name: table_dir(table_name).is_dir())
+    monkeypatch.setattr(
+        s3tables_utils,
+        "delete_prefix",
+        lambda prefix, bucket=None: shutil.rmtree(tmp_path / prefix, ignore_errors=True),
+    )
+    s3tables_utils._forget_table()
+    
+    yield tmp_path
+    
+    s3tables_utils._forget_table()
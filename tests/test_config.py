@@ -0,0 +1,26 @@
+"""
+Tests for the configuration manager.
+"""
+from src.config.config import CACHE_DIR_ENV, DEFAULT_CONFIG_PATH, Config
+
+
+def test_parse_cache_is_written_outside_the_package(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    
+    config = Config()
+    
+    assert config.cache_path.parent == tmp_path
+    assert config.cache_path.exists()
+    assert not list(DEFAULT_CONFIG_PATH.parent.glob("settings.yaml.*"))
+    assert Config().config == config.config
+
+
+def test_corrupt_parse_cache_falls_back_to_yaml(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    expected = Config().config
+    
+    cache_path = Config().cache_path
+    header = cache_path.read_bytes()[:16]
+    cache_path.write_bytes(header + b"\x00not marshal data")
+    
+    assert Config().config == expected
@@ -0,0 +1,28 @@
+"""
+Tests for the custom exceptions.
+"""
+import pickle
+
+from src.errors import GlueETLError, S3Error
+
+
+def test_to_dict_returns_an_independent_current_dict():
+    error = GlueETLError("first", error_code="CODE")
+    
+    error.to_dict()["extra"] = True
+    error.message = "second"
+    
+    assert error.to_dict() == {
+        "error_type": "GlueETLError",
+        "error_code": "CODE",
+        "message": "second",
+        "details": {},
+    }
+
+
+def test_errors_survive_pickling():
+    error = S3Error("missing", bucket="bucket", key="key")
+    
+    restored = pickle.loads(pickle.dumps(error))
+    
+    assert restored.to_dict() == error.to_dict()
@@ -0,0 +1,14 @@
+"""
+Tests for the error handlers.
+"""
+import pytest
+
+from src.errors.handlers import log_error
+
+
+@pytest.mark.parametrize("level", ["exception", "WARNING", "unknown"])
+def test_log_error_accepts_any_level(level):
+    try:
+        raise ValueError("boom")
+    except ValueError as e:
+        log_error(e, level=level)
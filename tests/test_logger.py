@@ -0,0 +1,34 @@
+"""
+Tests for the structured logging setup.
+"""
+import json
+import logging
+
+from src.config.config import bootstrap, config
+from src.logging.logger import configure_logging, get_logger
+
+
+def test_logger_created_before_bootstrap_follows_new_config(monkeypatch, caplog):
+    logger = get_logger("tests.before_bootstrap")
+    logger.info("before")
+    
+    monkeypatch.setenv("GLUE_ETL_LOGGING_FORMAT", "console")
+    monkeypatch.setenv("GLUE_ETL_ENVIRONMENT", "staging")
+    try:
+        bootstrap()
+        with caplog.at_level(logging.INFO):
+            logger.info("after")
+        
+        message = caplog.records[-1].getMessage()
+        assert "after" in message
+        assert "staging" in message
+        assert not message.startswith("{")
+    finally:
+        monkeypatch.delenv("GLUE_ETL_LOGGING_FORMAT")
+        monkeypatch.delenv("GLUE_ETL_ENVIRONMENT")
+        config.load_config()
+        configure_logging()
+    
+    with caplog.at_level(logging.INFO):
+        logger.info("restored")
+    assert json.loads(caplog.records[-1].getMessage())["event"] == "restored"
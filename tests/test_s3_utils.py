@@ -0,0 +1,128 @@
+"""
+Tests for the S3 utilities.
+"""
+import asyncio
+import io
+
+import pandas as pd
+import pytest
+
+from src.utils import s3_utils
+
+
+class FakeS3Client:
+    """Minimal stand-in for the S3 client, serving objects from a dictionary."""
+    
+    def __init__(self, objects):
+        self.objects = objects
+    
+    def get_object(self, Bucket, Key, **kwargs):
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+    
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[(Bucket, Key)] = Body.read()
+        return {"ETag": '"put"', "VersionId": "v1"}
+    
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+        self.objects[(Bucket, Key)] = Fileobj.read()
+    
+    def head_object(self, Bucket, Key, **kwargs):
+        return {"ETag": '"multipart-2"', "VersionId": "v2", "ContentLength": len(self.objects[(Bucket, Key)])}
+
+
+@pytest.fixture
+def s3_objects(monkeypatch):
+    """Serve get_object calls from a dictionary of (bucket, key) -> bytes."""
+    objects = {}
+    monkeypatch.setattr(s3_utils, "get_s3_client", lambda: FakeS3Client(objects))
+    return objects
+
+
+def test_read_csv_matches_pandas_by_default(s3_objects):
+    data = b"id,day,at,note\n1,2024-01-01,2024-01-01 10:00:00,\n2,2024-01-02,2024-01-02 11:30:00,x\n"
+    s3_objects[("bucket", "dates.csv")] = data
+    
+    result = s3_utils.read_csv("dates.csv", "bucket")
+    
+    pd.testing.assert_frame_equal(result, pd.read_csv(io.BytesIO(data)))
+
+
+def test_read_csv_arrow_reader_matches_pandas(s3_objects):
+    data = b"id,amount,name,note\n1,1.5,a,\n2,,b,NA\n3,2.0,,x\n"
+    s3_objects[("bucket", "plain.csv")] = data
+    
+    result = s3_utils.read_csv("plain.csv", "bucket", use_arrow=True)
+    expected = pd.read_csv(io.BytesIO(data))
+    
+    assert list(result.columns) == list(expected.columns)
+    assert result.isna().equals(expected.isna())
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+class FakeAsyncBody:
+    """Minimal stand-in for an aiobotocore streaming body."""
+    
+    def __init__(self, data):
+        self.data = data
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def read(self):
+        return self.data
+
+
+class FakeAsyncS3Client:
+    """Minimal stand-in for the aioboto3 S3 client."""
+    
+    def __init__(self, data, content_encoding=None):
+        self.data = data
+        self.content_encoding = content_encoding
+    
+    async def get_object(self, Bucket, Key, **kwargs):
+        response = {"Body": FakeAsyncBody(self.data)}
+        if self.content_encoding:
+            response["ContentEncoding"] = self.content_encoding
+        return response
+
+
+def test_read_object_async_decompresses_zstd():
+    zstandard = pytest.importorskip("zstandard")
+    data = b'{"id": 1}\n' * 100
+    s3 = FakeAsyncS3Client(zstandard.ZstdCompressor().compress(data), content_encoding="zstd")
+    
+    assert asyncio.run(s3_utils.read_object_async("key.json", "bucket", s3)) == data
+
+
+def test_read_object_async_returns_plain_bytes():
+    s3 = FakeAsyncS3Client(b"plain")
+    
+    assert asyncio.run(s3_utils.read_object_async("key.txt", "bucket", s3)) == b"plain"
+
+
+def test_write_object_returns_put_response(s3_objects):
+    response = s3_utils.write_object("small.txt", b"data", "bucket")
+    
+    assert response["ETag"] == '"put"'
+    assert response["VersionId"] == "v1"
+    assert s3_objects[("bucket", "small.txt")] == b"data"
+
+
+def test_write_object_returns_head_response_after_multipart_upload(s3_objects, monkeypatch):
+    monkeypatch.setattr(s3_utils, "UPLOAD_PART_SIZE", 4)
+    
+    response = s3_utils.write_object("large.txt", b"more than one part", "bucket")
+    
+    assert response["ETag"] == '"multipart-2"'
+    assert response["VersionId"] == "v2"
+    assert s3_objects[("bucket", "large.txt")] == b"more than one part"
+
+
+def test_write_csv_and_parquet_return_responses(s3_objects):
+    df = pd.DataFrame({"id": [1, 2]})
+    
+    assert s3_utils.write_csv(df, "data.csv", "bucket", index=False)["ETag"] == '"put"'
+    assert s3_utils.write_parquet(df, "data.parquet", "bucket")["ETag"] == '"put"'
@@ -0,0 +1,114 @@
+"""
+Tests for the Silver layer table utilities.
+"""
+import pyarrow as pa
+import pytest
+
+from src.errors import ValidationError
+from src.utils import s3tables_utils
+
+
+def read_rows(table_name):
+    """Read a table as a list of row dictionaries, ordered by id and then v."""
+    rows = s3tables_utils.read_from_table(table_name, as_arrow=True).to_pylist()
+    return sorted(rows, key=lambda row: (row["id"], str(row.get("v"))))
+
+
+def test_merge_then_read_resolves_delta(local_silver):
+    s3tables_utils.write_to_table("dest", pa.table({"id": [1, 2], "v": ["a", "b"]}))
+    s3tables_utils.write_to_table("src", pa.table({"id": [2, 3], "v": ["B", "C"]}))
+    
+    s3tables_utils.merge_tables("src", "dest", ["id"])
+    
+    assert read_rows("dest") == [
+        {"id": 1, "v": "a"},
+        {"id": 2, "v": "B"},
+        {"id": 3, "v": "C"},
+    ]
+
+
+def test_append_after_merge_keeps_appended_rows(local_silver):
+    s3tables_utils.write_to_table("dest", pa.table({"id": [1], "v": ["a"]}))
+    s3tables_utils.write_to_table("src", pa.table({"id": [2], "v": ["merged"]}))
+    s3tables_utils.merge_tables("src", "dest", ["id"])
+    
+    s3tables_utils.write_to_table("dest", pa.table({"id": [2], "v": ["appended later"]}), mode="append")
+    
+    assert read_rows("dest") == [
+        {"id": 1, "v": "a"},
+        {"id": 2, "v": "appended later"},
+        {"id": 2, "v": "merged"},
+    ]
+    assert not s3tables_utils._delta_files(s3tables_utils.get_table_path("dest"))
+
+
+def test_write_batches_after_merge_keeps_appended_rows(local_silver):
+    s3tables_utils.write_to_table("dest", pa.table({"id": [1], "v": ["a"]}))
+    s3tables_utils.write_to_table("src", pa.table({"id": [1], "v": ["merged"]}))
+    s3tables_utils.merge_tables("src", "dest", ["id"])
+    
+    s3tables_utils.write_batches("dest", [pa.table({"id": [1], "v": ["appended later"]})])
+    
+    assert sorted(row["v"] for row in read_rows("dest")) == ["appended later", "merged"]
+
+
+def test_merge_rejects_missing_join_column(local_silver):
+    s3tables_utils.write_to_table("dest", pa.table({"id": [1], "v": ["a"]}))
+    s3tables_utils.write_to_table("src", pa.table({"key": [1], "v": ["b"]}))
+    
+    with pytest.raises(ValidationError):
+        s3tables_utils.merge_tables("src", "dest", ["key"])
+    
+    assert not s3tables_utils._delta_files(s3tables_utils.get_table_path("dest"))
+
+
+def test_merge_rejects_incompatible_key_type(local_silver):
+    s3tables_utils.write_to_table("dest", pa.table({"id": [1], "v": ["a"]}))
+    s3tables_utils.write_to_table("src", pa.table({"id": ["not a number"], "v": ["b"]}))
+    
+    with pytest.raises(ValidationError):
+        s3tables_utils.merge_tables("src", "dest", ["id"])
+
+
+def test_compaction_keeps_table_partitioning(local_silver):
+    s3tables_utils.write_to_table("dest", pa.table({"id": [1, 2], "p": [1, 2]}), partition_cols=["p"])
+    s3tables_utils.write_to_table("src", pa.table({"id": [3], "p": [1]}))
+    s3tables_utils.merge_tables("src", "dest", ["id"])
+    
+    s3tables_utils.compact_table("dest")
+    
+    assert sorted(partition["p"] for partition in s3tables_utils.get_table_partitions("dest")) == ["1", "2"]
+    assert [row["id"] for row in read_rows("dest")] == [1, 2, 3]
+
+
+def test_merge_into_partition_key_and_list_columns(local_silver):
+    dest = pa.table({"p": [1, 2], "id": [1, 1], "tags": [[1], [2]], "info": [{"n": "a"}, {"n": "b"}]})
+    source = pa.table({"p": [2, 3], "id": [1, 1], "tags": [[20], [30]], "info": [{"n": "B"}, {"n": "C"}]})
+    s3tables_utils.write_to_table("dest", dest, partition_cols=["p"])
+    s3tables_utils.write_to_table("src", source)
+    
+    s3tables_utils.merge_tables("src", "dest", ["p", "id"])
+    
+    rows = sorted(s3tables_utils.read_from_table("dest", as_arrow=True).to_pylist(), key=lambda row: row["p"])
+    assert [(row["p"], row["tags"], row["info"]["n"]) for row in rows] == [
+        (1, [1], "a"),
+        (2, [20], "B"),
+        (3, [30], "C"),
+    ]
+    
+    s3tables_utils.compact_table("dest")
+    assert s3tables_utils.read_from_table("dest", as_arrow=True).num_rows == 3
+
+
+def test_merge_arrow_casts_source_keys_to_destination_types():
+    dest = pa.table({"p": pa.array([1, 2], pa.int32()), "tags": [[1], [2]]})
+    source = pa.table({"p": pa.array([2, 2, 3], pa.int64()), "tags": [[20], [21], [30]]})
+    
+    merged = s3tables_utils._merge_arrow(dest, source, ["p"], ["tags"])
+    
+    assert merged.schema.field("p").type == pa.int32()
+    assert merged.to_pylist() == [
+        {"p": 1, "tags": [1]},
+        {"p": 2, "tags": [21]},
+        {"p": 3, "tags": [30]},
+    ]